@@ -7,11 +7,13 @@ from collections.abc import Generator
 StrPair = dict[str, str]
 StrTuple = tuple[str, str]
 Strs = list[str]
+StrSet = set[str]
 IntStrPair = dict[int, str]
 
 StrsPair = dict[str, Strs]
 StrPair2 = dict[str, StrPair]
 Strs2 = list[Strs]
+StrSetPair = dict[str, StrSet]
 
 StrGene = Generator[str]
 Strs3 = list[Strs2]
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+"""User defined types about type "DirEntry"."""
+
+from collections.abc import Callable, Generator
+from os import DirEntry
+
+Entry = DirEntry[str]
+EntryGene = Generator[Entry]
+Entries = list[Entry]
+EntryBoolFunc = Callable[[Entry], bool]
@@ -8,6 +8,7 @@ from pathlib import Path
 PathGene = Generator[Path]
 PathPair = dict[str, Path]
 Paths = list[Path]
+PathSet = set[Path]
 PathFunc = Callable[[Path], None]
 PathBoolFunc = Callable[[Path], bool]
 
@@ -2,11 +2,23 @@
 
 """User defined types about type "datetime"."""
 
+from array import array
 from datetime import datetime
+from pathlib import Path
+from typing import TypedDict
 
 Times = list[datetime]
 TimePair = dict[str, datetime]
+StampTime = tuple[int | None, int | None]
+StampPair = dict[str, StampTime]
 
 Times2 = list[Times]
 
 TimePair2 = dict[str, TimePair]
+
+
+class LatestArray(TypedDict):
+    """Paths and their latest date time as nanosecond epoch."""
+
+    paths: list[Path]
+    times: array[int]
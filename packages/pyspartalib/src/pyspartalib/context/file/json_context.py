@@ -4,6 +4,7 @@
 
 from decimal import Decimal
 from pathlib import Path
+from typing import TypedDict
 
 from pyspartalib.context.default.bool_context import (
     BoolPair,
@@ -57,3 +58,15 @@ SinglePair = dict[str, Single]
 Jsons = list[Json]
 Singles2 = list[Singles]
 SinglePair2 = dict[str, SinglePair]
+
+
+class PartitionPair2(TypedDict):
+    """Class to represent 2 dimensional dictionaries divided by each type.
+
+    Each value is same as the result of function like "bool_pair2_from_json".
+    """
+
+    boolean: BoolPair2
+    integer: IntPair2
+    string: StrPair2
+    path: PathPair2
@@ -2,22 +2,39 @@
 
 """Module to compress file or directory by archive format."""
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
+from lzma import compress
 from pathlib import Path
-from zipfile import ZIP_LZMA, ZIP_STORED, ZipFile, ZipInfo
+from shutil import copyfileobj, rmtree
+from tempfile import mkdtemp
+from typing import IO, NoReturn
+from zipfile import ZIP64_LIMIT, ZIP_LZMA, ZIP_STORED, ZipFile, ZipInfo
 
-from pyspartalib.context.default.integer_context import Ints
+from pyspartalib.context.custom.type_context import Type
 from pyspartalib.context.default.string_context import StrPair, Strs
-from pyspartalib.context.extension.path_context import Paths
+from pyspartalib.context.extension.path_context import (
+    PathBoolFunc,
+    Paths,
+    PathSet,
+)
 from pyspartalib.script.decimal.initialize_decimal import initialize_decimal
 from pyspartalib.script.directory.create_directory import create_directory
 from pyspartalib.script.file.archive.archive_format import rename_format
-from pyspartalib.script.file.archive.context.archive_context import Archives
+from pyspartalib.script.file.archive.context.archive_context import (
+    ArchiveEntries,
+    ArchiveEntries2,
+    ArchiveEntry,
+    Archives,
+)
+from pyspartalib.script.file.archive.copy_archive import copy_member
+from pyspartalib.script.file.archive.index_archive import create_index
 from pyspartalib.script.file.json.convert_to_json import multiple_to_json
 from pyspartalib.script.file.json.export_json import json_dump
-from pyspartalib.script.file.text.import_file import byte_import
-from pyspartalib.script.path.iterate_directory import walk_iterator
+from pyspartalib.script.inherit.inherit_with import InheritWith
+from pyspartalib.script.path.iterate_directory import walk_entries
 from pyspartalib.script.path.modify.current.get_relative import (
     get_relative,
     is_relative,
@@ -30,13 +47,25 @@ from pyspartalib.script.time.stamp.current_datetime import get_current_time
 initialize_decimal()
 
 
-class CompressArchive:
+def _raise_error(message: str) -> NoReturn:
+    raise ValueError(message)
+
+
+def _none_error(result: Type | None, message: str) -> Type:
+    if result is None:
+        _raise_error(message)
+
+    return result
+
+
+class CompressArchive(InheritWith):
     """Class to compress file or directory by archive format."""
 
     def _init_variables(self, output_root: Path, compress: bool) -> None:
         self._output_root: Path = output_root
         self._compress: bool = compress
         self._archive_file: ZipFile | None = None
+        self._closed: bool = False
 
     def _get_archive_file(self) -> ZipFile | None:
         return self._archive_file
@@ -52,6 +81,42 @@ class CompressArchive:
 
         self._limit_byte: Decimal = Decimal(str(byte))
 
+    def _init_chunk_byte(self, byte: int) -> None:
+        if byte == 0:
+            byte = 2**20  # 1MB
+
+        self._chunk_byte: int = byte
+
+    def _init_index(self, index: bool) -> None:
+        self._index: bool = index
+
+    def _init_plan(self, plan: bool) -> None:
+        self._plan: bool = plan
+        self._planned: ArchiveEntries = []
+
+    def _init_parallel(self, parallel: int) -> None:
+        self._parallel: int = parallel
+        self._executor: ThreadPoolExecutor | None = None
+        self._temporary_root: Path | None = None
+        self._temporary_index: int = 0
+        self._pending: deque[tuple[Path, Path, Future[Path] | None]] = deque()
+        self._pending_limit: int = parallel * 2
+
+    def _is_parallel(self) -> bool:
+        return self._parallel > 0
+
+    def _get_executor(self) -> ThreadPoolExecutor | None:
+        if self._executor is None and self._is_parallel():
+            self._executor = ThreadPoolExecutor(max_workers=self._parallel)
+
+        return self._executor
+
+    def _get_temporary_root(self) -> Path:
+        if self._temporary_root is None:
+            self._temporary_root = Path(mkdtemp())
+
+        return self._temporary_root
+
     def _init_archive_id(self, archive_id: str | None) -> None:
         if archive_id is None:
             archive_id = self._output_root.name
@@ -59,8 +124,8 @@ class CompressArchive:
         self._archive_id = archive_id
 
     def _init_walk_history(self) -> None:
-        self._walk_directories: Paths = []
-        self._walk_files: Paths = []
+        self._walk_directories: PathSet = set()
+        self._walk_files: PathSet = set()
         self._archived: Paths = []
 
     def _init_archive_output(self) -> None:
@@ -81,9 +146,20 @@ class CompressArchive:
         return rename_format(Path(self._output_root, "#".join(file_names)))
 
     def _reset_archive_byte(self) -> None:
+        self._close_archive()
+
         self._archived += [self._get_archive_path()]
         self._archive_file = ZipFile(self._archived[-1], mode="w")
 
+        self._inside_byte: int = 0
+        self._outside_byte: int = 0
+
+    def _count_archive_byte(self, information: ZipInfo) -> None:
+        self._inside_byte += information.file_size
+        self._outside_byte += (
+            len(information.FileHeader()) + information.compress_size
+        )
+
     def _convert_comment(self, attribute: StrPair) -> bytes:
         comment: str = json_dump(multiple_to_json(attribute), compress=True)
         return set_encoding(comment)
@@ -115,6 +191,7 @@ class CompressArchive:
         information: ZipInfo = ZipInfo(filename=str(relative))
 
         information.compress_type = ZIP_LZMA if self._compress else ZIP_STORED
+        information.file_size = get_file_size(target)
         latest: datetime = self._get_archive_timestamp(target)
 
         self._store_timestamp(latest, information)
@@ -122,22 +199,57 @@ class CompressArchive:
 
         return information
 
-    def _make_directory(self, path: Path) -> None:
-        if archive_file := self._get_archive_file():
-            archive_file.mkdir(str(path))
+    def _get_directory_information(
+        self,
+        target: Path,
+        relative: Path,
+    ) -> ZipInfo:
+        information: ZipInfo = ZipInfo(filename=str(relative) + "/")
+
+        information.external_attr = (0o40777 << 16) | 0x10  # Directory.
+        information.CRC = 0
+        information.compress_size = 0
+        latest: datetime = self._get_archive_timestamp(target)
+
+        self._store_timestamp(latest, information)
+        information.comment = self._store_timestamp_detail(latest)
+
+        return information
 
-    def _write_string(self, path: Path, target_path: Path) -> None:
+    def _make_directory(self, path: Path, target_path: Path) -> None:
         if archive_file := self._get_archive_file():
-            archive_file.writestr(
-                self._get_archive_information(target_path, path),
-                byte_import(target_path),
+            archive_file.mkdir(
+                self._get_directory_information(target_path, path),
             )
 
-    def _get_information_list(self) -> Archives:
+    def _require_zip64(self, information: ZipInfo) -> bool:
+        return information.file_size * 2 > ZIP64_LIMIT  # Allow file growth.
+
+    def _copy_stream(
+        self,
+        archive_file: ZipFile,
+        information: ZipInfo,
+        target_path: Path,
+    ) -> None:
+        with (
+            target_path.open("rb") as source,
+            archive_file.open(
+                information,
+                mode="w",
+                force_zip64=self._require_zip64(information),
+            ) as destination,
+        ):
+            copyfileobj(source, destination, length=self._chunk_byte)
+
+    def _write_stream(self, path: Path, target_path: Path) -> None:
         if archive_file := self._get_archive_file():
-            return archive_file.infolist()
+            information: ZipInfo = self._get_archive_information(
+                target_path,
+                path,
+            )
 
-        return []
+            self._copy_stream(archive_file, information, target_path)
+            self._count_archive_byte(information)
 
     def _close_archive(self) -> None:
         if archive_file := self._get_archive_file():
@@ -156,27 +268,24 @@ class CompressArchive:
         relative: Path = get_relative(target, root_path=root)
 
         if is_dir:
-            self._make_directory(relative)
+            self._make_directory(relative, target)
         else:
-            self._write_string(relative, target)
+            self._write_stream(relative, target)
 
     def _within_allowance(self, target_byte: Decimal) -> bool:
         return self._limit_byte >= target_byte
 
+    def _to_decimal(self, byte: int) -> Decimal:
+        return Decimal(str(byte))
+
     def _get_decimal_size(self, path: Path) -> Decimal:
-        return Decimal(str(get_file_size(path)))
+        return self._to_decimal(get_file_size(path))
 
     def _archive_outside_byte(self) -> Decimal:
-        return self._get_decimal_size(self._archived[-1])
-
-    def _get_file_size(self) -> Ints:
-        return [
-            information.file_size
-            for information in self._get_information_list()
-        ]
+        return self._to_decimal(self._outside_byte)
 
     def _archive_inside_byte(self) -> Decimal:
-        return Decimal(str(sum(self._get_file_size())))
+        return self._to_decimal(self._inside_byte)
 
     def _archive_include_files(self) -> bool:
         return self._archive_inside_byte() > 0
@@ -191,52 +300,360 @@ class CompressArchive:
         outside_byte: Decimal = self._archive_outside_byte()
         return source_byte + outside_byte
 
+    def _need_archive_reset(self, source_byte: Decimal) -> bool:
+        if not self._has_archived():
+            return True
+
+        include_files: bool = self._archive_include_files()
+
+        if self._within_allowance(source_byte):
+            return include_files and (
+                not self._within_allowance(
+                    self._estimate_archived_size(source_byte),
+                )
+            )
+
+        return include_files
+
     def _update_archive_byte(self, target: Path, root: Path) -> None:
-        archive_reset: bool = False
+        source_byte: Decimal = self._get_decimal_size(target)
 
-        if self._has_archived():
-            source_byte: Decimal = self._get_decimal_size(target)
-            include_files: bool = self._archive_include_files()
+        if self._archive_include_files():
+            source_byte = self._estimate_compressed_size(source_byte)
 
-            if include_files:
-                source_byte = self._estimate_compressed_size(source_byte)
+        self._add_file_to_archive(
+            False,
+            self._need_archive_reset(source_byte),
+            target,
+            root,
+        )
 
-            if self._within_allowance(source_byte):
-                if include_files and (
-                    not self._within_allowance(
-                        self._estimate_archived_size(source_byte),
-                    )
-                ):
-                    archive_reset = True
-            elif include_files:
-                archive_reset = True
+    def _get_member_byte(self, information: ZipInfo) -> Decimal:
+        return self._to_decimal(
+            len(information.FileHeader()) + information.compress_size,
+        )
+
+    def _copy_archived(self, source: IO[bytes], information: ZipInfo) -> None:
+        if self._need_archive_reset(self._get_member_byte(information)):
+            self._reset_archive_byte()
+
+        if archive_file := self._get_archive_file():
+            self._count_archive_byte(
+                copy_member(
+                    source,
+                    information,
+                    archive_file,
+                    chunk_byte=self._chunk_byte,
+                ),
+            )
+
+    def _copy_or_plan(
+        self,
+        source_archive: Path,
+        source: IO[bytes],
+        information: ZipInfo,
+        target: Path,
+        relative: Path,
+    ) -> None:
+        if self._plan:
+            self._add_copied(source_archive, information, target, relative)
+        else:
+            self._copy_archived(source, information)
+
+    def _copy_temporary(self, temporary_path: Path) -> None:
+        with (
+            ZipFile(temporary_path) as temporary_file,
+            temporary_path.open("rb") as source,
+        ):
+            self._copy_archived(source, temporary_file.infolist()[0])
+
+        temporary_path.unlink()
+
+    def _compress_temporary(
+        self,
+        temporary_path: Path,
+        target: Path,
+        relative: Path,
+    ) -> Path:
+        with ZipFile(temporary_path, mode="w") as archive_file:
+            self._copy_stream(
+                archive_file,
+                self._get_archive_information(target, relative),
+                target,
+            )
+
+        return temporary_path
+
+    def _get_temporary_path(self) -> Path:
+        self._temporary_index += 1
+
+        return rename_format(
+            Path(self._get_temporary_root(), str(self._temporary_index)),
+        )
+
+    def _submit_temporary(
+        self,
+        executor: ThreadPoolExecutor,
+        target: Path,
+        root: Path,
+    ) -> Future[Path]:
+        return executor.submit(
+            self._compress_temporary,
+            self._get_temporary_path(),
+            target,
+            get_relative(target, root_path=root),
+        )
+
+    def _write_pending(
+        self,
+        target: Path,
+        root: Path,
+        future: Future[Path] | None,
+    ) -> None:
+        if future is None:
+            self._archive_directory(target, root)
         else:
-            archive_reset = True
+            self._copy_temporary(future.result())
 
-        self._add_file_to_archive(False, archive_reset, target, root)
+    def _flush_pending(self, limit: int) -> None:
+        while len(self._pending) > limit:
+            self._write_pending(*self._pending.popleft())
+
+    def _push_pending(
+        self,
+        target: Path,
+        root: Path,
+        future: Future[Path] | None,
+    ) -> None:
+        self._pending.append((target, root, future))
+        self._flush_pending(self._pending_limit)
+
+    def _release_parallel(self, wait: bool) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+
+        if self._temporary_root is not None:
+            rmtree(str(self._temporary_root), ignore_errors=not wait)
+            self._temporary_root = None
+
+    def _finalize_parallel(self) -> None:
+        self._flush_pending(0)
+        self._release_parallel(True)
 
     def _not_still_archived(self, is_dir: bool, target: Path) -> bool:
-        archived: Paths = (
+        archived: PathSet = (
             self._walk_directories if is_dir else self._walk_files
         )
 
         not_still: bool = target not in archived
 
         if not_still:
-            archived += [target]
+            archived.add(target)
 
         return not_still
 
-    def _compress_child(self, target: Path, root: Path) -> None:
+    def _add_plan(self, target: Path, root: Path, byte: int | None) -> None:
+        self._planned += [
+            {
+                "target": target,
+                "relative": get_relative(target, root_path=root),
+                "byte": byte,
+                "source": None,
+            },
+        ]
+
+    def _add_copied(
+        self,
+        source_archive: Path,
+        information: ZipInfo,
+        target: Path,
+        relative: Path,
+    ) -> None:
+        self._planned += [
+            {
+                "target": target,
+                "relative": relative,
+                "byte": None
+                if information.is_dir()
+                else information.compress_size,
+                "source": (source_archive, information),
+            },
+        ]
+
+    def _read_sample(self) -> bytes:
+        sample: bytes = b""
+
+        for entry in self._planned:
+            if len(sample) >= self._chunk_byte:
+                break
+
+            if (entry["byte"] is not None) and (entry["source"] is None):
+                with entry["target"].open("rb") as file:
+                    sample += file.read(self._chunk_byte - len(sample))
+
+        return sample
+
+    def _observe_ratio(self) -> Decimal:
+        if not self._compress:
+            return Decimal("1")
+
+        if len(sample := self._read_sample()) == 0:
+            return Decimal("1")
+
+        return self._to_decimal(len(compress(sample))) / self._to_decimal(
+            len(sample),
+        )
+
+    def _split_plan(self, ratio: Decimal) -> ArchiveEntries2:
+        volumes: ArchiveEntries2 = [[]]
+        volume_byte: Decimal = Decimal("0")
+
+        for entry in self._planned:
+            if (byte := entry["byte"]) is not None:
+                source_byte: Decimal = self._to_decimal(byte)
+
+                if entry["source"] is None:
+                    source_byte *= ratio
+
+                if (volume_byte > 0) and (
+                    not self._within_allowance(volume_byte + source_byte)
+                ):
+                    volumes += [[]]
+                    volume_byte = Decimal("0")
+
+                volume_byte += source_byte
+
+            volumes[-1] += [entry]
+
+        return volumes
+
+    def _write_copied(
+        self,
+        archive_file: ZipFile,
+        source_archive: Path,
+        information: ZipInfo,
+    ) -> None:
+        with source_archive.open("rb") as source:
+            copy_member(
+                source,
+                information,
+                archive_file,
+                chunk_byte=self._chunk_byte,
+            )
+
+    def _write_entry(self, archive_file: ZipFile, entry: ArchiveEntry) -> None:
+        if (source := entry["source"]) is not None:
+            self._write_copied(archive_file, *source)
+        elif entry["byte"] is None:
+            archive_file.mkdir(
+                self._get_directory_information(
+                    entry["target"],
+                    entry["relative"],
+                ),
+            )
+        else:
+            self._copy_stream(
+                archive_file,
+                self._get_archive_information(
+                    entry["target"],
+                    entry["relative"],
+                ),
+                entry["target"],
+            )
+
+    def _write_volume(
+        self,
+        archive_file: ZipFile,
+        entries: ArchiveEntries,
+    ) -> None:
+        with archive_file:
+            for entry in entries:
+                self._write_entry(archive_file, entry)
+
+    def _open_volume(self) -> ZipFile:
+        self._archived += [self._get_archive_path()]
+        return ZipFile(self._archived[-1], mode="w")
+
+    def _open_volumes(self, volumes: ArchiveEntries2) -> list[ZipFile]:
+        return [_none_error(self._get_archive_file(), "plan")] + [
+            self._open_volume() for _ in volumes[1:]
+        ]
+
+    def _write_volumes(self, volumes: ArchiveEntries2) -> None:
+        archive_files: list[ZipFile] = self._open_volumes(volumes)
+
+        if executor := self._get_executor():
+            list(executor.map(self._write_volume, archive_files, volumes))
+        else:
+            for archive_file, entries in zip(
+                archive_files,
+                volumes,
+                strict=True,
+            ):
+                self._write_volume(archive_file, entries)
+
+    def _finalize_plan(self) -> None:
+        if len(self._planned) == 0:
+            return
+
+        self._write_volumes(self._split_plan(self._observe_ratio()))
+        self._planned.clear()
+
+    def _archive_directory(self, target: Path, root: Path) -> None:
+        archive_reset: bool = not self._has_archived()
+        self._add_file_to_archive(True, archive_reset, target, root)
+
+    def _compress_directory(self, target: Path, root: Path) -> None:
+        if self._plan:
+            self._add_plan(target, root, None)
+        elif not self._is_parallel():
+            self._archive_directory(target, root)
+        else:
+            self._push_pending(target, root, None)
+
+    def _compress_file(self, target: Path, root: Path) -> None:
+        if self._plan:
+            self._add_plan(target, root, get_file_size(target))
+        elif executor := self._get_executor():
+            self._push_pending(
+                target,
+                root,
+                self._submit_temporary(executor, target, root),
+            )
+        else:
+            self._update_archive_byte(target, root)
+
+    def _compress_entry(self, target: Path, root: Path, is_dir: bool) -> None:
+        if self._not_still_archived(is_dir, target):
+            if is_dir:
+                self._compress_directory(target, root)
+            else:
+                self._compress_file(target, root)
+
+    def _compress_child(
+        self,
+        target: Path,
+        root: Path,
+        prune: PathBoolFunc | None,
+        exclude: Strs | None,
+    ) -> None:
         if target.is_dir():
             if self._not_still_archived(True, target):
-                archive_reset: bool = not self._has_archived()
-                self._add_file_to_archive(True, archive_reset, target, root)
+                self._compress_directory(target, root)
 
-                for path in walk_iterator(target):
-                    self._compress_child(path, root)
+                for entry in walk_entries(
+                    target,
+                    prune=prune,
+                    exclude=exclude,
+                ):
+                    self._compress_entry(
+                        Path(entry.path),
+                        root,
+                        entry.is_dir(),
+                    )
         elif self._not_still_archived(False, target):
-            self._update_archive_byte(target, root)
+            self._compress_file(target, root)
 
     def close_archived(self) -> Paths:
         """Close archive and return archived list.
@@ -256,14 +673,89 @@ class CompressArchive:
                     <export directory>/<archive name>#0002.<archive format>
                 ]
 
+        Archive is closed only once,
+            so calling this method again returns same list.
+
         """
+        if self._closed:
+            return self._archived
+
+        self._finalize_plan()
+        self._finalize_parallel()
         self._close_archive()
+
+        if self._index:
+            create_index(self._archived)
+
+        self._closed = True
+
         return self._archived
 
+    def copy_archived(
+        self,
+        source_archive: Path,
+        informations: Archives,
+        archive_root: Path,
+        relative_paths: Paths | None = None,
+    ) -> None:
+        """Copy members of other archive without recompression.
+
+        Args:
+            source_archive (Path): Path of archive including the members.
+
+            informations (Archives): Information of members you want to copy.
+                They must be gotten from the archive "source_archive".
+
+            archive_root (Path): Root directory where the members are placed
+                if the archive "source_archive" is decompressed.
+
+            relative_paths (Paths | None, optional): Defaults to None.
+                Relative path of each member from "archive_root"
+                    if it's different from name of the member,
+                    like name converted by class "DecompressArchive".
+
+        Path of each member joined to "archive_root" is treated as archived.
+        So it isn't compressed again even if you select it
+            by method "compress_archive" after copying.
+
+        If argument "plan" of the constructor is True,
+            the members are listed in the plan like files you add,
+            and copied when you close archive.
+        Size of their compressed data is counted for dividing archives,
+            so the source archive must be left until you close archive.
+
+        """
+        self._flush_pending(0)
+
+        if relative_paths is None:
+            relative_paths = [
+                Path(information.filename) for information in informations
+            ]
+
+        with source_archive.open("rb") as source:
+            for information, relative_path in zip(
+                informations,
+                relative_paths,
+                strict=True,
+            ):
+                if self._not_still_archived(
+                    information.is_dir(),
+                    Path(archive_root, relative_path),
+                ):
+                    self._copy_or_plan(
+                        source_archive,
+                        source,
+                        information,
+                        Path(archive_root, relative_path),
+                        relative_path,
+                    )
+
     def compress_archive(
         self,
         archive_target: Path,
         archive_root: Path | None = None,
+        prune: PathBoolFunc | None = None,
+        exclude: Strs | None = None,
     ) -> None:
         """Compress file or directory you selected.
 
@@ -290,20 +782,29 @@ class CompressArchive:
                 |--type/
                     |--file2.txt
 
+            prune (PathBoolFunc | None, optional): Defaults to None.
+                It's used for argument "prune" of function "walk_iterator".
+
+            exclude (Strs | None, optional): Defaults to None.
+                It's used for argument "exclude" of function "walk_iterator".
+                Pattern is matched with relative path from "archive_target".
+
         """
         parent_root: Path = archive_target.parent
 
-        if archive_root is None:
-            self._compress_child(archive_target, parent_root)
-        elif is_relative(archive_target, root_path=archive_root):
-            self._compress_child(archive_target, archive_root)
-        else:
-            self._compress_child(archive_target, parent_root)
+        if (archive_root is None) or (
+            not is_relative(archive_target, root_path=archive_root)
+        ):
+            archive_root = parent_root
+
+        self._compress_child(archive_target, archive_root, prune, exclude)
 
     def compress_at_once(
         self,
         paths: Paths,
         archive_root: Path | None = None,
+        prune: PathBoolFunc | None = None,
+        exclude: Strs | None = None,
     ) -> None:
         """Compress list of file or directory at once.
 
@@ -316,9 +817,32 @@ class CompressArchive:
                 It's used for argument "archive_root"
                     of method "compress_archive".
 
+            prune (PathBoolFunc | None, optional): Defaults to None.
+                It's used for argument "prune"
+                    of method "compress_archive".
+
+            exclude (Strs | None, optional): Defaults to None.
+                It's used for argument "exclude"
+                    of method "compress_archive".
+
         """
         for path in paths:
-            self.compress_archive(path, archive_root=archive_root)
+            self.compress_archive(
+                path,
+                archive_root=archive_root,
+                prune=prune,
+                exclude=exclude,
+            )
+
+    def exit(self) -> None:
+        """Close archive when leaving from With statement."""
+        self.close_archived()
+
+    def __del__(self) -> None:
+        """Release threads, temporary directory, and archive if still open."""
+        if not self._closed:
+            self._release_parallel(False)
+            self._close_archive()
 
     def __init__(
         self,
@@ -326,6 +850,10 @@ class CompressArchive:
         archive_id: str | None = None,
         limit_byte: int = 0,
         compress: bool = False,
+        chunk_byte: int = 0,
+        parallel: int = 0,
+        plan: bool = False,
+        index: bool = False,
     ) -> None:
         """Initialize compress conditions and exporting directory.
 
@@ -387,9 +915,53 @@ class CompressArchive:
                 If it's True, you can compress archive by LZMA format.
                 Default is no compressed.
 
+            chunk_byte (int, optional): Defaults to 0.
+                Size of chunk used for streaming file into archive.
+                The value of "chunk_byte" is represented by byte unit.
+                If it's 0, 1MB is used as chunk size.
+                Memory usage is bounded by the chunk size
+                    regardless of the size of file you compress.
+
+            parallel (int, optional): Defaults to 0.
+                Count of threads which compress files at the same time.
+                If it's 0, files are compressed one by one.
+                Threads and temporary directory are created
+                    when the first file is compressed,
+                    and released when you close archive.
+
+                Each file is compressed to temporary archive by the threads,
+                    then compressed data is copied to archive
+                    without recompression in the order you add files.
+                Archives are divided by the size of compressed data
+                    if argument "limit_byte" is not 0.
+
+                If argument "plan" is True,
+                    each archive is written by the threads instead.
+
+            plan (bool, optional): Defaults to False.
+                If it's True, files are only listed when you add them,
+                    and all archives are written when you close archive.
+
+                Files are divided to archives in the order you add them,
+                    by the size of file and the compression ratio
+                    observed from head of files.
+                So the size of each archive becomes predictable
+                    without checking the size of archive while writing.
+
+            index (bool, optional): Defaults to False.
+                If it's True, index of files and directories inside archives
+                    is created when you close archive.
+                It's placed alongside archives, and used by class
+                    "IndexArchive" to find and decompress single file
+                    without opening other archives.
+
         """
         self._init_variables(output_root, compress)
         self._init_limit_byte(limit_byte)
+        self._init_chunk_byte(chunk_byte)
+        self._init_index(index)
+        self._init_plan(plan)
+        self._init_parallel(parallel)
         self._init_archive_id(archive_id)
         self._init_walk_history()
         self._init_archive_output()
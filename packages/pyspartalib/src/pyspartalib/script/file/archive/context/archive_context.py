@@ -2,6 +2,50 @@
 
 """User defined types about type "zipfile"."""
 
+from datetime import datetime
+from pathlib import Path
+from typing import TypedDict
 from zipfile import ZipInfo
 
 Archives = list[ZipInfo]
+Archives2 = list[Archives]
+ArchivesPair = dict[str, Archives]
+ArchiveMember = tuple[str, ZipInfo]
+ArchiveMembers = list[ArchiveMember]
+ArchiveMemberPair = dict[Path, ArchiveMember]
+ArchiveSource = tuple[Path, ZipInfo]
+
+
+class ArchiveEntry(TypedDict):
+    """Class to represent file or directory which will be archived.
+
+    It's used for planning which archive the path is placed.
+    Size of file is represented by byte unit, and it's None if directory.
+
+    If it's copied from other archive, path of the archive and information
+        of the member are stored to "source", and size of file is
+        represented by size of compressed data.
+    """
+
+    target: Path
+    relative: Path
+    byte: int | None
+    source: ArchiveSource | None
+
+
+ArchiveEntries = list[ArchiveEntry]
+ArchiveEntries2 = list[ArchiveEntries]
+
+
+class ArchiveIndex(TypedDict):
+    """Class to represent where file or directory is placed in archives.
+
+    Sizes and position of file are represented by byte unit.
+    """
+
+    archive: Path
+    offset: int
+    compress_size: int
+    file_size: int
+    crc: int
+    latest: datetime
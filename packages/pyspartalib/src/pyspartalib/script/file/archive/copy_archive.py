@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+"""Module to copy compressed member of archive without recompression."""
+
+from copy import copy
+from typing import IO, NoReturn
+from zipfile import ZipFile, ZipInfo
+
+from pyspartalib.context.custom.type_context import Type
+
+
+def _raise_error(message: str) -> NoReturn:
+    raise ValueError(message)
+
+
+def _none_error(result: Type | None, message: str) -> Type:
+    if result is None:
+        _raise_error(message)
+
+    return result
+
+
+def _get_header_size() -> int:
+    return 30  # Size of local file header without name and extra field.
+
+
+def _get_header_signature() -> bytes:
+    return b"PK\x03\x04"
+
+
+def _get_field_size() -> int:
+    return 4  # Size of identifier and size of extra field.
+
+
+def _to_integer(byte: bytes) -> int:
+    return int.from_bytes(byte, byteorder="little")
+
+
+def _strip_zip64(extra: bytes) -> bytes:
+    fields: list[bytes] = []
+    field_size: int = _get_field_size()
+
+    while len(extra) >= field_size:
+        end: int = field_size + _to_integer(extra[2:field_size])
+
+        if _to_integer(extra[:2]) != 1:  # Zip64 field is created again.
+            fields += [extra[:end]]
+
+        extra = extra[end:]
+
+    return b"".join(fields)
+
+
+def _copy_length(
+    source: IO[bytes],
+    destination: IO[bytes],
+    length: int,
+    chunk_byte: int,
+) -> None:
+    while length > 0:
+        chunk: bytes = source.read(min(length, chunk_byte))
+
+        if len(chunk) == 0:
+            _raise_error("length")
+
+        destination.write(chunk)
+        length -= len(chunk)
+
+
+def _copy_information(information: ZipInfo) -> ZipInfo:
+    copied: ZipInfo = copy(information)
+
+    copied.flag_bits &= ~0x08  # Sizes are written to header directly.
+    copied.extra = _strip_zip64(copied.extra)
+
+    return copied
+
+
+def get_data_offset(source: IO[bytes], information: ZipInfo) -> int:
+    """Get position of compressed data of member inside archive.
+
+    Args:
+        source (IO[bytes]): Binary stream of archive opened by reading mode.
+
+        information (ZipInfo): Information of member you want to find.
+
+    Returns:
+        int: Position of compressed data from head of archive.
+
+    """
+    header_size: int = _get_header_size()
+
+    source.seek(information.header_offset)
+    header: bytes = source.read(header_size)
+
+    if header[:4] != _get_header_signature():
+        _raise_error("header")
+
+    return (
+        information.header_offset
+        + header_size
+        + _to_integer(header[26:28])  # Size of file name.
+        + _to_integer(header[28:30])  # Size of extra field.
+    )
+
+
+def copy_member(
+    source: IO[bytes],
+    information: ZipInfo,
+    archive_file: ZipFile,
+    chunk_byte: int = 2**20,
+) -> ZipInfo:
+    """Copy compressed member of archive to other archive directly.
+
+    Compressed data is copied without decompression and recompression,
+        so the member keeps the compression type, CRC, and sizes.
+
+    Args:
+        source (IO[bytes]): Binary stream of source archive
+            opened by reading mode.
+
+        information (ZipInfo): Information of member you want to copy.
+            It must be gotten from the source archive.
+
+        archive_file (ZipFile): Destination archive opened by writing mode.
+
+        chunk_byte (int, optional): Defaults to 2**20.
+            Size of chunk used for copying compressed data.
+
+    Returns:
+        ZipInfo: Information of member added to destination archive.
+
+    """
+    copied: ZipInfo = _copy_information(information)
+    destination: IO[bytes] = _none_error(archive_file.fp, "write")
+
+    data_offset: int = get_data_offset(source, information)
+
+    destination.seek(archive_file.start_dir)
+    copied.header_offset = destination.tell()
+    destination.write(copied.FileHeader())
+
+    source.seek(data_offset)
+    _copy_length(source, destination, copied.compress_size, chunk_byte)
+
+    archive_file.filelist += [copied]
+    archive_file.NameToInfo[copied.filename] = copied
+    archive_file.start_dir = destination.tell()
+
+    return copied
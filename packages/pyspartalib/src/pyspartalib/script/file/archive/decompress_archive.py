@@ -2,25 +2,36 @@
 
 """Module to decompress file or directory by archive format."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from os import sep
 from pathlib import Path
+from shutil import copyfileobj
+from time import time_ns
 from zipfile import ZIP_LZMA, ZipFile, ZipInfo
 
+from pyspartalib.context.default.integer_context import IntPair
 from pyspartalib.context.default.string_context import StrPair, Strs
-from pyspartalib.context.extension.path_context import Paths
+from pyspartalib.context.extension.path_context import PathBoolFunc, Paths
 from pyspartalib.script.directory.create_directory import create_directory
 from pyspartalib.script.directory.create_parent import create_parent
 from pyspartalib.script.file.archive.archive_format import get_format
+from pyspartalib.script.file.archive.context.archive_context import (
+    Archives,
+    Archives2,
+    ArchivesPair,
+)
 from pyspartalib.script.file.json.convert_from_json import (
     string_pair_from_json,
 )
 from pyspartalib.script.file.json.import_json import json_load
-from pyspartalib.script.file.text.export_file import byte_export
 from pyspartalib.script.path.iterate_directory import walk_iterator
 from pyspartalib.script.string.convert_type import convert_integer
 from pyspartalib.script.string.encoding.set_decoding import set_decoding
-from pyspartalib.script.time.path.set_timestamp import set_latest
+from pyspartalib.script.time.path.set_timestamp import (
+    convert_nanosecond,
+    set_latest_at_once,
+)
 
 
 class DecompressArchive:
@@ -29,6 +40,18 @@ class DecompressArchive:
     def _initialize_paths(self, output_root: Path) -> None:
         self._output_root: Path = output_root
 
+    def _initialize_chunk_byte(self, byte: int) -> None:
+        if byte == 0:
+            byte = 2**20  # 1MB
+
+        self._chunk_byte: int = byte
+
+    def _initialize_parallel(self, parallel: int) -> None:
+        self._parallel: int = parallel
+
+    def _initialize_stamps(self) -> None:
+        self._stamps: IntPair = {}
+
     def _is_sequential_archive(self, path: Path) -> bool:
         names: Strs = path.stem.split("#")
 
@@ -47,26 +70,50 @@ class DecompressArchive:
         archive_file: ZipFile,
     ) -> None:
         create_parent(file_path)
-        byte_export(file_path, archive_file.read(information.filename))
+
+        with (
+            archive_file.open(information) as source,
+            file_path.open("wb") as destination,
+        ):
+            copyfileobj(source, destination, length=self._chunk_byte)
+
+    def _decode_comment(self, comment: bytes) -> str:
+        try:
+            return set_decoding(comment, encoding="utf-8")
+        except UnicodeDecodeError:
+            return set_decoding(comment)
 
     def _get_content(self, comment: bytes) -> StrPair:
-        return string_pair_from_json(json_load(set_decoding(comment)))
+        return string_pair_from_json(json_load(self._decode_comment(comment)))
 
-    def _restore_timestamp(
+    def _store_timestamp(
         self,
         file_path: Path,
         information: ZipInfo,
     ) -> None:
-        latest: datetime = datetime(*information.date_time, tzinfo=UTC)
-        comment: bytes = information.comment
+        if information.is_dir() and len(information.comment) == 0:
+            return  # Directory archived without its latest date time.
 
-        if len(comment) > 0:
-            content: StrPair = self._get_content(comment)
+        self._stamps[str(file_path)] = convert_nanosecond(
+            self.get_latest(information),
+        )
 
-            if "latest" in content:
-                latest = datetime.fromisoformat(content["latest"])
+    def _pop_stamps(self) -> IntPair:
+        stamps: IntPair = self._stamps
+        self._initialize_stamps()
 
-        set_latest(file_path, latest)
+        return stamps
+
+    def _restore_timestamps(self) -> None:
+        access: int = time_ns()
+
+        set_latest_at_once(
+            {
+                path_text: (access, update)
+                for path_text, update in self._pop_stamps().items()
+            },
+            parallel=self._parallel,
+        )
 
     def _encode_multiple(self, text: str) -> bytes:
         return text.encode("cp437", errors="ignore")
@@ -100,11 +147,121 @@ class DecompressArchive:
         return text
 
     def _get_file_path(self, information: ZipInfo) -> Path:
-        return Path(
-            self._output_root,
-            Path(self._support_multiple_byte(information.orig_filename)),
+        return Path(self._output_root, self.get_relative_path(information))
+
+    def _match_pattern(self, relative: Path, pattern: str | None) -> bool:
+        return (pattern is None) or relative.full_match(pattern)
+
+    def _match_select(
+        self,
+        relative: Path,
+        select: PathBoolFunc | None,
+    ) -> bool:
+        return (select is None) or select(relative)
+
+    def _is_selected(
+        self,
+        information: ZipInfo,
+        pattern: str | None,
+        select: PathBoolFunc | None,
+    ) -> bool:
+        relative: Path = self.get_relative_path(information)
+
+        return self._match_pattern(relative, pattern) and self._match_select(
+            relative,
+            select,
         )
 
+    def _select_members(
+        self,
+        archive_file: ZipFile,
+        pattern: str | None,
+        select: PathBoolFunc | None,
+    ) -> Archives:
+        return [
+            information
+            for information in archive_file.infolist()
+            if self._is_selected(information, pattern, select)
+        ]
+
+    def _decompress_member(
+        self,
+        information: ZipInfo,
+        archive_file: ZipFile,
+    ) -> None:
+        file_path: Path = self._get_file_path(information)
+
+        if information.is_dir():
+            create_directory(file_path)
+        else:
+            self._decompress_file(file_path, information, archive_file)
+
+        self._store_timestamp(file_path, information)
+
+    def _decompress_serial(
+        self,
+        decompress_target: Path,
+        pattern: str | None,
+        select: PathBoolFunc | None,
+    ) -> None:
+        with ZipFile(decompress_target) as archive_file:
+            for information in self._select_members(
+                archive_file,
+                pattern,
+                select,
+            ):
+                self._decompress_member(information, archive_file)
+
+    def _decompress_members(
+        self,
+        decompress_target: Path,
+        informations: Archives,
+    ) -> None:
+        with ZipFile(decompress_target) as archive_file:
+            for information in informations:
+                self._decompress_member(information, archive_file)
+
+    def _split_members(
+        self,
+        decompress_target: Path,
+        pattern: str | None,
+        select: PathBoolFunc | None,
+    ) -> Archives2:
+        with ZipFile(decompress_target) as archive_file:
+            informations: Archives = self._select_members(
+                archive_file,
+                pattern,
+                select,
+            )
+
+        return [
+            informations[i :: self._parallel] for i in range(self._parallel)
+        ]
+
+    def _decompress_parallel(
+        self,
+        paths: Paths,
+        pattern: str | None,
+        select: PathBoolFunc | None,
+    ) -> None:
+        archive_paths: Paths = []
+        members: Archives2 = []
+
+        for path in paths:
+            for informations in self._split_members(path, pattern, select):
+                if len(informations) > 0:
+                    archive_paths += [path]
+                    members += [informations]
+
+        with ThreadPoolExecutor(max_workers=self._parallel) as executor:
+            list(
+                executor.map(
+                    self._decompress_members,
+                    archive_paths,
+                    members,
+                ),
+            )
+
     def sequential_archives(self, source_archive: Path) -> Paths:
         """Get list of archives which is compressed dividedly.
 
@@ -154,32 +311,115 @@ class DecompressArchive:
             ],
         ]
 
-    def decompress_archive(self, decompress_target: Path) -> None:
+    def decompress_archive(
+        self,
+        decompress_target: Path,
+        pattern: str | None = None,
+        select: PathBoolFunc | None = None,
+    ) -> None:
         """Decompress file or directory by archive format.
 
         Args:
             decompress_target (Path): Path of archive you want to decompress.
 
-        """
-        with ZipFile(decompress_target) as archive_file:
-            for information in archive_file.infolist():
-                file_path: Path = self._get_file_path(information)
+            pattern (str | None, optional): Defaults to None.
+                Glob pattern to select files or directories you decompress.
+                It's matched with whole relative path inside archive,
+                    and "**" matches any number of directories.
 
-                if information.is_dir():
-                    create_directory(file_path)
-                else:
-                    self._decompress_file(file_path, information, archive_file)
-                    self._restore_timestamp(file_path, information)
+            select (PathBoolFunc | None, optional): Defaults to None.
+                Function to select files or directories you decompress.
+                It's called with relative path inside archive,
+                    and the path is decompressed if it returns True.
 
-    def decompress_at_once(self, paths: Paths) -> None:
+        """
+        self.decompress_at_once(
+            [decompress_target],
+            pattern=pattern,
+            select=select,
+        )
+
+    def decompress_at_once(
+        self,
+        paths: Paths,
+        pattern: str | None = None,
+        select: PathBoolFunc | None = None,
+    ) -> None:
         """Decompress list of file or directory at once.
 
         Args:
             paths (Paths): List of path you want to decompress.
 
+            pattern (str | None, optional): Defaults to None.
+                Glob pattern to select files or directories you decompress.
+
+            select (PathBoolFunc | None, optional): Defaults to None.
+                Function to select files or directories you decompress.
+
         """
-        for path in paths:
-            self.decompress_archive(path)
+        if self._parallel > 0:
+            self._decompress_parallel(paths, pattern, select)
+        else:
+            for path in paths:
+                self._decompress_serial(path, pattern, select)
+
+        self._restore_timestamps()
+
+    def decompress_members(self, members: ArchivesPair) -> None:
+        """Decompress selected members of archives.
+
+        Members are selected from list you already got,
+            so central directory of each archive isn't read to select.
+
+        Args:
+            members (ArchivesPair): Dictionary constructed by
+                string path of archive and members you want to decompress.
+
+        """
+        for path_text, informations in members.items():
+            if len(informations) > 0:
+                self._decompress_members(Path(path_text), informations)
+
+        self._restore_timestamps()
+
+    def get_relative_path(self, information: ZipInfo) -> Path:
+        """Get relative path where member of archive is decompressed.
+
+        Name of member is converted to "cp932" if it's possible,
+            so it's same as the path of decompressed file or directory.
+
+        Args:
+            information (ZipInfo): Information of member inside archive.
+
+        Returns:
+            Path: Relative path of member from decompress directory.
+
+        """
+        return Path(self._support_multiple_byte(information.orig_filename))
+
+    def get_latest(self, information: ZipInfo) -> datetime:
+        """Get latest date time of member inside archive.
+
+        Latest date time stored in comment of member is used if it exists,
+            because date time of archive format isn't accurate.
+
+        Args:
+            information (ZipInfo): Information of member inside archive.
+
+        Returns:
+            datetime: Latest date time of member.
+
+        """
+        latest: datetime = datetime(*information.date_time, tzinfo=UTC)
+        comment: bytes = information.comment
+
+        if len(comment) > 0:
+            content: StrPair = self._get_content(comment)
+
+            if "latest" in content:
+                latest = datetime.fromisoformat(content["latest"])
+
+        return latest
 
     def is_lzma_archive(self, decompress_target: Path) -> bool:
         """Get status of compression format.
@@ -199,11 +439,32 @@ class DecompressArchive:
 
         return False
 
-    def __init__(self, output_root: Path) -> None:
+    def __init__(
+        self,
+        output_root: Path,
+        parallel: int = 0,
+        chunk_byte: int = 0,
+    ) -> None:
         """Initialize decompress directory.
 
         Args:
             output_root (Path): Path of decompress directory.
 
+            parallel (int, optional): Defaults to 0.
+                Number of threads used for decompressing archives.
+                Each thread opens archive by itself,
+                    and decompresses part of files inside the archive.
+                If it's 0, all files are decompressed by current thread.
+
+            chunk_byte (int, optional): Defaults to 0.
+                Size of chunk used for streaming file out of archive.
+                The value of "chunk_byte" is represented by byte unit.
+                If it's 0, 1MB is used as chunk size.
+                Memory usage is bounded by the chunk size
+                    regardless of the size of file you decompress.
+
         """
         self._initialize_paths(output_root)
+        self._initialize_chunk_byte(chunk_byte)
+        self._initialize_parallel(parallel)
+        self._initialize_stamps()
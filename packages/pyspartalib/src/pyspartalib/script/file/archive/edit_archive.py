@@ -3,15 +3,28 @@
 """Module to edit internal of archive file."""
 
 from pathlib import Path
+from tempfile import mkdtemp
 from typing import NoReturn
+from zipfile import ZipFile, ZipInfo
 
 from pyspartalib.context.custom.type_context import Type
-from pyspartalib.context.extension.path_context import Paths
+from pyspartalib.context.extension.path_context import Paths, PathSet
 from pyspartalib.context.extension.time_context import TimePair
 from pyspartalib.script.file.archive.compress_archive import CompressArchive
+from pyspartalib.script.file.archive.context.archive_context import (
+    ArchiveMember,
+    ArchiveMemberPair,
+    ArchiveMembers,
+    Archives,
+    ArchivesPair,
+)
 from pyspartalib.script.file.archive.decompress_archive import (
     DecompressArchive,
 )
+from pyspartalib.script.file.archive.index_archive import (
+    create_index,
+    get_index_path,
+)
 from pyspartalib.script.path.iterate_directory import walk_iterator
 from pyspartalib.script.path.safe.safe_trash import SafeTrash
 from pyspartalib.script.time.path.get_timestamp import get_directory_latest
@@ -75,11 +88,16 @@ class EditArchive(SafeTrash):
         limit_byte: int,
         compress: bool,
         protected: bool,
+        incremental: bool,
+        lazy: bool,
     ) -> None:
         self._archive_path = archive_path
         self._limit_byte: int = limit_byte
         self._is_lzma_after: bool = compress
         self._protected: bool = protected
+        self._incremental: bool = incremental or lazy
+        self._lazy: bool = lazy
+        self._materialized: PathSet = set()
 
     def _get_archive_stamp(self) -> TimePair:
         return get_directory_latest(walk_iterator(self.get_edit_root()))
@@ -104,18 +122,19 @@ class EditArchive(SafeTrash):
     def _cleanup_before_override(self) -> None:
         self.trash_at_once(self._decompressed)
 
-    def _compress_archive(self, archive_stamp: TimePair) -> Paths:
-        self._cleanup_before_override()
-
-        archive_path: Path = self.get_archive_path()
-
-        compress_archive = CompressArchive(
-            archive_path.parent,
+    def _get_compress_archive(self, output_root: Path) -> CompressArchive:
+        return CompressArchive(
+            output_root,
             limit_byte=self._limit_byte,
             compress=self._is_lzma_after,
-            archive_id=archive_path.stem,
+            archive_id=self.get_archive_path().stem,
         )
 
+    def _compress_stamp(
+        self,
+        compress_archive: CompressArchive,
+        archive_stamp: TimePair,
+    ) -> Paths:
         compress_archive.compress_at_once(
             [Path(path_text) for path_text in archive_stamp],
             archive_root=self.get_edit_root(),
@@ -123,6 +142,114 @@ class EditArchive(SafeTrash):
 
         return compress_archive.close_archived()
 
+    def _compress_archive(self, archive_stamp: TimePair) -> Paths:
+        self._cleanup_before_override()
+
+        return self._compress_stamp(
+            self._get_compress_archive(self.get_archive_path().parent),
+            archive_stamp,
+        )
+
+    def _get_member_path(self, information: ZipInfo) -> Path:
+        return self._decompressor.get_relative_path(information)
+
+    def _is_materialized(self, information: ZipInfo) -> bool:
+        return self._get_member_path(information) in self._materialized
+
+    def _is_same_member(
+        self,
+        information: ZipInfo,
+        archive_stamp: TimePair,
+    ) -> bool:
+        path_text: str = str(
+            Path(self.get_edit_root(), self._get_member_path(information)),
+        )
+
+        # New file placed at the path which isn't materialized is edited.
+        if self._lazy and (not self._is_materialized(information)):
+            return information.is_dir() or (path_text not in archive_stamp)
+
+        if path_text not in archive_stamp:
+            return False
+
+        return self._archive_stamp.get(path_text) == archive_stamp[path_text]
+
+    def _filter_same_member(
+        self,
+        informations: Archives,
+        archive_stamp: TimePair,
+    ) -> Archives:
+        return [
+            information
+            for information in informations
+            if self._is_same_member(information, archive_stamp)
+        ]
+
+    def _copy_same_member(
+        self,
+        compress_archive: CompressArchive,
+        archive_stamp: TimePair,
+    ) -> None:
+        for path_text, informations in self._archived_members.items():
+            same_members: Archives = self._filter_same_member(
+                informations,
+                archive_stamp,
+            )
+
+            compress_archive.copy_archived(
+                Path(path_text),
+                same_members,
+                self.get_edit_root(),
+                relative_paths=[
+                    self._get_member_path(information)
+                    for information in same_members
+                ],
+            )
+
+    def _move_archived(self, archived: Paths) -> Paths:
+        parent_root: Path = self.get_archive_path().parent
+
+        return [
+            path.replace(Path(parent_root, path.name)) for path in archived
+        ]
+
+    def _compress_incremental(self, archive_stamp: TimePair) -> Paths:
+        temporary_root: Path = Path(
+            mkdtemp(dir=self.get_archive_path().parent),
+        )
+        compress_archive: CompressArchive = self._get_compress_archive(
+            temporary_root,
+        )
+
+        self._copy_same_member(compress_archive, archive_stamp)
+        archived: Paths = self._compress_stamp(compress_archive, archive_stamp)
+
+        self._cleanup_before_override()
+        archived = self._move_archived(archived)
+
+        temporary_root.rmdir()
+
+        return archived
+
+    def _materialize_rest(self) -> TimePair:
+        self.materialize(Path())
+        return self._get_archive_stamp()
+
+    def _update_index(self, archived: Paths) -> Paths:
+        if get_index_path(self.get_archive_path()).exists():
+            create_index(archived)
+
+        return archived
+
+    def _select_compress_mode(self, archive_stamp: TimePair) -> Paths:
+        if not self._is_difference_compress_type():
+            if self._incremental:
+                return self._compress_incremental(archive_stamp)
+        elif self._lazy:
+            archive_stamp = self._materialize_rest()
+
+        return self._compress_archive(archive_stamp)
+
     def _decompress_archive(
         self,
         decompress_archive: DecompressArchive,
@@ -132,6 +259,21 @@ class EditArchive(SafeTrash):
         )
         decompress_archive.decompress_at_once(self._decompressed)
 
+    def _read_members(self, archive_path: Path) -> Archives:
+        with ZipFile(archive_path) as archive_file:
+            return archive_file.infolist()
+
+    def _record_members(self) -> None:
+        self._archived_members: ArchivesPair = {
+            str(archive_path): self._read_members(archive_path)
+            for archive_path in self._decompressed
+        }
+        self._member_paths: ArchiveMemberPair = {
+            self._get_member_path(information): (path_text, information)
+            for path_text, informations in self._archived_members.items()
+            for information in informations
+        }
+
     def _record_compress_type(
         self,
         decompress_archive: DecompressArchive,
@@ -140,14 +282,86 @@ class EditArchive(SafeTrash):
             self.get_archive_path(),
         )
 
+    def _initialize_decompress(self) -> DecompressArchive:
+        self._decompressor: DecompressArchive = DecompressArchive(
+            self.get_edit_root(),
+        )
+
+        return self._decompressor
+
     def _get_decompress_stamp(self) -> None:
-        decompress_archive = DecompressArchive(self.get_edit_root())
+        decompress_archive: DecompressArchive = self._initialize_decompress()
 
         self._decompress_archive(decompress_archive)
         self._record_compress_type(decompress_archive)
+        self._record_members()
 
         self._archive_stamp: TimePair = self._get_archive_stamp()
 
+    def _get_lazy_stamp(self) -> None:
+        decompress_archive: DecompressArchive = self._initialize_decompress()
+
+        self._decompressed = decompress_archive.sequential_archives(
+            self.get_archive_path(),
+        )
+        self._record_compress_type(decompress_archive)
+        self._record_members()
+
+        self._archive_stamp = {}
+
+    def _open_archive_mode(self) -> None:
+        if self._lazy:
+            self._get_lazy_stamp()
+        else:
+            self._get_decompress_stamp()
+
+    def _get_materialized_parents(self, relative: Path) -> Paths:
+        return [
+            Path(self.get_edit_root(), parent) for parent in relative.parents
+        ][:-1]
+
+    def _find_members(self, relative_path: Path) -> ArchiveMembers:
+        member: ArchiveMember | None = self._member_paths.get(relative_path)
+
+        if member is not None and not member[1].is_dir():
+            return [member]
+
+        return [
+            member
+            for relative, member in self._member_paths.items()
+            if relative.is_relative_to(relative_path)
+        ]
+
+    def _select_members(self, relative_path: Path) -> ArchivesPair:
+        selected: ArchivesPair = {}
+
+        for path_text, information in self._find_members(relative_path):
+            if not self._is_materialized(information):
+                selected.setdefault(path_text, [])
+                selected[path_text] += [information]
+
+        return selected
+
+    def _list_relatives(self, members: ArchivesPair) -> Paths:
+        return [
+            self._get_member_path(information)
+            for informations in members.values()
+            for information in informations
+        ]
+
+    def _record_materialized(self, relatives: Paths) -> None:
+        paths: PathSet = set()
+
+        for relative in relatives:
+            self._materialized.add(relative)
+
+            paths.add(Path(self.get_edit_root(), relative))
+            paths.update(self._get_materialized_parents(relative))
+
+        self._archive_stamp.update(
+            get_directory_latest(path for path in sorted(paths)),
+        )
+
     def _filter_time_stamp(self) -> Paths | None:
         if self._protected:
             return None
@@ -157,7 +371,7 @@ class EditArchive(SafeTrash):
         if archive_stamp is None:  # Can't using: if value := func()
             return None
 
-        return self._compress_archive(archive_stamp)
+        return self._update_index(self._select_compress_mode(archive_stamp))
 
     def _finalize_archive(self) -> Paths | None:
         archived: Paths | None = self._filter_time_stamp()
@@ -166,6 +380,52 @@ class EditArchive(SafeTrash):
 
         return archived
 
+    def get_manifest(self) -> Paths:
+        """Get relative paths of all files and directories inside archive.
+
+        They are gotten from the archive without decompression,
+            so the paths which aren't materialized are also included.
+
+        Returns:
+            Paths: List of relative paths inside archive.
+
+        """
+        return [
+            self._get_member_path(information)
+            for informations in self._archived_members.values()
+            for information in informations
+        ]
+
+    def materialize(self, relative_path: Path) -> Path:
+        """Decompress files or directories inside archive on demand.
+
+        Args:
+            relative_path (Path): Relative path inside archive
+                of file or directory you want to decompress.
+                If it's directory, all contents of it are also decompressed.
+
+        Returns:
+            Path: Path of decompressed file or directory
+                inside temporary working space.
+
+        Files which are already decompressed aren't decompressed again,
+            so your editing of them is kept.
+        Members are found from the list read when archive is opened,
+            so central directory of archive isn't read again.
+        If archive isn't opened lazily, nothing is decompressed,
+            because all contents are decompressed when it's opened.
+
+        """
+        if not self._lazy:
+            return Path(self.get_edit_root(), relative_path)
+
+        selected: ArchivesPair = self._select_members(relative_path)
+
+        self._decompressor.decompress_members(selected)
+        self._record_materialized(self._list_relatives(selected))
+
+        return Path(self.get_edit_root(), relative_path)
+
     def is_disable_archive(self) -> bool:
         """Confirm statue of archive.
 
@@ -216,6 +476,8 @@ class EditArchive(SafeTrash):
         limit_byte: int = 0,
         compress: bool = False,
         protected: bool = False,
+        incremental: bool = False,
+        lazy: bool = False,
     ) -> Path | None:
         """Initialize variables about archive and decompress it.
 
@@ -234,6 +496,22 @@ class EditArchive(SafeTrash):
             protected (bool, optional): Defaults to False.
                 True if you don't want to update original archive.
 
+            incremental (bool, optional): Defaults to False.
+                If it's True, only files which are changed or added
+                    are compressed again when you close archive.
+                Other files are copied from original archive
+                    without recompression.
+                All files are compressed again
+                    if compression format is changed.
+
+            lazy (bool, optional): Defaults to False.
+                If it's True, archive isn't decompressed when you open it.
+                Only the paths you select by method "materialize"
+                    are decompressed to temporary working space.
+                When you close archive, it's edited incrementally.
+                File you place at the path which isn't materialized
+                    replaces the member of original archive.
+
         Returns:
             Path | None: Return archive path which is argument "archive_path".
 
@@ -247,9 +525,11 @@ class EditArchive(SafeTrash):
             limit_byte,
             compress,
             protected,
+            incremental,
+            lazy,
         )
 
-        self._get_decompress_stamp()
+        self._open_archive_mode()
 
         return archive_path
 
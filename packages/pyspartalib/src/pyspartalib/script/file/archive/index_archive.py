@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+
+"""Module to find file or directory inside archives by index."""
+
+from contextlib import closing
+from datetime import datetime
+from os import SEEK_CUR
+from pathlib import Path
+from shutil import copyfileobj
+from sqlite3 import Connection, connect
+from struct import calcsize, unpack
+from typing import BinaryIO
+from zipfile import BadZipFile, ZipExtFile, ZipFile, ZipInfo
+
+from pyspartalib.context.extension.path_context import Paths
+from pyspartalib.script.directory.create_directory import create_directory
+from pyspartalib.script.directory.create_parent import create_parent
+from pyspartalib.script.file.archive.context.archive_context import (
+    ArchiveIndex,
+)
+from pyspartalib.script.file.archive.decompress_archive import (
+    DecompressArchive,
+)
+from pyspartalib.script.time.path.set_timestamp import set_latest
+
+IndexRow = tuple[str, int, int, int, int, str]
+MemberRow = tuple[str, int, int, int, int, int, str]
+HeaderRow = tuple[bytes, int, int, int, int, int, int, int, int, int, int, int]
+
+
+def _get_index_suffix() -> str:
+    return ".sqlite"
+
+
+def _get_create_volumes() -> str:
+    return "CREATE TABLE volumes (volume INTEGER PRIMARY KEY, name TEXT)"
+
+
+def _get_create_members() -> str:
+    return """
+        CREATE TABLE members (
+            path TEXT PRIMARY KEY,
+            volume INTEGER,
+            offset INTEGER,
+            compress_size INTEGER,
+            file_size INTEGER,
+            crc INTEGER,
+            latest TEXT
+        ) WITHOUT ROWID
+    """
+
+
+def _get_insert_volumes() -> str:
+    return "INSERT INTO volumes VALUES (?, ?)"
+
+
+def _get_insert_members() -> str:
+    return "INSERT OR REPLACE INTO members VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+
+def _get_select_member() -> str:
+    return """
+        SELECT volumes.name, offset, compress_size, file_size, crc, latest
+        FROM members JOIN volumes USING (volume)
+        WHERE path = ?
+    """
+
+
+def _get_member_row(
+    decompress_archive: DecompressArchive,
+    volume: int,
+    information: ZipInfo,
+) -> MemberRow:
+    return (
+        str(decompress_archive.get_relative_path(information)),
+        volume,
+        information.header_offset,
+        information.compress_size,
+        information.file_size,
+        information.CRC,
+        decompress_archive.get_latest(information).isoformat(),
+    )
+
+
+def _insert_volume(
+    connection: Connection,
+    decompress_archive: DecompressArchive,
+    volume: int,
+    archive_path: Path,
+) -> None:
+    connection.execute(_get_insert_volumes(), (volume, archive_path.name))
+
+    with ZipFile(archive_path) as archive_file:
+        connection.executemany(
+            _get_insert_members(),
+            [
+                _get_member_row(decompress_archive, volume, information)
+                for information in archive_file.infolist()
+            ],
+        )
+
+
+def _to_index(archive_root: Path, row: IndexRow) -> ArchiveIndex:
+    return {
+        "archive": Path(archive_root, row[0]),
+        "offset": row[1],
+        "compress_size": row[2],
+        "file_size": row[3],
+        "crc": row[4],
+        "latest": datetime.fromisoformat(row[5]),
+    }
+
+
+def _get_header_format() -> str:
+    return "<4s2B4HL2L2H"  # Local file header of archive format.
+
+
+def _get_header_signature() -> bytes:
+    return b"PK\x03\x04"
+
+
+def _read_header(file: BinaryIO) -> tuple[int, bool]:
+    header: HeaderRow = unpack(
+        _get_header_format(),
+        file.read(calcsize(_get_header_format())),
+    )
+
+    if header[0] != _get_header_signature():
+        raise BadZipFile
+
+    name: bytes = file.read(header[10])
+    file.seek(header[11], SEEK_CUR)
+
+    return header[4], name.endswith(b"/")
+
+
+def _get_information(archive_index: ArchiveIndex, compress: int) -> ZipInfo:
+    information = ZipInfo()
+    information.compress_type = compress
+    information.compress_size = archive_index["compress_size"]
+    information.file_size = archive_index["file_size"]
+    information.CRC = archive_index["crc"]
+
+    return information
+
+
+def _decompress_file(
+    file: BinaryIO,
+    information: ZipInfo,
+    output_path: Path,
+) -> None:
+    create_parent(output_path)
+
+    with (
+        ZipExtFile(file, "r", information) as source,
+        output_path.open(mode="wb") as destination,
+    ):
+        copyfileobj(source, destination)
+
+
+def _decompress_index(archive_index: ArchiveIndex, output_path: Path) -> Path:
+    with archive_index["archive"].open(mode="rb") as file:
+        file.seek(archive_index["offset"])
+        compress, is_dir = _read_header(file)
+
+        if is_dir:
+            create_directory(output_path)
+        else:
+            _decompress_file(
+                file,
+                _get_information(archive_index, compress),
+                output_path,
+            )
+
+    return set_latest(output_path, archive_index["latest"])
+
+
+def get_index_path(archive_path: Path) -> Path:
+    """Get path of index which is placed alongside sequential archives.
+
+    Args:
+        archive_path (Path): The head path of sequential archives.
+
+    Returns:
+        Path: Path of index.
+
+    e.g., index of sequential archives is placed to follow.
+
+        root/
+            |--archive.<archive format>
+            |--archive#0001.<archive format>
+            |--archive.sqlite
+
+    """
+    return archive_path.with_suffix(_get_index_suffix())
+
+
+def create_index(archive_paths: Paths) -> Path:
+    """Create index of files and directories inside sequential archives.
+
+    Only central directory of each archive is read,
+        so archives aren't decompressed.
+    Each path is same as the path where member is decompressed
+        by class "DecompressArchive".
+
+    Args:
+        archive_paths (Paths): List of sequential archives.
+            The first element must be the head of sequential archives.
+
+    Returns:
+        Path: Path of created index.
+
+    """
+    index_path: Path = get_index_path(archive_paths[0])
+    index_path.unlink(missing_ok=True)
+
+    # Only used for converting member to path and date time.
+    decompress_archive = DecompressArchive(index_path.parent)
+
+    with closing(connect(index_path)) as connection, connection:
+        connection.execute(_get_create_volumes())
+        connection.execute(_get_create_members())
+
+        for volume, archive_path in enumerate(archive_paths):
+            _insert_volume(
+                connection,
+                decompress_archive,
+                volume,
+                archive_path,
+            )
+
+    return index_path
+
+
+class IndexArchive:
+    """Class to find file or directory inside archives by index."""
+
+    def _initialize_paths(self, archive_path: Path) -> None:
+        self._archive_root: Path = archive_path.parent
+        self._index_path: Path = get_index_path(archive_path)
+
+    def _select_member(self, relative_path: Path) -> IndexRow | None:
+        with closing(connect(self._index_path)) as connection:
+            row: IndexRow | None = connection.execute(
+                _get_select_member(),
+                (str(relative_path),),
+            ).fetchone()
+
+            return row
+
+    def find(self, relative_path: Path) -> ArchiveIndex | None:
+        """Find file or directory inside archives by index.
+
+        Args:
+            relative_path (Path): Relative path inside archive
+                of file or directory you want to find.
+
+        Returns:
+            ArchiveIndex | None: Information about where the path is placed.
+                Return "None" if the path isn't found.
+
+        """
+        if row := self._select_member(relative_path):
+            return _to_index(self._archive_root, row)
+
+        return None
+
+    def decompress(
+        self,
+        relative_path: Path,
+        output_root: Path,
+    ) -> Path | None:
+        """Decompress single file or directory found by index.
+
+        Member is read from the offset stored in index,
+            so central directory of the archive isn't read.
+
+        Args:
+            relative_path (Path): Relative path inside archive
+                of file or directory you want to decompress.
+
+            output_root (Path): Path of decompress directory.
+
+        Returns:
+            Path | None: Path of decompressed file or directory.
+                Return "None" if the path isn't found.
+
+        """
+        archive_index: ArchiveIndex | None = self.find(relative_path)
+
+        if archive_index is None:
+            return None
+
+        return _decompress_index(
+            archive_index,
+            Path(output_root, relative_path),
+        )
+
+    def __init__(self, archive_path: Path) -> None:
+        """Initialize path of index.
+
+        Args:
+            archive_path (Path): The head path of sequential archives.
+                Index must be created by function "create_index".
+
+        """
+        self._initialize_paths(archive_path)
@@ -2,16 +2,22 @@
 
 """Module to take out directory from inside of archive."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NoReturn
 
 from pyspartalib.context.custom.type_context import Type
-from pyspartalib.context.extension.path_context import Paths, PathsPair
+from pyspartalib.context.default.integer_context import IntPair
+from pyspartalib.context.default.string_context import Strs
+from pyspartalib.context.extension.path_context import (
+    Paths,
+    PathsPair,
+)
 from pyspartalib.script.file.archive.archive_format import rename_format
 from pyspartalib.script.file.archive.compress_archive import CompressArchive
 from pyspartalib.script.file.archive.edit_archive import EditArchive
-from pyspartalib.script.path.iterate_directory import walk_iterator
-from pyspartalib.script.path.modify.avoid_duplication import get_avoid_path
+from pyspartalib.script.path.iterate_directory import walk_entries
+from pyspartalib.script.path.modify.avoid_duplication import AvoidPath
 
 
 def _raise_error(message: str) -> NoReturn:
@@ -48,6 +54,7 @@ class TakeOutArchive(EditArchive):
 
     def __initialize_variables(self) -> None:
         self._took_out_root: Path | None = None
+        self._parallel: int = 0
 
     def _set_took_out_root(self, took_out_root: Path | None) -> None:
         archive_path: Path = self.get_archive_path()
@@ -57,63 +64,146 @@ class TakeOutArchive(EditArchive):
 
         self._took_out_root = took_out_root
 
-    def _get_archive_name(self, archive_id: str) -> str:
-        archive_path: Path = get_avoid_path(
+    def _get_archive_name(
+        self,
+        archive_id: str,
+        avoid_path: AvoidPath,
+    ) -> str:
+        return avoid_path.get_avoid_path(
             rename_format(Path(self.get_took_out_root(), archive_id)),
-        )
-        return archive_path.stem
+        ).stem
+
+    def _get_archive_names(self, inside_directory: PathsPair) -> Strs:
+        avoid_path = AvoidPath()
+
+        return [
+            self._get_archive_name(Path(directory_text).name, avoid_path)
+            for directory_text in inside_directory
+        ]
 
     def _take_out_archive(self, file_paths: Paths, archive_id: str) -> Path:
         compress_archive = CompressArchive(
             self.get_took_out_root(),
-            archive_id=self._get_archive_name(archive_id),
+            archive_id=archive_id,
         )
 
         compress_archive.compress_at_once(file_paths)
         return compress_archive.close_archived()[0]
 
     def _take_out_archives(self, inside_directory: PathsPair) -> Paths:
+        archive_names: Strs = self._get_archive_names(inside_directory)
+        file_paths: list[Paths] = list(inside_directory.values())
+
+        if self._parallel > 0:
+            with ThreadPoolExecutor(max_workers=self._parallel) as executor:
+                return list(
+                    executor.map(
+                        self._take_out_archive,
+                        file_paths,
+                        archive_names,
+                    ),
+                )
+
         return [
-            self._take_out_archive(file_paths, Path(directory_text).name)
-            for directory_text, file_paths in inside_directory.items()
+            self._take_out_archive(paths, archive_name)
+            for paths, archive_name in zip(
+                file_paths,
+                archive_names,
+                strict=True,
+            )
         ]
 
-    def _get_take_out(self, directory_root: Path) -> Paths | None:
-        file_paths: Paths = []
+    def _get_inside_tree(self) -> PathsPair:
+        edit_root: Path = self.get_edit_root()
+        inside_tree: PathsPair = {}
 
-        for path in walk_iterator(directory_root):
-            if path.is_dir():
-                return None
+        for entry in walk_entries(edit_root):
+            path: Path = Path(entry.path)
+
+            if entry.is_dir():
+                inside_tree.setdefault(str(path), [])
 
-            file_paths += [path]
+            if path.parent != edit_root:
+                inside_tree.setdefault(str(path.parent), []).append(path)
 
-        return None if len(file_paths) == 0 else file_paths
+        return inside_tree
 
-    def _get_inside_directory(self) -> PathsPair:
+    def _get_took_out_height(
+        self,
+        children: Paths,
+        inside_tree: PathsPair,
+        heights: IntPair,
+    ) -> int | None:
+        height: int = 0
+        has_file: bool = False
+
+        for path in children:
+            if (path_text := str(path)) in heights:
+                height = max(height, heights[path_text])
+            elif path_text in inside_tree:
+                return None
+            else:
+                has_file = True
+
+        return height + 1 if has_file else None
+
+    def _get_depth(self, path_text: str) -> int:
+        return len(Path(path_text).parts)
+
+    def _get_took_out_heights(self, inside_tree: PathsPair) -> IntPair:
+        heights: IntPair = {}
+
+        for directory_text in sorted(
+            inside_tree,
+            key=self._get_depth,
+            reverse=True,
+        ):
+            if (
+                height := self._get_took_out_height(
+                    inside_tree[directory_text],
+                    inside_tree,
+                    heights,
+                )
+            ) is not None:
+                heights[directory_text] = height
+
+        return heights
+
+    def _get_inside_directory(
+        self,
+        inside_tree: PathsPair,
+        heights: IntPair,
+    ) -> PathsPair:
         return {
-            str(directory_root): file_paths
-            for directory_root in walk_iterator(
-                self.get_edit_root(),
-                file=False,
+            directory_text: [
+                path
+                for path in inside_tree[directory_text]
+                if str(path) not in heights
+            ]
+            for directory_text in sorted(
+                [text for text in inside_tree if text in heights],
+                key=heights.__getitem__,
             )
-            if (file_paths := self._get_take_out(directory_root))
         }
 
-    def _remove_took_out(self, inside_directory: PathsPair) -> None:
-        self.trash_at_once([Path(text) for text in inside_directory])
-
-    def _took_out_cycle(self, archive_paths: Paths) -> None:
-        inside_directory: PathsPair = self._get_inside_directory()
-
-        if len(inside_directory) > 0:
-            archive_paths += self._take_out_archives(inside_directory)
-            self._remove_took_out(inside_directory)
-            self._took_out_cycle(archive_paths)
+    def _remove_took_out(self, heights: IntPair) -> None:
+        self.trash_at_once(
+            [
+                path
+                for path in [Path(text) for text in heights]
+                if str(path.parent) not in heights
+            ],
+        )
 
     def _get_took_out(self) -> Paths:
-        archive_paths: Paths = []
+        inside_tree: PathsPair = self._get_inside_tree()
+        heights: IntPair = self._get_took_out_heights(inside_tree)
+
+        archive_paths: Paths = self._take_out_archives(
+            self._get_inside_directory(inside_tree, heights),
+        )
 
-        self._took_out_cycle(archive_paths)
+        self._remove_took_out(heights)
         self.close_archive()
 
         return archive_paths
@@ -127,7 +217,11 @@ class TakeOutArchive(EditArchive):
         """
         return _none_error(self._took_out_root, "take")
 
-    def take_out(self, took_out_root: Path | None = None) -> Paths | None:
+    def take_out(
+        self,
+        took_out_root: Path | None = None,
+        parallel: int = 0,
+    ) -> Paths | None:
         """Take out directory from inside of archive.
 
         Behavior of take out process is split into following 3 pattern.
@@ -208,6 +302,11 @@ class TakeOutArchive(EditArchive):
             took_out_root (Path | None, optional): Defaults to None.
                 Destination directory that took out directories in archive.
 
+            parallel (int, optional): Defaults to 0.
+                Number of threads used for creating archives
+                    of took out directories.
+                If it's 0, all archives are created by current thread.
+
         Returns:
             Paths | None: Retune list of directory path which is took out
                 if archive is successfully open.
@@ -217,6 +316,7 @@ class TakeOutArchive(EditArchive):
             return None
 
         self._set_took_out_root(took_out_root)
+        self._parallel = parallel
 
         return self._get_took_out()
 
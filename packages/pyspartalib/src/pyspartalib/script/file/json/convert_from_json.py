@@ -35,7 +35,11 @@ from pyspartalib.context.extension.path_context import (
     Paths,
     Paths2,
 )
-from pyspartalib.context.file.json_context import Json, Single
+from pyspartalib.context.file.json_context import (
+    Json,
+    PartitionPair2,
+    Single,
+)
 
 
 def _to_decimal(number: float) -> Decimal:
@@ -462,3 +466,62 @@ def path_pair2_from_json(value_json: Json) -> PathPair2:
     return {
         key: path_pair_from_json(value) for key, value in value_json.items()
     }
+
+
+def _partition_group(
+    partition: PartitionPair2,
+    group: str,
+    value_json: Json,
+) -> None:
+    booleans: BoolPair = {}
+    integers: IntPair = {}
+    strings: StrPair = {}
+    paths: PathPair = {}
+
+    if isinstance(value_json, dict):
+        for key, value in value_json.items():
+            if isinstance(value, bool):
+                booleans[key] = value
+
+            if isinstance(value, int):  # Type "bool" is also included.
+                integers[key] = value
+            elif isinstance(value, str):
+                if path := _filter_path(value, key):
+                    paths[key] = path
+                else:
+                    strings[key] = value
+
+    partition["boolean"][group] = booleans
+    partition["integer"][group] = integers
+    partition["string"][group] = strings
+    partition["path"][group] = paths
+
+
+def partition_pair2_from_json(value_json: Json) -> PartitionPair2:
+    """Convert json format data to 2 dimensional dictionaries of each type.
+
+    Result is same as calling functions "bool_pair2_from_json",
+        "integer_pair2_from_json", "string_pair2_from_json",
+        and "path_pair2_from_json" separately,
+        but json format data is searched just once.
+
+    Args:
+        value_json (Json): Json format data you want to convert.
+
+    Returns:
+        PartitionPair2: Converted data which is dictionary constructed by
+            name of type and 2 dimensional dictionary of the type.
+
+    """
+    partition: PartitionPair2 = {
+        "boolean": {},
+        "integer": {},
+        "string": {},
+        "path": {},
+    }
+
+    if isinstance(value_json, dict):
+        for group, value in value_json.items():
+            _partition_group(partition, group, value)
+
+    return partition
@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+
+"""Module to get list of contents in the directory by persistent cache."""
+
+from collections.abc import Generator
+from contextlib import closing
+from fnmatch import fnmatch
+from os import scandir, sep, stat_result
+from pathlib import Path
+from sqlite3 import Connection, connect
+
+from pyspartalib.context.extension.entry_context import Entry
+from pyspartalib.context.extension.path_context import PathGene
+from pyspartalib.context.extension.time_context import TimePair
+from pyspartalib.script.time.epoch.from_timestamp import time_from_nanosecond
+from pyspartalib.script.time.epoch.get_time_stamp import get_valid_epoch
+
+CacheRow = tuple[str, int, int, int]
+CacheRows = list[CacheRow]
+StampRow = tuple[int, int]
+CacheGene = Generator[tuple[Path, CacheRow]]
+WalkFilter = tuple[int, bool, bool, str]
+
+
+def _get_create_directories() -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS directories (
+            path TEXT PRIMARY KEY,
+            mtime INTEGER,
+            inode INTEGER
+        ) WITHOUT ROWID
+    """
+
+
+def _get_create_entries() -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS entries (
+            parent TEXT,
+            name TEXT,
+            is_dir INTEGER,
+            mtime INTEGER,
+            size INTEGER,
+            PRIMARY KEY (parent, name)
+        ) WITHOUT ROWID
+    """
+
+
+def _get_select_directory() -> str:
+    return "SELECT mtime, inode FROM directories WHERE path = ?"
+
+
+def _get_select_entries() -> str:
+    return "SELECT name, is_dir, mtime, size FROM entries WHERE parent = ?"
+
+
+def _get_insert_directory() -> str:
+    return "INSERT OR REPLACE INTO directories VALUES (?, ?, ?)"
+
+
+def _get_insert_entries() -> str:
+    return "INSERT INTO entries VALUES (?, ?, ?, ?, ?)"
+
+
+def _get_delete_entries() -> str:
+    return "DELETE FROM entries WHERE parent = ?"
+
+
+def _get_delete_tree_entries() -> str:
+    return "DELETE FROM entries WHERE parent = ? OR substr(parent, 1, ?) = ?"
+
+
+def _get_delete_tree_directories() -> str:
+    return "DELETE FROM directories WHERE path = ? OR substr(path, 1, ?) = ?"
+
+
+def _get_valid_nanosecond() -> int:
+    return int(get_valid_epoch()) * 10**9
+
+
+def _initialize_tables(connection: Connection) -> None:
+    connection.execute(_get_create_directories())
+    connection.execute(_get_create_entries())
+
+
+def _get_stamp(root: Path) -> StampRow | None:
+    try:
+        status = root.stat()
+    except OSError:  # Same as glob, unreadable directory is ignored.
+        return None
+
+    return status.st_mtime_ns, status.st_ino
+
+
+def _select_stamp(connection: Connection, root: Path) -> StampRow | None:
+    row: StampRow | None = connection.execute(
+        _get_select_directory(),
+        (str(root),),
+    ).fetchone()
+
+    return row
+
+
+def _select_rows(connection: Connection, root: Path) -> CacheRows:
+    rows: CacheRows = connection.execute(
+        _get_select_entries(),
+        (str(root),),
+    ).fetchall()
+
+    return rows
+
+
+def _delete_tree(connection: Connection, root: Path) -> None:
+    parent: str = str(root)
+    prefix: str = parent + sep
+
+    for query in [_get_delete_tree_entries(), _get_delete_tree_directories()]:
+        connection.execute(query, (parent, len(prefix), prefix))
+
+
+def _get_status(entry: Entry) -> stat_result:
+    try:
+        return entry.stat()
+    except OSError:  # Status of link itself is used if link is broken.
+        return entry.stat(follow_symlinks=False)
+
+
+def _to_row(entry: Entry) -> CacheRow:
+    status: stat_result = _get_status(entry)
+
+    return (
+        entry.name,
+        int(entry.is_dir(follow_symlinks=False)),
+        status.st_mtime_ns,
+        status.st_size,
+    )
+
+
+def _list_rows(root: Path) -> CacheRows:
+    try:
+        with scandir(root) as entries:
+            return [_to_row(entry) for entry in entries]
+    except OSError:
+        return []
+
+
+def _get_directory_names(rows: CacheRows) -> set[str]:
+    return {row[0] for row in rows if row[1]}
+
+
+def _delete_removed(
+    connection: Connection,
+    root: Path,
+    rows: CacheRows,
+) -> None:
+    for name in _get_directory_names(
+        _select_rows(connection, root),
+    ) - _get_directory_names(rows):
+        _delete_tree(connection, Path(root, name))
+
+
+def _update_rows(
+    connection: Connection,
+    root: Path,
+    stamp: StampRow,
+) -> CacheRows:
+    rows: CacheRows = _list_rows(root)
+    parent: str = str(root)
+
+    _delete_removed(connection, root, rows)
+
+    connection.execute(_get_delete_entries(), (parent,))
+    connection.executemany(
+        _get_insert_entries(),
+        [(parent, *row) for row in rows],
+    )
+    connection.execute(_get_insert_directory(), (parent, *stamp))
+
+    return rows
+
+
+def _get_rows(
+    connection: Connection,
+    root: Path,
+    stamp: StampRow | None,
+) -> CacheRows:
+    if stamp is None:
+        _delete_tree(connection, root)
+        return []
+
+    if _select_stamp(connection, root) == stamp:
+        return _select_rows(connection, root)
+
+    return _update_rows(connection, root, stamp)
+
+
+def _match_row(
+    row: CacheRow,
+    file: bool,
+    directory: bool,
+    suffix: str,
+) -> bool:
+    if row[1]:
+        return directory
+
+    if file and not directory:
+        return fnmatch(row[0], "*." + suffix)
+
+    return file
+
+
+def _inside_depth(depth: int, current: int) -> bool:
+    return depth in {0, current}
+
+
+def _below_depth(depth: int, current: int) -> bool:
+    return (depth == 0) or (current < depth)
+
+
+def _get_child_stamp(path: Path, row: CacheRow) -> StampRow | None:
+    if row[1]:
+        return _get_stamp(path)
+
+    return None
+
+
+def _refresh_row(row: CacheRow, stamp: StampRow | None) -> CacheRow:
+    # Listing of parent isn't searched again when only child is changed.
+    if stamp is None:
+        return row
+
+    return row[0], row[1], stamp[0], row[3]
+
+
+def _scan_rows(
+    connection: Connection,
+    root: Path,
+    walk_filter: WalkFilter,
+    stamp: StampRow | None,
+    current: int = 1,
+) -> CacheGene:
+    depth, file, directory, suffix = walk_filter
+
+    for cached in _get_rows(connection, root, stamp):
+        path = Path(root, cached[0])
+        child: StampRow | None = _get_child_stamp(path, cached)
+        row: CacheRow = _refresh_row(cached, child)
+
+        if _inside_depth(depth, current) and _match_row(
+            row,
+            file,
+            directory,
+            suffix,
+        ):
+            yield path, row
+
+        if _below_depth(depth, current) and row[1]:
+            yield from _scan_rows(
+                connection,
+                path,
+                walk_filter,
+                child,
+                current + 1,
+            )
+
+
+class CacheDirectory:
+    """Class to get list of contents in the directory by persistent cache.
+
+    Listing and status of each directory are stored to SQLite database.
+    They are reused while update time and inode of the directory are same,
+        so only changed directories are searched again.
+
+    Update time of directory isn't changed if existing file is overwritten,
+        so cached status of the file may be old in that case.
+    Update time of each directory is taken from the directory itself,
+        because it isn't reflected to listing of its parent directory.
+    Cache of directory which is removed is deleted
+        when its parent directory is searched again.
+
+    """
+
+    def _initialize_paths(self, cache_path: Path) -> None:
+        self._cache_path: Path = cache_path
+
+    def _initialize_database(self) -> None:
+        with closing(connect(self._cache_path)) as connection, connection:
+            _initialize_tables(connection)
+
+    def _walk_rows(self, root: Path, walk_filter: WalkFilter) -> CacheGene:
+        with closing(connect(self._cache_path)) as connection, connection:
+            yield from _scan_rows(
+                connection,
+                root,
+                walk_filter,
+                _get_stamp(root),
+            )
+
+    def walk(
+        self,
+        root: Path,
+        depth: int = 0,
+        file: bool = True,
+        directory: bool = True,
+        suffix: str = "*",
+    ) -> PathGene:
+        """Get list of contents in the directory you search by cache.
+
+        Args:
+            root (Path): Path of directory you  want to get contents.
+
+            depth (int, optional): Defaults to 0.
+                It's used for argument "depth" of function "walk_iterator".
+
+            file (bool, optional): Defaults to True.
+                It's used for argument "file" of function "walk_iterator".
+
+            directory (bool, optional): Defaults to True.
+                It's used for argument "directory"
+                    of function "walk_iterator".
+
+            suffix (str, optional): Defaults to "*".
+                It's used for argument "suffix" of function "walk_iterator".
+
+        Returns:
+            PathGene: Path generator, not list of Path.
+
+        """
+        if file or directory:
+            for path, _ in self._walk_rows(
+                root,
+                (depth, file, directory, suffix),
+            ):
+                yield path
+
+    def get_directory_latest(
+        self,
+        root: Path,
+        jst: bool = False,
+    ) -> TimePair:
+        """Get array of latest date time in selected directory by cache.
+
+        Result is same as function "get_directory_latest"
+            of module "get_timestamp" with function "walk_iterator".
+        Status of symbolic link is taken from its target,
+            and date time older than the valid date time isn't included.
+
+        Args:
+            root (Path): Path of directory you want to get date time inside.
+
+            jst (bool, optional): Defaults to False.
+                Return latest date time as JST time zone if it's True.
+
+        Returns:
+            TimePair: Dictionary constructed by string path
+                and latest date time.
+
+        """
+        valid: int = _get_valid_nanosecond()
+
+        return {
+            str(path): time_from_nanosecond(row[2], jst=jst)
+            for path, row in self._walk_rows(root, (0, True, True, "*"))
+            if row[2] >= valid
+        }
+
+    def __init__(self, cache_path: Path) -> None:
+        """Initialize database of cache.
+
+        Args:
+            cache_path (Path): Path of SQLite database used as cache.
+                It's created if it doesn't exist.
+
+        """
+        self._initialize_paths(cache_path)
+        self._initialize_database()
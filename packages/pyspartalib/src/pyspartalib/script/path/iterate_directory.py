@@ -2,9 +2,23 @@
 
 """Module to get list of contents in the directory you select."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatch
+from os import scandir
 from pathlib import Path
+from queue import SimpleQueue
 
-from pyspartalib.context.extension.path_context import PathGene
+from pyspartalib.context.default.string_context import Strs
+from pyspartalib.context.extension.entry_context import (
+    Entries,
+    Entry,
+    EntryBoolFunc,
+    EntryGene,
+)
+from pyspartalib.context.extension.path_context import (
+    PathBoolFunc,
+    PathGene,
+)
 
 
 def _create_filter(
@@ -52,6 +66,354 @@ def _iterate_tree(
                 yield path
 
 
+def _match_pattern(relative: Path, is_dir: bool, pattern: str) -> bool:
+    if pattern.endswith("/"):
+        if not is_dir:
+            return False
+
+        pattern = pattern.rstrip("/")
+
+    if "/" not in pattern:
+        return fnmatch(relative.name, pattern)
+
+    return relative.full_match(pattern.lstrip("/"))
+
+
+def _match_exclude(relative: Path, is_dir: bool, exclude: Strs) -> bool:
+    return any(
+        _match_pattern(relative, is_dir, pattern) for pattern in exclude
+    )
+
+
+def _create_skip(
+    root: Path,
+    prune: PathBoolFunc | None,
+    exclude: Strs | None,
+) -> EntryBoolFunc | None:
+    if prune is None and exclude is None:
+        return None
+
+    def skip(entry: Entry) -> bool:
+        path = Path(entry.path)
+        is_dir: bool = entry.is_dir()
+
+        if exclude is not None and _match_exclude(
+            path.relative_to(root),
+            is_dir,
+            exclude,
+        ):
+            return True
+
+        return is_dir and prune is not None and prune(path)
+
+    return skip
+
+
+def _match_entry(
+    entry: Entry,
+    file: bool,
+    directory: bool,
+    suffix: str,
+) -> bool:
+    if entry.is_dir():
+        return directory
+
+    if file and not directory:
+        return fnmatch(entry.name, "*." + suffix)
+
+    return file
+
+
+def _inside_depth(depth: int, current: int) -> bool:
+    return depth in {0, current}
+
+
+def _below_depth(depth: int, current: int) -> bool:
+    return (depth == 0) or (current < depth)
+
+
+def _get_identity(entry: Entry) -> tuple[int, int]:
+    status = entry.stat()
+    return status.st_dev, status.st_ino
+
+
+def _get_linked(
+    entry: Entry,
+    follow_symlinks: bool,
+    linked: frozenset[tuple[int, int]],
+) -> frozenset[tuple[int, int]] | None:
+    if not entry.is_dir(follow_symlinks=follow_symlinks):
+        return None
+
+    if not entry.is_symlink():
+        return linked
+
+    # Each link target is entered once to avoid infinite loop.
+    identity: tuple[int, int] = _get_identity(entry)
+
+    return None if identity in linked else linked | {identity}
+
+
+def _scan_tree(
+    root: Path,
+    walk_filter: tuple[int, bool, bool, str],
+    skip: EntryBoolFunc | None,
+    follow_symlinks: bool,
+    current: int = 1,
+    linked: frozenset[tuple[int, int]] = frozenset(),
+) -> EntryGene:
+    depth, file, directory, suffix = walk_filter
+
+    try:
+        entries = scandir(root)
+    except OSError:  # Same as glob, unreadable directory is ignored.
+        return
+
+    with entries:
+        for entry in entries:
+            if skip is not None and skip(entry):
+                continue
+
+            if _inside_depth(depth, current) and _match_entry(
+                entry,
+                file,
+                directory,
+                suffix,
+            ):
+                yield entry
+
+            if _below_depth(depth, current) and (
+                (child := _get_linked(entry, follow_symlinks, linked))
+                is not None
+            ):
+                yield from _scan_tree(
+                    Path(entry.path),
+                    walk_filter,
+                    skip,
+                    follow_symlinks,
+                    current=current + 1,
+                    linked=child,
+                )
+
+
+def walk_entries(
+    root: Path,
+    depth: int = 0,
+    file: bool = True,
+    directory: bool = True,
+    suffix: str = "*",
+    prune: PathBoolFunc | None = None,
+    exclude: Strs | None = None,
+    follow_symlinks: bool = True,
+) -> EntryGene:
+    """Get list of contents in the directory you search as "DirEntry".
+
+    Contents are listed by "os.scandir" instead of glob filter.
+    Type and status of each content are cached by "DirEntry",
+        so you can get them without accessing to file system again.
+    Directory which can't be read is ignored as same as glob filter.
+
+    Args:
+        root (Path): Path of directory you  want to get contents.
+
+        depth (int, optional): Defaults to 0.
+            It's used for argument "depth" of function "walk_iterator".
+
+        file (bool, optional): Defaults to True.
+            It's used for argument "file" of function "walk_iterator".
+
+        directory (bool, optional): Defaults to True.
+            It's used for argument "directory" of function "walk_iterator".
+
+        suffix (str, optional): Defaults to "*".
+            It's used for argument "suffix" of function "walk_iterator".
+
+        prune (PathBoolFunc | None, optional): Defaults to None.
+            It's used for argument "prune" of function "walk_iterator".
+
+        exclude (Strs | None, optional): Defaults to None.
+            It's used for argument "exclude" of function "walk_iterator".
+
+        follow_symlinks (bool, optional): Defaults to True.
+            If it's True, contents of symbolic link to directory are searched.
+            Each target of the link is searched once in single hierarchy,
+                so link to parent directory doesn't cause infinite loop.
+            If it's False, symbolic link is returned but not searched.
+
+    Returns:
+        EntryGene: DirEntry generator, not list of DirEntry.
+
+    """
+    if file or directory:
+        yield from _scan_tree(
+            root,
+            (depth, file, directory, suffix),
+            _create_skip(root, prune, exclude),
+            follow_symlinks,
+        )
+
+
+def _get_entry_name(entry: Entry) -> str:
+    return entry.name
+
+
+def _is_branch(entry: Entry) -> bool:
+    return entry.is_dir(follow_symlinks=False)
+
+
+def _list_directory(root: Path, ordered: bool) -> Entries:
+    try:
+        with scandir(root) as entries:
+            listed: Entries = list(entries)
+    except OSError:  # Same as glob, unreadable directory is ignored.
+        return []
+
+    return sorted(listed, key=_get_entry_name) if ordered else listed
+
+
+def _scan_ordered(
+    executor: ThreadPoolExecutor,
+    listed: Future[Entries],
+    current: int,
+    walk_filter: tuple[int, bool, bool, str],
+) -> PathGene:
+    depth, file, directory, suffix = walk_filter
+    children: dict[str, Future[Entries]] = {}
+
+    for entry in (entries := listed.result()):
+        if _below_depth(depth, current) and _is_branch(entry):
+            children[entry.path] = executor.submit(
+                _list_directory,
+                Path(entry.path),
+                True,
+            )
+
+    for entry in entries:
+        if _inside_depth(depth, current) and _match_entry(
+            entry,
+            file,
+            directory,
+            suffix,
+        ):
+            yield Path(entry.path)
+
+        if entry.path in children:
+            yield from _scan_ordered(
+                executor,
+                children[entry.path],
+                current + 1,
+                walk_filter,
+            )
+
+
+def _put_listed(
+    queue: SimpleQueue[tuple[Entries, int]],
+    root: Path,
+    current: int,
+) -> None:
+    queue.put((_list_directory(root, False), current))
+
+
+def _scan_unordered(
+    executor: ThreadPoolExecutor,
+    root: Path,
+    walk_filter: tuple[int, bool, bool, str],
+) -> PathGene:
+    depth, file, directory, suffix = walk_filter
+    queue: SimpleQueue[tuple[Entries, int]] = SimpleQueue()
+
+    executor.submit(_put_listed, queue, root, 1)
+    pending: int = 1
+
+    while pending > 0:
+        entries, current = queue.get()
+        pending -= 1
+
+        for entry in entries:
+            if _below_depth(depth, current) and _is_branch(entry):
+                executor.submit(
+                    _put_listed,
+                    queue,
+                    Path(entry.path),
+                    current + 1,
+                )
+                pending += 1
+
+            if _inside_depth(depth, current) and _match_entry(
+                entry,
+                file,
+                directory,
+                suffix,
+            ):
+                yield Path(entry.path)
+
+
+def walk_parallel(
+    root: Path,
+    depth: int = 0,
+    file: bool = True,
+    directory: bool = True,
+    suffix: str = "*",
+    parallel: int = 0,
+    ordered: bool = True,
+) -> PathGene:
+    """Get list of contents in the directory you search by multiple threads.
+
+    Each directory is listed by a thread in thread pool,
+        so it's effective if listing directory takes long time
+        like network drive.
+
+    Args:
+        root (Path): Path of directory you  want to get contents.
+
+        depth (int, optional): Defaults to 0.
+            It's used for argument "depth" of function "walk_iterator".
+
+        file (bool, optional): Defaults to True.
+            It's used for argument "file" of function "walk_iterator".
+
+        directory (bool, optional): Defaults to True.
+            It's used for argument "directory" of function "walk_iterator".
+
+        suffix (str, optional): Defaults to "*".
+            It's used for argument "suffix" of function "walk_iterator".
+
+        parallel (int, optional): Defaults to 0.
+            Maximum number of threads used for listing directories.
+            If it's 0, default number of class "ThreadPoolExecutor" is used.
+
+        ordered (bool, optional): Defaults to True.
+            If it's True, contents are returned in same order every time.
+            Contents of each directory are sorted by name,
+                and each subdirectory is followed by its own contents.
+            If it's False, contents are returned as soon as listed.
+
+    Returns:
+        PathGene: Path generator, not list of Path.
+
+    """
+    if not file and not directory:
+        return
+
+    walk_filter: tuple[int, bool, bool, str] = (depth, file, directory, suffix)
+    executor = ThreadPoolExecutor(
+        max_workers=parallel if parallel > 0 else None,
+    )
+
+    try:
+        if ordered:
+            yield from _scan_ordered(
+                executor,
+                executor.submit(_list_directory, root, True),
+                1,
+                walk_filter,
+            )
+        else:
+            yield from _scan_unordered(executor, root, walk_filter)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
 def walk_iterator(
     root: Path,
     depth: int = 0,
@@ -59,6 +421,8 @@ def walk_iterator(
     directory: bool = True,
     suffix: str = "*",
     glob_filter: str | None = None,
+    prune: PathBoolFunc | None = None,
+    exclude: Strs | None = None,
 ) -> PathGene:
     """Get list of contents in the directory you search.
 
@@ -84,8 +448,48 @@ def walk_iterator(
             If it's not default, following argument are ignored.
             ("depth", "file", "directory", and "suffix")
 
+        prune (PathBoolFunc | None, optional): Defaults to None.
+            Function called with path of each directory.
+            If it returns True, the directory and its contents are skipped
+                without searching inside the directory.
+
+        exclude (Strs | None, optional): Defaults to None.
+            List of patterns to skip file and directory like ".gitignore".
+            Contents of skipped directory aren't searched.
+            Pattern including "/" is matched with relative path from "root".
+            Otherwise, pattern is matched with name in any hierarchy.
+            Pattern ending with "/" is matched with only directory.
+
+    e.g., both ".git" directory and ".venv" directory aren't searched.
+
+        walk_iterator(root, exclude=[".git/", ".venv/", "*.pyc"])
+
+    Argument "glob_filter" is ignored if "prune" or "exclude" is selected.
+    As same as glob filter, symbolic link to directory is searched
+        only if "depth" isn't 0.
+
     Returns:
         PathGene: Path generator, not list of Path.
 
     """
-    yield from _iterate_tree(root, depth, file, directory, suffix, glob_filter)
+    if prune is None and exclude is None:
+        yield from _iterate_tree(
+            root,
+            depth,
+            file,
+            directory,
+            suffix,
+            glob_filter,
+        )
+    else:
+        for entry in walk_entries(
+            root,
+            depth,
+            file,
+            directory,
+            suffix,
+            prune,
+            exclude,
+            follow_symlinks=depth > 0,
+        ):
+            yield Path(entry.path)
@@ -2,8 +2,12 @@
 
 """Module to convert path to avoid existing path."""
 
+from os import scandir
 from pathlib import Path
 
+from pyspartalib.context.default.integer_context import IntPair
+from pyspartalib.context.default.string_context import StrSet, StrSetPair
+
 
 def get_avoid_path(path: Path) -> Path:
     """Convert path to avoid existing path.
@@ -40,3 +44,73 @@ def get_avoid_path(path: Path) -> Path:
         path = path.with_stem(path.stem + "_")
 
     return path
+
+
+def _list_names(root: Path) -> StrSet:
+    try:
+        with scandir(root) as entries:
+            return {entry.name for entry in entries}
+    except OSError:  # Parent directory which doesn't exist has no names.
+        return set()
+
+
+def _get_count(counts: IntPair, count_key: str) -> int:
+    return counts.get(count_key, 0)
+
+
+def _get_name(path: Path, count: int) -> str:
+    return path.stem + ("_" * count) + path.suffix
+
+
+class AvoidPath:
+    """Class to convert many paths to avoid existing path at once.
+
+    Naming rule is same as function "get_avoid_path",
+        so under bars are added to back of the stem.
+
+    Contents of each parent directory are listed just once,
+        and converted names are kept on memory as taken names.
+    Number of under bars for each name is also kept,
+        so checking from the name without under bar isn't repeated.
+
+    Paths created by others after listing the parent directory
+        aren't considered, and file system is treated as case sensitive.
+    """
+
+    def _initialize_variables(self) -> None:
+        self._taken: StrSetPair = {}
+        self._counts: IntPair = {}
+
+    def _get_taken(self, root: Path) -> StrSet:
+        root_text: str = str(root)
+
+        if root_text not in self._taken:
+            self._taken[root_text] = _list_names(root)
+
+        return self._taken[root_text]
+
+    def get_avoid_path(self, path: Path) -> Path:
+        """Convert path to avoid existing path and converted paths.
+
+        Args:
+            path (Path): Path you want to convert with avoiding existing path.
+
+        Returns:
+            Path: Path to avoid override of path.
+
+        """
+        taken: StrSet = self._get_taken(path.parent)
+        count_key: str = str(path)
+        count: int = _get_count(self._counts, count_key)
+
+        while (name := _get_name(path, count)) in taken:
+            count += 1
+
+        taken.add(name)
+        self._counts[count_key] = count
+
+        return Path(path.parent, name)
+
+    def __init__(self) -> None:
+        """Initialize names which are already taken."""
+        self._initialize_variables()
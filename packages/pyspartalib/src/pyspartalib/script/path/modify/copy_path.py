@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+
+"""Module to copy file or directory by fastest way of file system."""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from shutil import SpecialFileError, copyfileobj, copystat
+from stat import S_ISREG
+
+from pyspartalib.context.extension.entry_context import Entry
+from pyspartalib.context.extension.path_context import PathPair, Paths
+from pyspartalib.script.path.iterate_directory import walk_entries
+from pyspartalib.script.platform.platform_status import is_platform_linux
+
+if sys.platform == "linux":
+    from fcntl import ioctl
+
+
+def _get_reflink() -> int:
+    return 0x40049409  # Request code "FICLONE" of Linux.
+
+
+def _get_range_size() -> int:
+    return 2**30  # 1GB
+
+
+def _get_buffer_size() -> int:
+    return 2**20  # 1MB
+
+
+def _clone_file(source_file: int, destination_file: int) -> bool:
+    if not is_platform_linux():
+        return False
+
+    try:
+        ioctl(destination_file, _get_reflink(), source_file)
+    except OSError:  # File system doesn't support copy-on-write.
+        return False
+
+    return True
+
+
+def _can_copy_range() -> bool:
+    # It's unavailable if Python is built with old C library.
+    return is_platform_linux() and hasattr(os, "copy_file_range")
+
+
+def _copy_chunk(source_file: int, destination_file: int) -> int:
+    return os.copy_file_range(source_file, destination_file, _get_range_size())
+
+
+def _copy_range(source_file: int, destination_file: int) -> bool:
+    if not _can_copy_range():
+        return False
+
+    try:
+        # Pseudo file system like procfs reports nothing though data exists.
+        if _copy_chunk(source_file, destination_file) == 0:
+            return False
+
+        while _copy_chunk(source_file, destination_file):
+            pass
+    except OSError:  # Rest of contents is copied by buffered copy.
+        return False
+
+    return True
+
+
+def _is_regular(path: Path) -> bool:
+    return S_ISREG(path.stat().st_mode)
+
+
+def _resolve_destination(source_path: Path, destination_path: Path) -> Path:
+    if destination_path.is_dir():
+        return Path(destination_path, source_path.name)
+
+    return destination_path
+
+
+def copy_file(source_path: Path, destination_path: Path) -> Path:
+    """Copy single file and its status by fastest way of file system.
+
+    Contents are shared by reflink if file system supports copy-on-write.
+    If not, they are copied inside kernel by "os.copy_file_range",
+        and buffered copy is used as the last resort.
+
+    Args:
+        source_path (Path): Path of file you want to copy.
+
+        destination_path (Path): Path which is copy destination.
+            If it's directory, file is copied into it
+                as same as function "shutil.copy2".
+
+    Returns:
+        Path: Final destination copied path.
+
+    Special file such as named pipe can't be copied
+        as same as function "shutil.copy2",
+        because reading it may be blocked forever.
+
+    """
+    if not _is_regular(source_path):
+        raise SpecialFileError(source_path)
+
+    destination_path = _resolve_destination(source_path, destination_path)
+
+    with (
+        source_path.open(mode="rb", buffering=0) as source_file,
+        destination_path.open(mode="wb", buffering=0) as destination_file,
+    ):
+        source_number: int = source_file.fileno()
+        destination_number: int = destination_file.fileno()
+
+        if not (
+            _clone_file(source_number, destination_number)
+            or _copy_range(source_number, destination_number)
+        ):
+            copyfileobj(source_file, destination_file, _get_buffer_size())
+
+    copystat(source_path, destination_path)
+
+    return destination_path
+
+
+def _get_destination(
+    entry: Entry,
+    source_root: Path,
+    destination_root: Path,
+) -> Path:
+    return Path(destination_root, Path(entry.path).relative_to(source_root))
+
+
+def _is_directory(entry: Entry) -> bool:
+    return entry.is_dir()
+
+
+def _copy_entries(
+    source_paths: Paths,
+    destination_paths: Paths,
+    parallel: int,
+) -> None:
+    if parallel > 0:
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            list(executor.map(copy_file, source_paths, destination_paths))
+    else:
+        for source_path, destination_path in zip(
+            source_paths,
+            destination_paths,
+            strict=True,
+        ):
+            copy_file(source_path, destination_path)
+
+
+def _copy_directories(directories: PathPair) -> None:
+    for source_text, destination_path in reversed(directories.items()):
+        copystat(source_text, destination_path)
+
+
+def copy_tree(
+    source_root: Path,
+    destination_root: Path,
+    parallel: int = 0,
+) -> PathPair:
+    """Copy directory tree by fastest way of file system.
+
+    All directories are created before copying files,
+        so files can be copied concurrently by multiple threads.
+    Each file is copied by function "copy_file".
+    As same as function "shutil.copytree" with default arguments,
+        contents of symbolic link are copied instead of the link itself.
+    Status of directories is copied after all files are copied,
+        because copying files updates them.
+
+    Args:
+        source_root (Path): Path of directory you want to copy.
+
+        destination_root (Path): Path which is copy destination.
+            Error is raised if it already exists
+                as same as function "shutil.copytree".
+
+        parallel (int, optional): Defaults to 0.
+            Number of threads used for copying files.
+            If it's 0, all files are copied by current thread.
+
+    Returns:
+        PathPair: Dictionary constructed by string path of source file
+            and path of copied file.
+
+    """
+    destination_root.mkdir(parents=True)
+
+    directories: PathPair = {str(source_root): destination_root}
+    files: PathPair = {}
+
+    for entry in walk_entries(source_root):
+        destination_path: Path = _get_destination(
+            entry,
+            source_root,
+            destination_root,
+        )
+
+        if _is_directory(entry):
+            destination_path.mkdir()
+            directories[entry.path] = destination_path
+        else:
+            files[entry.path] = destination_path
+
+    _copy_entries(
+        [Path(source_text) for source_text in files],
+        list(files.values()),
+        parallel,
+    )
+    _copy_directories(directories)
+
+    return files
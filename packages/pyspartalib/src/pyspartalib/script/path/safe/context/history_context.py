@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+"""User defined types about history of file operation."""
+
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import TypedDict
+
+from pyspartalib.context.extension.path_context import PathPair
+
+
+class HistoryRecord(TypedDict):
+    """Class to represent single line of history of file operation.
+
+    Sequence number starts from 0, and increases by each line.
+    History is pair of "source.path" and "destination.path".
+    """
+
+    sequence: int
+    key: str
+    history: PathPair
+
+
+class ObjectStatus(TypedDict):
+    """Class to represent status of file linked to deduplicated object.
+
+    Files with same contents share single object,
+        so their own permission and date time are kept separately.
+    Date time is represented by nanosecond.
+    """
+
+    object: Path
+    mode: int
+    access: int
+    update: int
+
+
+HistoryGene = Generator[HistoryRecord]
+HistoryArray = list[PathPair]
+HistoryPairGene = Generator[PathPair]
+HistoryArrayGene = Generator[HistoryArray]
+ProgressFunc = Callable[[int, int], None]
+
+HistoryGroup = dict[str, HistoryArray]
+HistoryArray2 = list[HistoryArray]
+
+ObjectStatusPair = dict[str, ObjectStatus]
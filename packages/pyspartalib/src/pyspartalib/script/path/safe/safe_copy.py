@@ -3,15 +3,32 @@
 """Module to copy file or directory and log history."""
 
 from pathlib import Path
-from shutil import copy2, copytree
 
+from pyspartalib.context.extension.path_context import PathPair
 from pyspartalib.script.path.modify.avoid_duplication import get_avoid_path
+from pyspartalib.script.path.modify.copy_path import copy_file, copy_tree
 from pyspartalib.script.path.safe.safe_file_history import FileHistory
 
 
 class SafeCopy(FileHistory):
     """Class to copy file or directory and log history."""
 
+    def _get_destination(
+        self,
+        destination_path: Path,
+        override: bool,
+    ) -> Path:
+        if override:
+            return get_avoid_path(destination_path)
+
+        return destination_path
+
+    def _add_history_files(self, files: PathPair) -> None:
+        self.add_history_at_once(
+            [Path(source_text) for source_text in files],
+            list(files.values()),
+        )
+
     def copy(
         self,
         source_path: Path,
@@ -33,14 +50,45 @@ class SafeCopy(FileHistory):
             Path: Final destination copied path.
 
         """
-        if override:
-            destination_path = get_avoid_path(destination_path)
+        destination_path = self._get_destination(destination_path, override)
 
         if source_path.is_dir():
-            copytree(source_path, destination_path)
+            copy_tree(source_path, destination_path)
         else:
-            copy2(source_path, destination_path)
+            copy_file(source_path, destination_path)
 
         self.add_history(source_path, destination_path)
 
         return destination_path
+
+    def copy_tree(
+        self,
+        source_path: Path,
+        destination_path: Path,
+        override: bool = False,
+        parallel: int = 0,
+    ) -> Path:
+        """Copy directory by multiple threads and log history of each file.
+
+        Args:
+            source_path (Path): Path of directory you want to copy.
+
+            destination_path (Path): Path which is copy destination.
+
+            override (bool, optional): Defaults to False.
+                It's used for argument "override" of method "copy".
+
+            parallel (int, optional): Defaults to 0.
+                It's used for argument "parallel" of function "copy_tree".
+
+        Returns:
+            Path: Final destination copied path.
+
+        """
+        destination_path = self._get_destination(destination_path, override)
+
+        self._add_history_files(
+            copy_tree(source_path, destination_path, parallel=parallel),
+        )
+
+        return destination_path
@@ -2,17 +2,33 @@
 
 """Module to record paths which is source and destination pair."""
 
-from copy import deepcopy
-from itertools import count
 from pathlib import Path
-
-from pyspartalib.context.extension.path_context import PathPair2
+from typing import NoReturn
+
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.extension.path_context import (
+    PathPair,
+    PathPair2,
+    Paths,
+)
 from pyspartalib.script.directory.working.working_space import WorkSpace
 from pyspartalib.script.file.json.convert_to_json import multiple2_to_json
 from pyspartalib.script.file.json.export_json import json_export
+from pyspartalib.script.path.safe.safe_history_log import HistoryLog
 from pyspartalib.script.time.stamp.current_datetime import get_current_time
 
 
+def _raise_error(message: str) -> NoReturn:
+    raise ValueError(message)
+
+
+def _none_error(result: Type | None) -> Type:
+    if result is None:
+        _raise_error("history")
+
+    return result
+
+
 class FileHistory(WorkSpace):
     """Class to record paths which is source and destination pair.
 
@@ -30,46 +46,87 @@ class FileHistory(WorkSpace):
         history_root: Path | None,
         override: bool,
         jst: bool,
+        stream: bool,
     ) -> None:
         self._still_removed: bool = False
+        self._stream: bool = stream
         self._history: PathPair2 = {}
+        self._history_log: HistoryLog | None = None
         self._history_path: Path | None = None
+        self._key_time: str = ""
+        self._key_index: int = 0
         self._history_root: Path = self.create_date_time_space(
             body_root=history_root,
             override=override,
             jst=jst,
         )
 
+    def _get_history_suffix(self) -> str:
+        return ".jsonl" if self._stream else ".json"
+
     def _update_history_path(self) -> None:
         self._history_path = Path(
             self._history_root,
-            self._get_key_time() + ".json",
+            self._get_key_time() + self._get_history_suffix(),
         )
 
     def _export_history(self, history: PathPair2) -> None:
         if history_path := self.get_history_path():
             json_export(history_path, multiple2_to_json(history))
 
+    def _get_key_index(self, time: str) -> int:
+        if time == self._key_time:
+            self._key_index += 1
+        else:
+            self._key_time = time
+            self._key_index = 0
+
+        return self._key_index
+
     def _get_key_time(self) -> str:
         time: str = get_current_time(jst=True).isoformat()
 
-        for i in count():
-            time_index: str = time + "_" + str(i).zfill(4)
+        while True:  # Same key is found only if clock is turned back.
+            time_index: str = (
+                time + "_" + str(self._get_key_index(time)).zfill(4)
+            )
 
             if time_index not in self._history:
                 return time_index
 
-        return ""
+    def _get_history_pair(
+        self,
+        source_path: Path,
+        destination_path: Path,
+    ) -> PathPair:
+        return {
+            "source.path": source_path,
+            "destination.path": destination_path,
+        }
 
     def _clear_history(self) -> PathPair2 | None:
         if len(self._history) == 0:
             return None
 
-        history: PathPair2 = deepcopy(self._history)
-        self._history.clear()
+        history: PathPair2 = self._history
+        self._history = {}
 
         return history
 
+    def _get_history_log(self) -> HistoryLog:
+        if self._history_log is None:
+            self._update_history_path()
+            self._history_log = HistoryLog(
+                _none_error(self.get_history_path()),
+            )
+
+        return self._history_log
+
+    def _close_history_log(self) -> None:
+        if self._history_log is not None:
+            self._history_log.close_history()
+            self._history_log = None
+
     def _finalize_history(self) -> PathPair2 | None:
         history: PathPair2 | None = self.get_history()
 
@@ -98,10 +155,19 @@ class FileHistory(WorkSpace):
     def get_history(self) -> PathPair2 | None:
         """Get and initialize the history of file operation.
 
+        If argument "stream" is True when initializing,
+            file of the history is closed and "None" is always returned.
+        The history can be read by function "read_history"
+            with the path returned by method "get_history_path".
+
         Returns:
             PathPair2 | None: The history of file operation until current.
 
         """
+        if self._stream:
+            self._close_history_log()
+            return None
+
         if history := self._clear_history():
             self._update_history_path()
             self._export_history(history)
@@ -119,11 +185,50 @@ class FileHistory(WorkSpace):
                 Path witch is about "destination" of file operation.
 
         """
-        self._history[self._get_key_time()] = {
-            "source.path": source_path,
-            "destination.path": destination_path,
+        key: str = self._get_key_time()
+        history: PathPair = self._get_history_pair(
+            source_path,
+            destination_path,
+        )
+
+        if self._stream:
+            self._get_history_log().add_history(key, history)
+        else:
+            self._history[key] = history
+
+    def add_history_at_once(
+        self,
+        source_paths: Paths,
+        destination_paths: Paths,
+    ) -> None:
+        """Record multiple paths which are source and destination pairs.
+
+        If argument "stream" is True when initializing,
+            all histories are appended to file by single writing.
+
+        Args:
+            source_paths (Paths):
+                Paths which are about "source" of file operation.
+
+            destination_paths (Paths):
+                Paths which are about "destination" of file operation.
+                The order must be same as argument "source_paths".
+
+        """
+        history: PathPair2 = {
+            self._get_key_time(): self._get_history_pair(source, destination)
+            for source, destination in zip(
+                source_paths,
+                destination_paths,
+                strict=True,
+            )
         }
 
+        if self._stream:
+            self._get_history_log().add_history_at_once(history)
+        else:
+            self._history.update(history)
+
     def close_history(self) -> PathPair2 | None:
         """Close process is executed just once.
 
@@ -148,6 +253,7 @@ class FileHistory(WorkSpace):
         history_root: Path | None = None,
         override: bool = False,
         jst: bool = False,
+        stream: bool = False,
     ) -> None:
         """Initialize variables about path you want to record.
 
@@ -173,6 +279,11 @@ class FileHistory(WorkSpace):
                 It's used for argument "jst" of
                     function "create_date_time_space".
 
+            stream (bool, optional): Defaults to False.
+                If True, each history is appended to file immediately
+                    as JSON Lines format instead of keeping it on memory.
+                It's recorded by class "HistoryLog".
+
         """
         self.__initialize_super_class(working_root)
-        self.__initialize_variables(history_root, override, jst)
+        self.__initialize_variables(history_root, override, jst, stream)
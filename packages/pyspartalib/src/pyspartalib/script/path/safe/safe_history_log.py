@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+
+"""Module to record history of file operation as JSON Lines format."""
+
+from contextlib import closing
+from os import SEEK_END, fsync
+from pathlib import Path
+from typing import BinaryIO, NoReturn, TextIO
+
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.default.integer_context import Ints
+from pyspartalib.context.default.string_context import StrGene
+from pyspartalib.context.extension.path_context import PathPair, PathPair2
+from pyspartalib.context.file.json_context import Json, Jsons
+from pyspartalib.script.directory.create_parent import create_parent
+from pyspartalib.script.file.json.convert_from_json import (
+    integer_pair_from_json,
+    path_pair_from_json,
+    string_pair_from_json,
+)
+from pyspartalib.script.file.json.convert_to_json import multiple_to_json
+from pyspartalib.script.file.json.export_json import json_dump
+from pyspartalib.script.file.json.import_json import json_load
+from pyspartalib.script.inherit.inherit_with import InheritWith
+from pyspartalib.script.path.safe.context.history_context import (
+    HistoryGene,
+    HistoryRecord,
+)
+
+
+def _raise_error(message: str) -> NoReturn:
+    raise ValueError(message)
+
+
+def _none_error(result: Type | None, message: str) -> Type:
+    if result is None:
+        _raise_error(message)
+
+    return result
+
+
+def _get_encoding() -> str:
+    return "utf-8"
+
+
+def _get_chunk_size() -> int:
+    return 2**12  # 4KB
+
+
+def _merge_json(contents: Jsons) -> Json:
+    merged: dict[str, Json] = {}
+
+    for content in contents:
+        if isinstance(content, dict):
+            merged.update(content)
+
+    return merged
+
+
+def _to_line(record: HistoryRecord) -> str:
+    return (
+        json_dump(
+            _merge_json(
+                [
+                    multiple_to_json({"sequence": record["sequence"]}),
+                    multiple_to_json({"key": record["key"]}),
+                    multiple_to_json(record["history"]),
+                ],
+            ),
+            compress=True,
+        )
+        + "\n"
+    )
+
+
+def _to_record(content: Json) -> HistoryRecord:
+    return {
+        "sequence": integer_pair_from_json(content)["sequence"],
+        "key": string_pair_from_json(content)["key"],
+        "history": path_pair_from_json(content),
+    }
+
+
+def _decode_line(line: bytes) -> str:
+    return line.decode(_get_encoding())
+
+
+def _is_complete(line: bytes) -> bool:
+    return line.endswith(b"\n")
+
+
+def _is_partial(file: BinaryIO, position: int) -> bool:
+    if position == 0:
+        return False
+
+    file.seek(position - 1)
+
+    return not _is_complete(file.read(1))
+
+
+def _read_reverse(log_path: Path) -> StrGene:
+    with log_path.open(mode="rb") as file:
+        position: int = file.seek(0, SEEK_END)
+        rest: bytes = b""
+
+        # Line written partially when process is stopped is skipped.
+        partial: bool = _is_partial(file, position)
+
+        # Read backward from the end, and split complete lines only.
+        while position > 0:
+            size: int = min(position, _get_chunk_size())
+            position -= size
+
+            file.seek(position)
+            rest, *lines = (file.read(size) + rest).split(b"\n")
+
+            for line in reversed(lines):
+                if partial:
+                    partial = False
+                elif len(line.strip()) > 0:
+                    yield _decode_line(line)
+
+        if len(rest.strip()) > 0 and not partial:
+            yield _decode_line(rest)
+
+
+def _find_complete_size(log_path: Path) -> int:
+    with log_path.open(mode="rb") as file:
+        position: int = file.seek(0, SEEK_END)
+
+        while position > 0:
+            size: int = min(position, _get_chunk_size())
+            position -= size
+
+            file.seek(position)
+
+            if (index := file.read(size).rfind(b"\n")) >= 0:
+                return position + index + 1
+
+    return 0
+
+
+def _truncate_partial(log_path: Path) -> None:
+    size: int = _find_complete_size(log_path)
+
+    if size != log_path.stat().st_size:
+        with log_path.open(mode="r+b") as file:
+            file.truncate(size)
+
+
+def _read_last_line(log_path: Path) -> str:
+    with closing(_read_reverse(log_path)) as lines:
+        return next(lines, "")
+
+
+def count_history(log_path: Path) -> int:
+    """Count history of file operation recorded as JSON Lines format.
+
+    Each line is counted without converting from JSON format.
+    The last line written partially isn't counted as same as "read_history".
+
+    Args:
+        log_path (Path): Path of history recorded by class "HistoryLog".
+
+    Returns:
+        int: Number of history.
+
+    """
+    with log_path.open(mode="rb") as file:
+        return sum(
+            1 for line in file if _is_complete(line) and len(line.strip()) > 0
+        )
+
+
+def read_history_reverse(log_path: Path) -> HistoryGene:
+    """Read history of file operation from the last line to the first.
+
+    File is read backward by small chunk,
+        so whole history isn't loaded to memory as same as "read_history".
+
+    Args:
+        log_path (Path): Path of history recorded by class "HistoryLog".
+
+    Returns:
+        HistoryGene: Generator of each line of history in reverse order.
+
+    """
+    for line in _read_reverse(log_path):
+        yield _to_record(json_load(line))
+
+
+def read_history(log_path: Path) -> HistoryGene:
+    """Read history of file operation recorded as JSON Lines format.
+
+    Each line is read one by one, so whole history isn't loaded to memory.
+    The last line which doesn't end with newline is skipped,
+        because it's written partially when process is stopped.
+
+    Args:
+        log_path (Path): Path of history recorded by class "HistoryLog".
+
+    Returns:
+        HistoryGene: Generator of each line of history.
+
+    """
+    with log_path.open(encoding=_get_encoding()) as file:
+        for line in file:
+            if line.endswith("\n") and len(line.strip()) > 0:
+                yield _to_record(json_load(line))
+
+
+class HistoryLog(InheritWith):
+    """Class to record history of file operation as JSON Lines format.
+
+    Each history is appended to the end of file as single line,
+        so it's unnecessary to keep whole history on memory.
+    """
+
+    def _initialize_paths(self, log_path: Path) -> None:
+        self._log_path: Path = log_path
+
+    def _initialize_sequence(self) -> None:
+        self._sequence: int = 0
+
+        if self._log_path.exists():
+            _truncate_partial(self._log_path)
+
+        if self._log_path.exists() and (
+            len(line := _read_last_line(self._log_path)) > 0
+        ):
+            self._sequence = _to_record(json_load(line))["sequence"] + 1
+
+    def _initialize_file(self, buffer_byte: int) -> None:
+        if buffer_byte == 0:
+            buffer_byte = 2**16  # 64KB
+
+        create_parent(self._log_path)
+
+        self._file: TextIO | None = self._log_path.open(
+            mode="a",
+            encoding=_get_encoding(),
+            buffering=buffer_byte,
+        )
+
+    def _close_file(self, file: TextIO) -> None:
+        file.flush()
+        fsync(file.fileno())
+        file.close()
+
+    def get_log_path(self) -> Path:
+        """Get path of file which contain the history of file operation.
+
+        Returns:
+            Path: Path of file operation history.
+
+        """
+        return self._log_path
+
+    def add_history(self, key: str, history: PathPair) -> int:
+        """Append single history of file operation.
+
+        Args:
+            key (str): Key string to identify the history.
+
+            history (PathPair): Pair of "source.path" and "destination.path".
+
+        Returns:
+            int: Sequence number of the history.
+
+        """
+        sequence: int = self._sequence
+
+        _none_error(self._file, "closed").write(
+            _to_line({"sequence": sequence, "key": key, "history": history}),
+        )
+        self._sequence += 1
+
+        return sequence
+
+    def add_history_at_once(self, history: PathPair2) -> Ints:
+        """Append multiple histories of file operation by single writing.
+
+        Args:
+            history (PathPair2): Dictionary constructed by key string
+                and pair of "source.path" and "destination.path".
+
+        Returns:
+            Ints: Sequence numbers of each history.
+
+        """
+        sequences: Ints = list(
+            range(self._sequence, self._sequence + len(history)),
+        )
+
+        _none_error(self._file, "closed").write(
+            "".join(
+                _to_line({"sequence": sequence, "key": key, "history": pair})
+                for sequence, (key, pair) in zip(
+                    sequences,
+                    history.items(),
+                    strict=True,
+                )
+            ),
+        )
+        self._sequence += len(sequences)
+
+        return sequences
+
+    def close_history(self) -> Path:
+        """Write buffered history to storage device and close the file.
+
+        Returns:
+            Path: Path of file operation history.
+
+        """
+        if self._file is not None:
+            self._close_file(self._file)
+            self._file = None
+
+        return self._log_path
+
+    def exit(self) -> None:
+        """Close the file when leaving from With statement."""
+        self.close_history()
+
+    def __del__(self) -> None:
+        """Close the file if it's still open."""
+        if hasattr(self, "_file"):  # Initializing may fail before opening.
+            self.close_history()
+
+    def __init__(self, log_path: Path, buffer_byte: int = 0) -> None:
+        """Initialize file to record history.
+
+        Args:
+            log_path (Path): Path of file to record history.
+                If it already exists, history is appended to the end,
+                    and sequence number continues from the last line.
+                Only the last line is read, so opening is fast
+                    even if the file contains long history.
+                The last line written partially is removed before appending.
+
+            buffer_byte (int, optional): Defaults to 0.
+                Size of buffer used for writing history.
+                If it's 0, 64KB is used as buffer size.
+
+        """
+        self._initialize_paths(log_path)
+        self._initialize_sequence()
+        self._initialize_file(buffer_byte)
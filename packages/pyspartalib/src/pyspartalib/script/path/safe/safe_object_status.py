@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+"""Module to record status of files linked to deduplicated objects."""
+
+from contextlib import closing
+from pathlib import Path
+from sqlite3 import Connection, connect
+
+from pyspartalib.context.extension.path_context import Paths
+from pyspartalib.script.directory.create_directory import create_directory
+from pyspartalib.script.path.safe.context.history_context import (
+    ObjectStatus,
+    ObjectStatusPair,
+)
+
+StatusRow = tuple[str, str, int, int, int]
+SelectRow = tuple[str, int, int, int]
+
+
+def _get_create_links() -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS links (
+            path TEXT PRIMARY KEY,
+            object TEXT,
+            mode INTEGER,
+            access INTEGER,
+            update_time INTEGER
+        ) WITHOUT ROWID
+    """
+
+
+def _get_insert_links() -> str:
+    return "INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?, ?)"
+
+
+def _get_select_link() -> str:
+    return "SELECT object, mode, access, update_time FROM links WHERE path = ?"
+
+
+def _select_row(connection: Connection, path: Path) -> SelectRow | None:
+    row: SelectRow | None = connection.execute(
+        _get_select_link(),
+        (str(path),),
+    ).fetchone()
+
+    return row
+
+
+def _to_status(row: SelectRow) -> ObjectStatus:
+    return {
+        "object": Path(row[0]),
+        "mode": row[1],
+        "access": row[2],
+        "update": row[3],
+    }
+
+
+def _to_row(path_text: str, statuses: ObjectStatusPair) -> StatusRow:
+    status = statuses[path_text]
+
+    return (
+        path_text,
+        str(status["object"]),
+        status["mode"],
+        status["access"],
+        status["update"],
+    )
+
+
+def get_status_path(object_root: Path) -> Path:
+    """Get path of database which contains status of linked files.
+
+    Args:
+        object_root (Path): Path of directory of unique contents
+            returned by method "get_object_root" of class "SafeTrash".
+
+    Returns:
+        Path: Path of database placed in the directory of unique contents.
+
+    """
+    return Path(object_root, "status.sqlite")
+
+
+def record_status(object_root: Path, statuses: ObjectStatusPair) -> None:
+    """Record status of files linked to deduplicated objects.
+
+    Args:
+        object_root (Path): Path of directory of unique contents
+            returned by method "get_object_root" of class "SafeTrash".
+
+        statuses (ObjectStatusPair): Dictionary constructed by
+            string path of linked file and its own status.
+
+    """
+    if len(statuses) == 0:
+        return
+
+    status_path: Path = get_status_path(create_directory(object_root))
+
+    with closing(connect(status_path)) as connection, connection:
+        connection.execute(_get_create_links())
+        connection.executemany(
+            _get_insert_links(),
+            [_to_row(path_text, statuses) for path_text in statuses],
+        )
+
+
+def read_status(object_root: Path, paths: Paths) -> ObjectStatusPair:
+    """Read status of files linked to deduplicated objects.
+
+    Args:
+        object_root (Path): Path of directory of unique contents
+            returned by method "get_object_root" of class "SafeTrash".
+
+        paths (Paths): Paths of files in trash box you want to read status.
+
+    Returns:
+        ObjectStatusPair: Dictionary constructed by string path
+            and status of file. Path which isn't recorded is ignored.
+
+    """
+    status_path: Path = get_status_path(object_root)
+    statuses: ObjectStatusPair = {}
+
+    if len(paths) == 0 or not status_path.exists():
+        return statuses
+
+    with closing(connect(status_path)) as connection:
+        for path in paths:
+            if row := _select_row(connection, path):
+                statuses[str(path)] = _to_status(row)
+
+    return statuses
@@ -0,0 +1,363 @@
+#!/usr/bin/env python
+
+"""Module to restore file or directory by replaying history."""
+
+from concurrent.futures import ThreadPoolExecutor
+from os import close, stat_result, utime
+from pathlib import Path
+from shutil import copy2, move
+from stat import S_IMODE
+from tempfile import mkstemp
+
+from pyspartalib.context.extension.path_context import (
+    PathPair,
+    PathPair2,
+    Paths,
+    PathSet,
+)
+from pyspartalib.script.directory.create_directory import create_directory
+from pyspartalib.script.file.json.convert_from_json import (
+    path_pair2_from_json,
+)
+from pyspartalib.script.file.json.import_json import json_import
+from pyspartalib.script.path.iterate_directory import walk_entries
+from pyspartalib.script.path.safe.context.history_context import (
+    HistoryArray,
+    HistoryArray2,
+    HistoryArrayGene,
+    HistoryGroup,
+    HistoryPairGene,
+    ObjectStatus,
+    ObjectStatusPair,
+    ProgressFunc,
+)
+from pyspartalib.script.path.safe.safe_file_history import FileHistory
+from pyspartalib.script.path.safe.safe_history_log import (
+    count_history,
+    read_history_reverse,
+)
+from pyspartalib.script.path.safe.safe_object_status import read_status
+
+
+def _is_stream(history_path: Path) -> bool:
+    return history_path.suffix == ".jsonl"
+
+
+def _get_run_size() -> int:
+    return 2**12
+
+
+def _read_stream(history_path: Path) -> HistoryPairGene:
+    for record in read_history_reverse(history_path):
+        yield record["history"]
+
+
+def _read_json(history: PathPair2) -> HistoryPairGene:
+    yield from reversed(history.values())
+
+
+def _read_history(history_path: Path) -> tuple[int, HistoryPairGene]:
+    if _is_stream(history_path):
+        return count_history(history_path), _read_stream(history_path)
+
+    history: PathPair2 = path_pair2_from_json(json_import(history_path))
+
+    return len(history), _read_json(history)
+
+
+def _get_source(history: PathPair) -> Path:
+    return history["source.path"]
+
+
+def _get_destination(history: PathPair) -> Path:
+    return history["destination.path"]
+
+
+def _exists(path: Path) -> bool:
+    return path.exists(follow_symlinks=False)
+
+
+def _is_restorable(history: PathPair) -> bool:
+    return _exists(_get_destination(history)) and not _exists(
+        _get_source(history),
+    )
+
+
+def _get_identity(status: stat_result) -> tuple[int, int]:
+    return status.st_dev, status.st_ino
+
+
+def _is_object(path: Path, object_path: Path) -> bool:
+    try:
+        object_status: stat_result = object_path.stat()
+    except OSError:
+        return False
+
+    return _get_identity(path.stat(follow_symlinks=False)) == _get_identity(
+        object_status,
+    )
+
+
+def _create_temporary(path: Path) -> Path:
+    file_number, temporary_path = mkstemp(suffix=".tmp", dir=path.parent)
+    close(file_number)
+
+    return Path(temporary_path)
+
+
+def _unlink_file(path: Path) -> None:
+    temporary_path: Path = _create_temporary(path)
+
+    try:
+        copy2(path, temporary_path)
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+def _apply_status(path: Path, status: ObjectStatus) -> None:
+    # Only hard link to object shares contents with trash box.
+    if _is_object(path, status["object"]):
+        _unlink_file(path)
+
+    path.chmod(S_IMODE(status["mode"]))
+    utime(path, ns=(status["access"], status["update"]))
+
+
+def _list_files(path: Path) -> Paths:
+    if path.is_dir(follow_symlinks=False):
+        return [
+            Path(entry.path)
+            for entry in walk_entries(path, follow_symlinks=False)
+            if entry.is_file(follow_symlinks=False)
+        ]
+
+    if path.is_file(follow_symlinks=False):
+        return [path]
+
+    return []
+
+
+def _get_restored(path_text: str, history: PathPair) -> Path:
+    return Path(
+        _get_source(history),
+        Path(path_text).relative_to(_get_destination(history)),
+    )
+
+
+def _split_runs(histories: HistoryPairGene) -> HistoryArrayGene:
+    run: HistoryArray = []
+    paths: PathSet = set()
+
+    for history in histories:
+        current: PathSet = set(history.values())
+
+        # Later operation on same path depends on earlier operation.
+        if not paths.isdisjoint(current) or len(run) >= _get_run_size():
+            yield run
+            run, paths = [], set()
+
+        run += [history]
+        paths |= current
+
+    if len(run) > 0:
+        yield run
+
+
+def _group_parent(histories: HistoryArray) -> HistoryGroup:
+    groups: HistoryGroup = {}
+
+    for history in histories:
+        parent_text: str = str(_get_source(history).parent)
+
+        groups.setdefault(parent_text, [])
+        groups[parent_text] += [history]
+
+    return groups
+
+
+def _get_depth(group: tuple[str, HistoryArray]) -> int:
+    return len(Path(group[0]).parts)
+
+
+def _group_depth(histories: HistoryArray) -> list[HistoryArray2]:
+    waves: dict[int, HistoryArray2] = {}
+
+    for group in sorted(_group_parent(histories).items(), key=_get_depth):
+        waves.setdefault(_get_depth(group), [])
+        waves[_get_depth(group)] += [group[1]]
+
+    return list(waves.values())
+
+
+class SafeRestore(FileHistory):
+    """Class to restore file or directory by replaying history.
+
+    History recorded by class "FileHistory" is replayed in reverse,
+        so each "destination.path" is moved back to "source.path".
+    Restoring is also recorded as history of this class.
+    """
+
+    def _initialize_progress(
+        self,
+        total: int,
+        progress: ProgressFunc | None,
+    ) -> None:
+        self._progress: ProgressFunc | None = progress
+        self._total: int = total
+        self._done: int = 0
+
+    def _initialize_objects(self, object_root: Path | None) -> None:
+        self._object_root: Path | None = object_root
+
+    def _read_status(self, path: Path) -> ObjectStatusPair:
+        if self._object_root is None:
+            return {}
+
+        return read_status(self._object_root, _list_files(path))
+
+    def _restore_path(self, history: PathPair) -> None:
+        statuses: ObjectStatusPair = self._read_status(
+            _get_destination(history),
+        )
+
+        move(_get_destination(history), _get_source(history))
+
+        for path_text, status in statuses.items():
+            _apply_status(_get_restored(path_text, history), status)
+
+    def _restore_group(self, histories: HistoryArray) -> HistoryArray:
+        create_directory(_get_source(histories[0]).parent)
+
+        for history in histories:
+            self._restore_path(history)
+
+        return histories
+
+    def _count_progress(self, count: int) -> None:
+        self._done += count
+
+        if self._progress is not None and count > 0:
+            self._progress(self._done, self._total)
+
+    def _report_progress(self, histories: HistoryArray) -> Paths:
+        self._count_progress(len(histories))
+
+        self.add_history_at_once(
+            [_get_destination(history) for history in histories],
+            [_get_source(history) for history in histories],
+        )
+
+        return [_get_source(history) for history in histories]
+
+    def _restore_wave(
+        self,
+        groups: HistoryArray2,
+        executor: ThreadPoolExecutor | None,
+    ) -> Paths:
+        restored: Paths = []
+
+        for histories in (
+            map(self._restore_group, groups)
+            if executor is None
+            else executor.map(self._restore_group, groups)
+        ):
+            restored += self._report_progress(histories)
+
+        return restored
+
+    def _restore_waves(
+        self,
+        histories: HistoryArray,
+        executor: ThreadPoolExecutor | None,
+    ) -> Paths:
+        restored: Paths = []
+
+        for groups in _group_depth(histories):
+            restored += self._restore_wave(groups, executor)
+
+        return restored
+
+    def _restore_run(
+        self,
+        histories: HistoryArray,
+        executor: ThreadPoolExecutor | None,
+    ) -> Paths:
+        restorable: HistoryArray = [
+            history for history in histories if _is_restorable(history)
+        ]
+        self._count_progress(len(histories) - len(restorable))
+
+        return self._restore_waves(restorable, executor)
+
+    def _restore_runs(
+        self,
+        histories: HistoryPairGene,
+        executor: ThreadPoolExecutor | None,
+    ) -> Paths:
+        restored: Paths = []
+
+        for run in _split_runs(histories):
+            restored += self._restore_run(run, executor)
+
+        return restored
+
+    def restore(
+        self,
+        history_path: Path,
+        parallel: int = 0,
+        progress: ProgressFunc | None = None,
+        object_root: Path | None = None,
+    ) -> Paths:
+        """Restore file or directory by replaying history in reverse.
+
+        Entries whose "destination.path" doesn't exist
+            or whose "source.path" already exists are skipped,
+            so restoring same history again does nothing.
+
+        History of JSON Lines format is read backward from the last line,
+            so whole history isn't loaded to memory.
+        It's divided into runs at each entry whose path already appears,
+            because later operation depends on earlier operation.
+        Runs are restored one by one in reverse order.
+        Entries in each run are grouped by parent directory of "source.path".
+        Each parent directory is created once,
+            and groups are restored from shallower parent directory.
+
+        Args:
+            history_path (Path): Path of history file
+                returned by method "get_history_path" of "FileHistory".
+                Both JSON and JSON Lines format are available.
+
+            parallel (int, optional): Defaults to 0.
+                Number of threads used for restoring groups
+                    whose parent directories have same depth.
+                If it's 0, all groups are restored by current thread.
+
+            progress (ProgressFunc | None, optional): Defaults to None.
+                Function called after each group is restored
+                    with number of done entries and total entries.
+                Skipped entries are also counted as done,
+                    so the number reaches total entries at the end.
+
+            object_root (Path | None, optional): Defaults to None.
+                Path of directory of unique contents
+                    returned by method "get_object_root" of "SafeTrash".
+                If it's selected, status of each file recorded
+                    when removing with deduplication is applied again.
+                Only file which is hard link to the object is copied,
+                    so restored file doesn't share contents with objects.
+
+        Returns:
+            Paths: Restored paths which are "source.path" of history.
+
+        """
+        total, histories = _read_history(history_path)
+        self._initialize_progress(total, progress)
+        self._initialize_objects(object_root)
+
+        if parallel > 0:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                return self._restore_runs(histories, executor)
+
+        return self._restore_runs(histories, None)
@@ -2,17 +2,198 @@
 
 """Module to remove file or directory and log history."""
 
+from concurrent.futures import ThreadPoolExecutor
+from errno import EXDEV
+from hashlib import file_digest
+from os import close, stat_result
 from pathlib import Path
+from shutil import copy2, copytree, move, rmtree
+from stat import S_IWGRP, S_IWOTH, S_IWUSR
+from tempfile import mkstemp
 
-from pyspartalib.context.extension.path_context import Paths
+from pyspartalib.context.extension.path_context import PathPair, Paths, PathSet
+from pyspartalib.script.directory.create_directory import create_directory
 from pyspartalib.script.directory.create_parent import create_parent
+from pyspartalib.script.path.iterate_directory import walk_entries
+from pyspartalib.script.path.modify.avoid_duplication import (
+    AvoidPath,
+    get_avoid_path,
+)
 from pyspartalib.script.path.modify.current.get_relative import (
     get_relative,
     is_relative,
 )
+from pyspartalib.script.path.safe.context.history_context import (
+    HistoryArray,
+    ObjectStatus,
+    ObjectStatusPair,
+)
+from pyspartalib.script.path.safe.safe_object_status import record_status
 from pyspartalib.script.path.safe.safe_rename import SafeRename
 
 
+def _inside_selected(path: Path, selected: PathSet) -> bool:
+    return any(parent in selected for parent in path.parents)
+
+
+def _add_listed(path: Path, listed: PathSet) -> bool:
+    if path in listed:
+        return False
+
+    listed.add(path)
+    return True
+
+
+def _select_targets(trash_paths: Paths) -> Paths:
+    selected: PathSet = {path for path in trash_paths if path.exists()}
+    listed: PathSet = set()
+
+    return [
+        path
+        for path in trash_paths
+        if (path in selected)
+        and not _inside_selected(path, selected)
+        and _add_listed(path, listed)
+    ]
+
+
+def _create_parents(destination_paths: Paths) -> None:
+    for parent in {path.parent for path in destination_paths}:
+        create_directory(parent)
+
+
+def _rename_path(source_path: Path, destination_path: Path) -> bool:
+    try:
+        source_path.rename(destination_path)
+    except OSError as error:
+        if error.errno == EXDEV:  # Source is on the other file system.
+            return False
+
+        raise
+
+    return True
+
+
+def _is_directory(path: Path) -> bool:
+    return path.is_dir() and not path.is_symlink()
+
+
+def _copy_path(source_path: Path, destination_path: Path) -> None:
+    if _is_directory(source_path):
+        copytree(source_path, destination_path, symlinks=True)
+        rmtree(source_path)
+    else:
+        copy2(source_path, destination_path, follow_symlinks=False)
+        source_path.unlink()
+
+
+def _repeat_record(record: PathPair, source_paths: Paths) -> HistoryArray:
+    return [record] * len(source_paths)
+
+
+def _copy_record(
+    source_path: Path,
+    destination_path: Path,
+    copied: PathPair,
+) -> None:
+    _copy_path(source_path, destination_path)
+    copied[str(source_path)] = destination_path
+
+
+def _copy_paths(moves: PathPair, parallel: int, copied: PathPair) -> None:
+    source_paths: Paths = [Path(path_text) for path_text in moves]
+    destination_paths: Paths = list(moves.values())
+
+    if parallel > 0:
+        # Other threads keep recording until executor is shut down.
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            list(
+                executor.map(
+                    _copy_record,
+                    source_paths,
+                    destination_paths,
+                    _repeat_record(copied, source_paths),
+                ),
+            )
+    else:
+        for source_path, destination_path in zip(
+            source_paths,
+            destination_paths,
+            strict=True,
+        ):
+            _copy_record(source_path, destination_path, copied)
+
+
+def _is_content(path: Path) -> bool:
+    return path.is_file() and not path.is_symlink()
+
+
+def _get_digest(path: Path) -> str:
+    with path.open(mode="rb") as file:
+        return file_digest(file, "blake2b").hexdigest()
+
+
+def _get_read_only(mode: int) -> int:
+    return mode & ~(S_IWUSR | S_IWGRP | S_IWOTH)
+
+
+def _create_temporary(object_path: Path) -> Path:
+    file_number, temporary_path = mkstemp(
+        suffix=".tmp",
+        dir=create_parent(object_path),
+    )
+    close(file_number)
+
+    return Path(temporary_path)
+
+
+def _store_object(source_path: Path, object_path: Path) -> None:
+    temporary_path: Path = _create_temporary(object_path)
+
+    try:
+        move(source_path, temporary_path)
+        temporary_path.chmod(_get_read_only(temporary_path.stat().st_mode))
+        temporary_path.replace(object_path)
+    finally:  # Object named by digest is always complete contents.
+        temporary_path.unlink(missing_ok=True)
+
+
+def _is_changed(path: Path, status: stat_result) -> bool:
+    current: stat_result = path.stat()
+
+    return (current.st_size, current.st_mtime_ns) != (
+        status.st_size,
+        status.st_mtime_ns,
+    )
+
+
+def _to_status(object_path: Path, status: stat_result) -> ObjectStatus:
+    return {
+        "object": object_path,
+        "mode": status.st_mode,
+        "access": status.st_atime_ns,
+        "update": status.st_mtime_ns,
+    }
+
+
+def _link_object(object_path: Path, trash_path: Path) -> None:
+    try:
+        trash_path.hardlink_to(object_path)
+    except OSError:  # File system doesn't support hard link.
+        copy2(object_path, trash_path)
+
+
+def _to_moved(source_paths: Paths, destination_paths: Paths) -> PathPair:
+    return {
+        str(source_path): destination_path
+        for source_path, destination_path in zip(
+            source_paths,
+            destination_paths,
+            strict=True,
+        )
+    }
+
+
 class SafeTrash(SafeRename):
     """Class to remove file or directory and log history."""
 
@@ -22,12 +203,14 @@ class SafeTrash(SafeRename):
         history_root: Path | None,
         override: bool,
         jst: bool,
+        stream: bool,
     ) -> None:
         super().__init__(
             working_root=working_root,
             history_root=history_root,
             override=override,
             jst=jst,
+            stream=stream,
         )
 
     def __initialize_variables(
@@ -35,21 +218,235 @@ class SafeTrash(SafeRename):
         trash_root: Path | None,
         override: bool,
         jst: bool,
+        deduplicate: bool,
     ) -> None:
+        self._deduplicate: bool = deduplicate
+        self._statuses: ObjectStatusPair = {}
+        self._object_root: Path = Path(
+            self.get_selected_root(trash_root),
+            "objects",
+        )
         self._trash_root: Path = self.create_date_time_space(
             body_root=trash_root,
             override=override,
             jst=jst,
         )
 
+    def _get_trash_path(self, target: Path, root: Path) -> Path:
+        return Path(
+            self.get_trash_root(),
+            get_relative(target, root_path=root),
+        )
+
+    def _get_relative_root(
+        self,
+        trash_path: Path,
+        relative_root: Path | None,
+    ) -> Path:
+        if (relative_root is not None) and is_relative(
+            trash_path,
+            root_path=relative_root,
+        ):
+            return relative_root
+
+        return trash_path.parent
+
+    def _get_object_path(self, source_path: Path) -> Path:
+        digest: str = _get_digest(source_path)
+        return Path(self.get_object_root(), digest[:2], digest)
+
+    def _store_file(self, source_path: Path, trash_path: Path) -> None:
+        status: stat_result = source_path.stat()
+        object_path: Path = self._get_object_path(source_path)
+
+        # Contents may be different from digest if file is changed.
+        if _is_changed(source_path, status):
+            move(source_path, trash_path)
+            return
+
+        if object_path.exists():
+            source_path.unlink()
+        else:
+            _store_object(source_path, object_path)
+
+        _link_object(object_path, trash_path)
+        self._statuses[str(trash_path)] = _to_status(object_path, status)
+
+    def _record_status(self) -> None:
+        statuses: ObjectStatusPair = self._statuses
+        self._statuses = {}
+
+        record_status(self.get_object_root(), statuses)
+
+    def _store_tree(self, source_root: Path, trash_root: Path) -> None:
+        create_directory(trash_root)
+
+        for entry in list(walk_entries(source_root, follow_symlinks=False)):
+            source_path = Path(entry.path)
+
+            self._store_path(
+                source_path,
+                Path(
+                    trash_root,
+                    get_relative(source_path, root_path=source_root),
+                ),
+            )
+
+        rmtree(source_root)  # Only empty directories are remained.
+
+    def _store_path(self, source_path: Path, trash_path: Path) -> Path:
+        if _is_directory(source_path):
+            create_directory(trash_path)
+        elif _is_content(source_path):
+            self._store_file(source_path, trash_path)
+        else:
+            move(source_path, trash_path)
+
+        return trash_path
+
+    def _store_root(self, source_path: Path, trash_path: Path) -> Path:
+        if _is_directory(source_path):
+            self._store_tree(source_path, trash_path)
+            return trash_path
+
+        return self._store_path(source_path, trash_path)
+
+    def _store_record(
+        self,
+        source_path: Path,
+        trash_path: Path,
+        stored: PathPair,
+    ) -> None:
+        stored[str(source_path)] = self._store_root(source_path, trash_path)
+
+    def _deduplicate_file(self, target: Path, trash_path: Path) -> None:
+        trash_path = get_avoid_path(trash_path)
+
+        try:
+            self._store_root(target, trash_path)
+        finally:
+            self._record_status()
+
+        self.add_history(target, trash_path)
+
     def _move_file(self, target: Path, root: Path) -> None:
         if target.exists():
-            trash_path: Path = Path(
-                self.get_trash_root(),
-                get_relative(target, root_path=root),
-            )
+            trash_path: Path = self._get_trash_path(target, root)
             create_parent(trash_path)
-            self.rename(target, trash_path, override=True)
+
+            if self._deduplicate:
+                self._deduplicate_file(target, trash_path)
+            else:
+                self.rename(target, trash_path, override=True)
+
+    def _get_destinations(
+        self,
+        source_paths: Paths,
+        relative_root: Path | None,
+    ) -> Paths:
+        avoid_path = AvoidPath()
+
+        return [
+            avoid_path.get_avoid_path(
+                self._get_trash_path(
+                    source_path,
+                    self._get_relative_root(source_path, relative_root),
+                ),
+            )
+            for source_path in source_paths
+        ]
+
+    def _rename_paths(
+        self,
+        source_paths: Paths,
+        destination_paths: Paths,
+        renamed: PathPair,
+    ) -> PathPair:
+        moves: PathPair = {}
+
+        for source_path, destination_path in zip(
+            source_paths,
+            destination_paths,
+            strict=True,
+        ):
+            if _rename_path(source_path, destination_path):
+                renamed[str(source_path)] = destination_path
+            else:
+                moves[str(source_path)] = destination_path
+
+        return moves
+
+    def _store_paths(
+        self,
+        source_paths: Paths,
+        destination_paths: Paths,
+        parallel: int,
+        stored: PathPair,
+    ) -> None:
+        if parallel > 0:
+            # Other threads keep recording until executor is shut down.
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                list(
+                    executor.map(
+                        self._store_record,
+                        source_paths,
+                        destination_paths,
+                        _repeat_record(stored, source_paths),
+                    ),
+                )
+        else:
+            for source_path, destination_path in zip(
+                source_paths,
+                destination_paths,
+                strict=True,
+            ):
+                self._store_record(source_path, destination_path, stored)
+
+    def _transfer_paths(
+        self,
+        source_paths: Paths,
+        destination_paths: Paths,
+        parallel: int,
+        moved: PathPair,
+    ) -> None:
+        if self._deduplicate:
+            try:
+                self._store_paths(
+                    source_paths,
+                    destination_paths,
+                    parallel,
+                    moved,
+                )
+            finally:
+                self._record_status()
+        else:
+            _copy_paths(
+                self._rename_paths(source_paths, destination_paths, moved),
+                parallel,
+                moved,
+            )
+
+    def _move_paths(
+        self,
+        source_paths: Paths,
+        destination_paths: Paths,
+        parallel: int,
+    ) -> None:
+        moved: PathPair = {}
+
+        try:
+            self._transfer_paths(
+                source_paths,
+                destination_paths,
+                parallel,
+                moved,
+            )
+            moved = _to_moved(source_paths, destination_paths)
+        finally:  # History is recorded even if moving is failed on the way.
+            self.add_history_at_once(
+                [Path(path_text) for path_text in moved],
+                list(moved.values()),
+            )
 
     def get_trash_root(self) -> Path:
         """Get path of internal trash box at current date time.
@@ -60,6 +457,17 @@ class SafeTrash(SafeRename):
         """
         return self._trash_root
 
+    def get_object_root(self) -> Path:
+        """Get path of directory which contains unique contents of files.
+
+        It's shared by all trash boxes created at different date time.
+
+        Returns:
+            Path: Path of directory of unique contents.
+
+        """
+        return self._object_root
+
     def trash(
         self,
         trash_path: Path,
@@ -77,15 +485,10 @@ class SafeTrash(SafeRename):
             Path: "trash_path" is returned.
 
         """
-        parent_root: Path = trash_path.parent
-
-        if relative_root is None:
-            self._move_file(trash_path, parent_root)
-
-        elif is_relative(trash_path, root_path=relative_root):
-            self._move_file(trash_path, relative_root)
-        else:
-            self._move_file(trash_path, parent_root)
+        self._move_file(
+            trash_path,
+            self._get_relative_root(trash_path, relative_root),
+        )
 
         return trash_path
 
@@ -93,9 +496,19 @@ class SafeTrash(SafeRename):
         self,
         trash_paths: Paths,
         relative_root: Path | None = None,
+        parallel: int = 0,
     ) -> Paths:
         """Remove files or directories at once, and log history.
 
+        All destination paths are decided before moving,
+            and each parent directory in trash box is created just once.
+        Paths which don't exist or are inside other selected directory
+            are ignored, because they're removed together with the parent.
+
+        Each path is moved by renaming if trash box is same file system.
+        If not, it's copied to trash box and removed after that.
+        History of all moved paths is recorded at once.
+
         Args:
             trash_paths (Paths): Paths you want to remove.
 
@@ -103,12 +516,23 @@ class SafeTrash(SafeRename):
                 Path of directory used as trash box.
                 It's used for argument "trash_root" of method "trash".
 
+            parallel (int, optional): Defaults to 0.
+                Number of threads used for copying
+                    to trash box on other file system.
+                If it's 0, all paths are copied by current thread.
+
         Returns:
             Paths: "trash_paths" is returned.
 
         """
-        for trash_path in trash_paths:
-            self.trash(trash_path, relative_root=relative_root)
+        source_paths: Paths = _select_targets(trash_paths)
+        destination_paths: Paths = self._get_destinations(
+            source_paths,
+            relative_root,
+        )
+
+        _create_parents(destination_paths)
+        self._move_paths(source_paths, destination_paths, parallel)
 
         return trash_paths
 
@@ -119,6 +543,8 @@ class SafeTrash(SafeRename):
         override: bool = False,
         jst: bool = False,
         trash_root: Path | None = None,
+        stream: bool = False,
+        deduplicate: bool = False,
     ) -> None:
         """Initialize variables and super class.
 
@@ -148,11 +574,31 @@ class SafeTrash(SafeRename):
                 It's used for argument "body_root" of
                     function "create_date_time_space".
 
+            stream (bool, optional): Defaults to False.
+                It's used for argument "stream" of class "FileHistory".
+
+            deduplicate (bool, optional): Defaults to False.
+                If True, contents of each file are stored just once
+                    to directory "objects" placed on the trash box root,
+                    named by BLAKE2b hash of the contents.
+                Each object is written to temporary file at first,
+                    and renamed to the hash name after it's completed.
+                Path in trash box is hard link to the stored contents,
+                    so files can be restored as same as default.
+                Objects are read only to protect contents shared by links.
+                Files with same contents share status such as update time,
+                    so status of each file is recorded to database
+                    returned by function "get_status_path".
+                File changed while hashing is moved without deduplication.
+                Class "SafeRestore" applies the status when restoring
+                    with the path returned by method "get_object_root".
+
         """
         self.__initialize_super_class(
             working_root,
             history_root,
             override,
             jst,
+            stream,
         )
-        self.__initialize_variables(trash_root, override, jst)
+        self.__initialize_variables(trash_root, override, jst, deduplicate)
@@ -12,13 +12,10 @@ from pyspartalib.context.extension.path_context import (
     PathPair2,
     Paths,
 )
-from pyspartalib.context.file.json_context import Json
+from pyspartalib.context.file.json_context import Json, PartitionPair2
 from pyspartalib.script.file.json.convert_from_json import (
-    bool_pair2_from_json,
-    integer_pair2_from_json,
-    path_pair2_from_json,
+    partition_pair2_from_json,
     path_pair_from_json,
-    string_pair2_from_json,
 )
 from pyspartalib.script.file.json.import_json import json_import
 from pyspartalib.script.path.modify.get_resource import get_resource
@@ -41,10 +38,12 @@ class ProjectContext:
         return self._get_forward_path(forward)
 
     def _serialize_path(self, base_context: Json) -> None:
-        self._bool_context: BoolPair2 = bool_pair2_from_json(base_context)
-        self._integer_context: IntPair2 = integer_pair2_from_json(base_context)
-        self._string_context: StrPair2 = string_pair2_from_json(base_context)
-        self._path_context: PathPair2 = path_pair2_from_json(base_context)
+        partition: PartitionPair2 = partition_pair2_from_json(base_context)
+
+        self._bool_context: BoolPair2 = partition["boolean"]
+        self._integer_context: IntPair2 = partition["integer"]
+        self._string_context: StrPair2 = partition["string"]
+        self._path_context: PathPair2 = partition["path"]
 
     def _override_platform(self, platform: str | None) -> None:
         if platform is None:
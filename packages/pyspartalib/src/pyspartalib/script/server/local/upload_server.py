@@ -5,8 +5,8 @@
 from pathlib import Path
 
 from pyspartalib.context.default.string_context import Strs
-from pyspartalib.context.extension.path_context import Paths
-from pyspartalib.script.path.iterate_directory import walk_iterator
+from pyspartalib.context.extension.path_context import PathBoolFunc, Paths
+from pyspartalib.script.path.iterate_directory import walk_entries
 from pyspartalib.script.path.modify.current.get_relative import (
     get_relative,
     is_relative,
@@ -123,11 +123,31 @@ class UploadServer(ConnectServer):
             get_relative(source_child, root_path=source),
         )
 
-    def _upload_tree(self, source: Path, destination_local: Path) -> bool:
+    def _upload_child(self, source_child: Path, destination: Path) -> bool:
+        if source_child.is_dir():
+            self._upload_directory(destination)
+            return True
+
+        return self._upload_file(source_child, destination)
+
+    def _upload_tree(
+        self,
+        source: Path,
+        destination_local: Path,
+        prune: PathBoolFunc | None,
+        exclude: Strs | None,
+    ) -> bool:
         self._upload_directory(destination_local)
 
-        for source_child in walk_iterator(source, depth=1):
-            if not self._upload(
+        for entry in walk_entries(
+            source,
+            prune=prune,
+            exclude=exclude,
+            follow_symlinks=True,
+        ):
+            source_child = Path(entry.path)
+
+            if not self._upload_child(
                 source_child,
                 self._get_destination_child(
                     source,
@@ -139,21 +159,47 @@ class UploadServer(ConnectServer):
 
         return True
 
-    def _upload(self, source: Path, destination_local: Path) -> bool:
+    def _upload(
+        self,
+        source: Path,
+        destination_local: Path,
+        prune: PathBoolFunc | None,
+        exclude: Strs | None,
+    ) -> bool:
         if source.is_dir():
-            return self._upload_tree(source, destination_local)
+            return self._upload_tree(
+                source,
+                destination_local,
+                prune,
+                exclude,
+            )
 
         return self._upload_file(source, destination_local)
 
-    def upload(self, source: Path, destination: Path | None = None) -> bool:
+    def upload(
+        self,
+        source: Path,
+        destination: Path | None = None,
+        prune: PathBoolFunc | None = None,
+        exclude: Strs | None = None,
+    ) -> bool:
         """Upload file or directory by SFTP functionality.
 
+        Contents of symbolic link to directory are also uploaded.
+
         Args:
             source (Path): Local path of file or directory you want to upload.
 
             destination (Path | None, optional): Defaults to None.
                 Uploaded path of file or directory on server.
 
+            prune (PathBoolFunc | None, optional): Defaults to None.
+                It's used for argument "prune" of function "walk_iterator".
+
+            exclude (Strs | None, optional): Defaults to None.
+                It's used for argument "exclude" of function "walk_iterator".
+                Pattern is matched with relative path from "source".
+
         Returns:
             bool: True if uploading succeed.
 
@@ -161,7 +207,7 @@ class UploadServer(ConnectServer):
         if destination is None:
             destination = self.to_relative_path(source)
 
-        return self._upload(source, destination)
+        return self._upload(source, destination, prune, exclude)
 
     def __init__(
         self,
@@ -7,9 +7,27 @@ from decimal import Decimal
 
 from pyspartalib.interface.dateutil import gettz
 
+_time_zones: dict[bool, tzinfo | None] = {}
 
-def _select_timestamp(jst: bool = False) -> tzinfo | None:
-    return gettz("Asia/Tokyo" if jst else "UTC")
+
+def get_time_zone(jst: bool = False) -> tzinfo | None:
+    """Get time zone used for converting time data from epoch format.
+
+    Time zone object is created only once for each argument,
+        and the same object is returned after that.
+
+    Args:
+        jst (bool, optional): Defaults to False.
+            If True, you can get JST time zone instead of UTC time zone.
+
+    Returns:
+        tzinfo | None: Time zone object.
+
+    """
+    if jst not in _time_zones:
+        _time_zones[jst] = gettz("Asia/Tokyo" if jst else "UTC")
+
+    return _time_zones[jst]
 
 
 def time_from_timestamp(timestamp: Decimal, jst: bool = False) -> datetime:
@@ -25,4 +43,27 @@ def time_from_timestamp(timestamp: Decimal, jst: bool = False) -> datetime:
         datetime: Converted datetime object.
 
     """
-    return datetime.fromtimestamp(float(timestamp), tz=_select_timestamp(jst))
+    return datetime.fromtimestamp(float(timestamp), tz=get_time_zone(jst))
+
+
+def time_from_nanosecond(timestamp: int, jst: bool = False) -> datetime:
+    """Convert time data from nanosecond epoch to datetime object.
+
+    Time data is converted by integer arithmetic without type "float",
+        and digits smaller than microsecond are truncated.
+
+    Args:
+        timestamp (int): Nanosecond epoch time you want to convert.
+
+        jst (bool, optional): Defaults to False.
+            If True, you can get datetime object as JST time zone.
+
+    Returns:
+        datetime: Converted datetime object.
+
+    """
+    second, nanosecond = divmod(timestamp, 10**9)
+
+    return datetime.fromtimestamp(second, tz=get_time_zone(jst)).replace(
+        microsecond=nanosecond // 1000,
+    )
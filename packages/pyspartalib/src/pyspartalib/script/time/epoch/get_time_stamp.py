@@ -8,3 +8,11 @@ from decimal import Decimal
 def get_initial_epoch() -> Decimal:
     """Get UNIX epoch represent April 1, 2023."""
     return Decimal("1680307200")
+
+
+def get_valid_epoch() -> Decimal:
+    """Get UNIX epoch represent January 1, 1980.
+
+    It's the oldest date time treated as valid for file or directory.
+    """
+    return Decimal("315532800")
@@ -5,8 +5,7 @@
 from decimal import Decimal
 from pathlib import Path
 
-from pyspartalib.context.default.integer_context import IntPair2
-from pyspartalib.script.time.format.create_iso_date import get_iso_epoch
+from pyspartalib.script.time.epoch.get_time_stamp import get_valid_epoch
 
 
 def _to_decimal(number: float) -> Decimal:
@@ -25,16 +24,17 @@ def _get_epoch_source(path: Path, access: bool) -> Decimal:
     return _get_access_date(path) if access else _get_update_date(path)
 
 
-def _get_source() -> IntPair2:
-    return {
-        "year": {"year": 1980, "month": 1, "day": 1},
-        "hour": {"hour": 0, "minute": 0, "second": 0, "micro": 0},
-        "zone": {"hour": 0, "minute": 0},
-    }
+def _invalid_epoch(time_epoch: Decimal) -> bool:
+    return get_valid_epoch() > time_epoch
 
 
-def _invalid_epoch(time_epoch: Decimal) -> bool:
-    return get_iso_epoch(_get_source()) > time_epoch
+def _get_valid_nanosecond() -> int:
+    return int(get_valid_epoch()) * 10**9
+
+
+def _get_nanosecond_source(path: Path, access: bool) -> int:
+    status = path.stat()
+    return status.st_atime_ns if access else status.st_mtime_ns
 
 
 def get_file_epoch(path: Path, access: bool = False) -> Decimal | None:
@@ -57,3 +57,25 @@ def get_file_epoch(path: Path, access: bool = False) -> Decimal | None:
         return None
 
     return time_epoch
+
+
+def get_file_nanosecond(path: Path, access: bool = False) -> int | None:
+    """Get date time about selected file or directory as nanosecond epoch.
+
+    Args:
+        path (Path): Path of file or directory you want to get date time.
+
+        access (bool, optional): Defaults to False.
+            Return update time if it's False, and access time if True.
+
+    Returns:
+        int | None: Latest date time according to condition you select.
+            Return "None" if date time is broke.
+
+    """
+    time_epoch: int = _get_nanosecond_source(path, access)
+
+    if _get_valid_nanosecond() > time_epoch:
+        return None
+
+    return time_epoch
@@ -2,29 +2,24 @@
 
 """Module to get latest date time of file or directory as time object."""
 
+from array import array
 from datetime import UTC, datetime
-from decimal import Decimal
 from pathlib import Path
 
 from pyspartalib.context.extension.path_context import PathGene
-from pyspartalib.context.extension.time_context import TimePair
-from pyspartalib.script.time.epoch.from_timestamp import time_from_timestamp
-from pyspartalib.script.time.path.get_file_epoch import get_file_epoch
+from pyspartalib.context.extension.time_context import LatestArray, TimePair
+from pyspartalib.script.time.epoch.from_timestamp import time_from_nanosecond
+from pyspartalib.script.time.path.get_file_epoch import get_file_nanosecond
 
 
-def _convert_timestamp(time: float, jst: bool) -> datetime:
-    return time_from_timestamp(Decimal(str(time)), jst=jst)
-
-
-def _get_latest_times(
-    walk_generator: PathGene,
-    access: bool = False,
-    jst: bool = False,
-) -> TimePair:
+def _get_latest_times(latest_array: LatestArray, jst: bool) -> TimePair:
     return {
-        str(path): time
-        for path in walk_generator
-        if (time := get_latest(path, jst=jst, access=access)) is not None
+        str(path): time_from_nanosecond(time, jst=jst)
+        for path, time in zip(
+            latest_array["paths"],
+            latest_array["times"],
+            strict=True,
+        )
     }
 
 
@@ -47,11 +42,11 @@ def get_latest(
 
     Args:
         path (Path): Path of file or directory you want to get date time.
-            It's used for argument "path" of function "get_file_epoch".
+            It's used for argument "path" of function "get_file_nanosecond".
 
         access (bool, optional): Defaults to False.
             Return update time if it's False, and access time if True.
-            It's used for argument "access" of function "get_file_epoch".
+            It's used for argument "access" of function "get_file_nanosecond".
 
         jst (bool, optional): Defaults to False.
             Return latest date time as JST time zone if it's True.
@@ -62,12 +57,44 @@ def get_latest(
             Return None if the epoch can't be obtained.
 
     """
-    if time := get_file_epoch(path, access=access):
-        return _convert_timestamp(float(time), jst=jst)
+    if (time := get_file_nanosecond(path, access=access)) is not None:
+        return time_from_nanosecond(time, jst=jst)
 
     return None
 
 
+def get_latest_array(
+    walk_generator: PathGene,
+    access: bool = False,
+) -> LatestArray:
+    """Get latest date time of many files or directories at once.
+
+    Status of each path is gotten only once,
+        and date time is stored as integer without converting to object.
+
+    Args:
+        walk_generator (PathGene):
+            Path generator you want to get latest date time inside.
+
+        access (bool, optional): Defaults to False.
+            Return update time if it's False, and access time if True.
+
+    Returns:
+        LatestArray: List of path and array of date time as nanosecond epoch.
+            Both have same order and length.
+            Not including if the epoch is older than the valid date time.
+
+    """
+    latest_array: LatestArray = {"paths": [], "times": array("q")}
+
+    for path in walk_generator:
+        if (time := get_file_nanosecond(path, access=access)) is not None:
+            latest_array["paths"] += [path]
+            latest_array["times"].append(time)
+
+    return latest_array
+
+
 def get_directory_latest(
     walk_generator: PathGene,
     access: bool = False,
@@ -90,4 +117,4 @@ def get_directory_latest(
             Not including if the epoch can't be obtained.
 
     """
-    return _get_latest_times(walk_generator, access, jst)
+    return _get_latest_times(get_latest_array(walk_generator, access), jst)
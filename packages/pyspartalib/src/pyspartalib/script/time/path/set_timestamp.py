@@ -2,45 +2,129 @@
 
 """Module to set latest date time of file or directory by time object."""
 
-from datetime import datetime
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from os import utime
 from pathlib import Path
 
-from pyspartalib.context.extension.decimal_context import Decs
-from pyspartalib.script.decimal.convert_float import convert_float_array
-from pyspartalib.script.time.path.get_file_epoch import get_file_epoch
+from pyspartalib.context.default.string_context import Strs, Strs2
+from pyspartalib.context.extension.path_context import Paths
+from pyspartalib.context.extension.time_context import StampPair, StampTime
 from pyspartalib.script.time.path.get_timestamp import get_invalid_time
 from pyspartalib.script.time.stamp.offset_timezone import offset_time
 
 
-def _convert_timestamp(time: datetime) -> Decimal:
-    return Decimal(str(offset_time(time).timestamp()))
+def _get_epoch_origin() -> datetime:
+    return datetime(1970, 1, 1, tzinfo=UTC)
 
 
-def _get_path_times(path: Path, time: datetime, access: bool) -> Decs:
-    path_times: Decs = [_convert_timestamp(time)]
+def _get_path_times(path: Path, time: int, access: bool) -> tuple[int, int]:
+    status = path.stat()
 
-    if time_epoch := get_file_epoch(path, access=(not access)):
-        path_times += [time_epoch]
+    if access:
+        return time, status.st_mtime_ns
 
-    if not access:
-        path_times.reverse()
+    return status.st_atime_ns, time
 
-    return path_times
 
+def _fill_times(path: Path, times: StampTime) -> tuple[int, int]:
+    access, update = times
 
-def _set_time(path: Path, access: Decimal, update: Decimal) -> Path:
-    time_access, time_update = convert_float_array([access, update])
+    if (access is None) or (update is None):
+        status = path.stat()
 
-    utime(path, (time_access, time_update))
+        return (
+            status.st_atime_ns if access is None else access,
+            status.st_mtime_ns if update is None else update,
+        )
 
-    return path
+    return access, update
+
+
+def _set_times(path_text: str, times: StampTime) -> None:
+    path = Path(path_text)
+    utime(path, ns=_fill_times(path, times))
+
+
+def _get_depth(path_text: str) -> int:
+    return len(Path(path_text).parts)
+
+
+def _group_depth(stamps: StampPair) -> Strs2:
+    groups: dict[int, Strs] = {}
+
+    for path_text in stamps:
+        if (depth := _get_depth(path_text)) not in groups:
+            groups[depth] = []
+
+        groups[depth] += [path_text]
+
+    return [groups[depth] for depth in sorted(groups, reverse=True)]
+
+
+def _set_group(
+    stamps: StampPair,
+    group: Strs,
+    executor: ThreadPoolExecutor | None,
+) -> None:
+    times: list[StampTime] = [stamps[path_text] for path_text in group]
+
+    if executor is None:
+        for path_text, time in zip(group, times, strict=True):
+            _set_times(path_text, time)
+    else:
+        list(executor.map(_set_times, group, times))
+
+
+def _set_groups(
+    stamps: StampPair,
+    executor: ThreadPoolExecutor | None,
+) -> None:
+    for group in _group_depth(stamps):
+        _set_group(stamps, group, executor)
+
+
+def convert_nanosecond(time: datetime) -> int:
+    """Convert datetime object to nanosecond epoch.
+
+    Args:
+        time (datetime): Date time object you want to convert.
+            It's treated as UTC time if it doesn't have time zone.
+
+    Returns:
+        int: Converted nanosecond epoch.
+
+    """
+    elapsed: timedelta = offset_time(time) - _get_epoch_origin()
+    return (elapsed // timedelta(microseconds=1)) * 1000
 
 
 def set_invalid(path: Path) -> Path:
-    time: Decimal = _convert_timestamp(get_invalid_time())
-    return _set_time(path, time, time)
+    # Nanosecond epoch of invalid time is out of range of 64 bit integer.
+    time: float = offset_time(get_invalid_time()).timestamp()
+    utime(path, (time, time))
+
+    return path
+
+
+def set_nanosecond(path: Path, time: int, access: bool = False) -> Path:
+    """Set latest date time of file or directory by nanosecond epoch.
+
+    Args:
+        path (Path): Path of file or directory you want to set date time.
+
+        time (int): Latest date time you want to set as nanosecond epoch.
+
+        access (bool, optional): Defaults to False.
+            Set update time if it's False, and access time if True.
+
+    Returns:
+        Path: Path of file or directory you set latest date time.
+
+    """
+    utime(path, ns=_get_path_times(path, time, access))
+
+    return path
 
 
 def set_latest(path: Path, time: datetime, access: bool = False) -> Path:
@@ -58,4 +142,33 @@ def set_latest(path: Path, time: datetime, access: bool = False) -> Path:
         Path: Path of file or directory you set latest date time.
 
     """
-    return _set_time(path, *_get_path_times(path, time, access))
+    return set_nanosecond(path, convert_nanosecond(time), access=access)
+
+
+def set_latest_at_once(stamps: StampPair, parallel: int = 0) -> Paths:
+    """Set latest date time of many files or directories at once.
+
+    Deeper paths are set first, so date time of each directory is set
+        after date time of contents inside the directory.
+    Status of path isn't read if both date time are selected.
+
+    Args:
+        stamps (StampPair): Dictionary constructed by string path
+            and pair of access time and update time as nanosecond epoch.
+            If either of them is None, current value of the path is kept.
+
+        parallel (int, optional): Defaults to 0.
+            Number of threads used for setting date time.
+            If it's 0, all paths are set by current thread.
+
+    Returns:
+        Paths: Paths of files and directories you set latest date time.
+
+    """
+    if parallel > 0:
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            _set_groups(stamps, executor)
+    else:
+        _set_groups(stamps, None)
+
+    return [Path(path_text) for path_text in stamps]
@@ -7,6 +7,15 @@ from datetime import datetime
 from pyspartalib.script.time.count.builtin_timer import TimerSelect
 from pyspartalib.script.time.epoch.from_timestamp import time_from_timestamp
 
+_timers: dict[bool, TimerSelect] = {}
+
+
+def _get_timer(override: bool) -> TimerSelect:
+    if override not in _timers:
+        _timers[override] = TimerSelect(override=override)
+
+    return _timers[override]
+
 
 def get_current_time(override: bool = False, jst: bool = False) -> datetime:
     """Get information about current date time.
@@ -24,4 +33,4 @@ def get_current_time(override: bool = False, jst: bool = False) -> datetime:
         datetime: Current date time.
 
     """
-    return time_from_timestamp(TimerSelect(override=override)(), jst=jst)
+    return time_from_timestamp(_get_timer(override)(), jst=jst)
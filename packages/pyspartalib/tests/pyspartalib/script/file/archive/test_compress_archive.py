@@ -7,9 +7,10 @@ from decimal import Decimal
 from pathlib import Path
 from shutil import unpack_archive
 from tempfile import TemporaryDirectory
+from zipfile import ZipFile
 
 from pyspartalib.context.custom.type_context import Type
-from pyspartalib.context.default.string_context import StrPair
+from pyspartalib.context.default.string_context import StrPair, Strs
 from pyspartalib.context.extension.decimal_context import Decs
 from pyspartalib.context.extension.path_context import PathFunc, Paths, Paths2
 from pyspartalib.script.decimal.initialize_decimal import initialize_decimal
@@ -195,6 +196,89 @@ def _compress_test(
     _compare_compress_size(sorted_paths[-1], archive_paths)
 
 
+def _get_archived_names(archive_paths: Paths) -> Strs:
+    with ZipFile(archive_paths[0]) as archive_file:
+        return archive_file.namelist()
+
+
+def _duplicate_test(
+    archive_paths: Paths,
+    temporary_root: Path,
+    walk_paths: Paths,
+) -> None:
+    _common_test(archive_paths, temporary_root, walk_paths)
+
+    names: Strs = _get_archived_names(archive_paths)
+    _length_error(set(names), len(names))
+
+
+def _copy_archived(
+    tree_root: Path,
+    source_paths: Paths,
+    compress_archive: CompressArchive,
+) -> None:
+    with ZipFile(source_paths[0]) as archive_file:
+        compress_archive.copy_archived(
+            source_paths[0],
+            archive_file.infolist(),
+            tree_root,
+        )
+
+
+def _copy_archived_half(
+    tree_root: Path,
+    source_paths: Paths,
+    compress_archive: CompressArchive,
+) -> None:
+    with ZipFile(source_paths[0]) as archive_file:
+        informations = archive_file.infolist()
+
+    compress_archive.copy_archived(
+        source_paths[0],
+        informations[: len(informations) // 2],
+        tree_root,
+    )
+
+
+def _get_volume_bytes(archive_path: Path) -> list[int]:
+    with ZipFile(archive_path) as archive_file:
+        return [
+            information.compress_size
+            for information in archive_file.infolist()
+            if not information.is_dir()
+        ]
+
+
+def _volume_test(archive_paths: Paths, limit_byte: int) -> None:
+    _fail_error(len(archive_paths) > 1)
+
+    for archive_path in archive_paths:
+        volume_bytes: list[int] = _get_volume_bytes(archive_path)
+        _fail_error(
+            (len(volume_bytes) <= 1) or (sum(volume_bytes) <= limit_byte),
+        )
+
+
+def _get_archived_names_all(archive_paths: Paths) -> Strs:
+    names: Strs = []
+
+    for archive_path in archive_paths:
+        with ZipFile(archive_path) as archive_file:
+            names += archive_file.namelist()
+
+    return names
+
+
+def _exclude_test(tree_root: Path, archive_paths: Paths) -> None:
+    names: Strs = _get_archived_names(archive_paths)
+
+    _fail_error(Path(tree_root.name, "file.ini").as_posix() in names)
+
+    for name in names:
+        _fail_error(Path(name).suffix != ".json")
+        _fail_error("dir001" not in Path(name).parts)
+
+
 def _name_test(archive_name: str, archive_paths: Paths) -> None:
     _difference_error(archive_paths[0].stem, archive_name)
 
@@ -298,6 +382,37 @@ def _get_archive_heavy(temporary_root: Path) -> CompressArchive:
     return CompressArchive(_get_archive_root(temporary_root), limit_byte=64)
 
 
+def _get_archive_chunk(temporary_root: Path) -> CompressArchive:
+    return CompressArchive(_get_archive_root(temporary_root), chunk_byte=7)
+
+
+def _get_archive_parallel(temporary_root: Path) -> CompressArchive:
+    return CompressArchive(
+        _get_archive_root(temporary_root),
+        limit_byte=64,
+        compress=True,
+        parallel=2,
+    )
+
+
+def _get_archive_plan(temporary_root: Path) -> CompressArchive:
+    return CompressArchive(
+        _get_archive_root(temporary_root),
+        limit_byte=64,
+        compress=True,
+        parallel=2,
+        plan=True,
+    )
+
+
+def _get_archive_plan_copy(temporary_root: Path) -> CompressArchive:
+    return CompressArchive(
+        _get_archive_root(temporary_root),
+        limit_byte=64,
+        plan=True,
+    )
+
+
 def _get_walk_paths(tree_root: Path) -> Paths:
     return list(walk_iterator(tree_root, directory=False, depth=1))
 
@@ -420,6 +535,86 @@ def test_compress() -> None:
     _inside_temporary_directory(individual_test)
 
 
+def test_duplicate() -> None:
+    """Test to compress same files and directories only once."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree_tree(temporary_root)
+        walk_paths: Paths = _get_walk_paths_limit(tree_root)
+
+        _duplicate_test(
+            _finalize_archive(
+                tree_root,
+                walk_paths + walk_paths,
+                _get_archive(temporary_root),
+            ),
+            temporary_root,
+            walk_paths,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_chunk() -> None:
+    """Test to compress multiple files by streaming small chunks."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree_heavy(temporary_root)
+        walk_paths: Paths = _get_walk_paths_limit(tree_root)
+
+        _common_test(
+            _finalize_archive(
+                tree_root,
+                walk_paths,
+                _get_archive_chunk(temporary_root),
+            ),
+            temporary_root,
+            walk_paths,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_copy() -> None:
+    """Test to copy archived files before compressing same files."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree_tree(temporary_root)
+        walk_paths: Paths = _get_walk_paths_tree(tree_root)
+
+        source_paths: Paths = _finalize_archive(
+            tree_root,
+            walk_paths,
+            _get_archive_name(temporary_root, "source"),
+        )
+        compress_archive: CompressArchive = _get_archive(temporary_root)
+        _copy_archived(tree_root, source_paths, compress_archive)
+
+        _duplicate_test(
+            _finalize_archive(tree_root, walk_paths, compress_archive),
+            temporary_root,
+            walk_paths,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_exclude() -> None:
+    """Test to compress directory except files matched with patterns."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree_tree(temporary_root)
+        compress_archive: CompressArchive = _get_archive(temporary_root)
+
+        compress_archive.compress_archive(
+            tree_root,
+            exclude=["*.json", "/dir001/"],
+        )
+        _exclude_test(tree_root, compress_archive.close_archived())
+
+    _inside_temporary_directory(individual_test)
+
+
 def test_name() -> None:
     """Test to compress multiple files by specific archive name."""
     archive_name: str = "test"
@@ -479,6 +674,78 @@ def test_heavy() -> None:
     _inside_temporary_directory(individual_test)
 
 
+def test_parallel() -> None:
+    """Test to compress multiple files dividedly by multiple threads."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree_heavy(temporary_root)
+        walk_paths: Paths = _get_walk_paths_limit(tree_root)
+
+        _compare_archive(
+            _finalize_archive(
+                tree_root,
+                walk_paths,
+                _get_archive_parallel(temporary_root),
+            ),
+            temporary_root,
+            walk_paths,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_plan() -> None:
+    """Test to compress multiple files after planning archives."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree_heavy(temporary_root)
+        walk_paths: Paths = _get_walk_paths_limit(tree_root)
+
+        _compare_archive(
+            _finalize_archive(
+                tree_root,
+                walk_paths,
+                _get_archive_plan(temporary_root),
+            ),
+            temporary_root,
+            walk_paths,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_plan_copy() -> None:
+    """Test to divide archives by size of members copied while planning."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree_limit(temporary_root)
+        walk_paths: Paths = _get_walk_paths_limit(tree_root)
+
+        source_paths: Paths = _finalize_archive(
+            tree_root,
+            walk_paths,
+            _get_archive_name(temporary_root, "source"),
+        )
+        compress_archive: CompressArchive = _get_archive_plan_copy(
+            temporary_root,
+        )
+        _copy_archived_half(tree_root, source_paths, compress_archive)
+
+        archive_paths: Paths = _finalize_archive(
+            tree_root,
+            walk_paths,
+            compress_archive,
+        )
+
+        _compare_archive(archive_paths, temporary_root, walk_paths)
+        _volume_test(archive_paths, 64)
+
+        names: Strs = _get_archived_names_all(archive_paths)
+        _length_error(set(names), len(names))
+
+    _inside_temporary_directory(individual_test)
+
+
 def test_multiple() -> None:
     """Test to compress archive including multiple byte character."""
 
@@ -502,3 +769,36 @@ def test_multiple() -> None:
         )
 
     _inside_temporary_directory(individual_test)
+
+
+def test_with() -> None:
+    """Test to close archive compressed by threads with With statement."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree_heavy(temporary_root)
+        walk_paths: Paths = _get_walk_paths_limit(tree_root)
+
+        with _get_archive_parallel(temporary_root) as compress_archive:
+            compress_archive.compress_at_once(
+                walk_paths,
+                archive_root=tree_root,
+            )
+
+        archive_paths: Paths = compress_archive.close_archived()
+
+        _compare_archive(archive_paths, temporary_root, walk_paths)
+        _difference_error(compress_archive.close_archived(), archive_paths)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_unused() -> None:
+    """Test to close archive compressed by threads without any file."""
+
+    def individual_test(temporary_root: Path) -> None:
+        with _get_archive_parallel(temporary_root) as compress_archive:
+            pass
+
+        _confirm_empty_archive(compress_archive.close_archived())
+
+    _inside_temporary_directory(individual_test)
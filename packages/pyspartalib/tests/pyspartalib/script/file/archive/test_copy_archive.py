@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+"""Test module to copy compressed member of archive without recompression."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from zipfile import ZIP_LZMA, ZIP_STORED, ZipFile, ZipInfo
+
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.extension.path_context import PathFunc
+from pyspartalib.script.file.archive.copy_archive import (
+    copy_member,
+    get_data_offset,
+)
+
+
+def _difference_error(result: Type, expected: Type) -> None:
+    if result != expected:
+        raise ValueError
+
+
+def _success_error(status: bool) -> None:
+    if status:
+        raise ValueError
+
+
+def _get_member_name() -> str:
+    return "directory/file.txt"
+
+
+def _get_member_data() -> bytes:
+    return b"0123456789" * 100
+
+
+def _get_source_path(temporary_root: Path) -> Path:
+    return Path(temporary_root, "source.zip")
+
+
+def _get_destination_path(temporary_root: Path) -> Path:
+    return Path(temporary_root, "destination.zip")
+
+
+def _create_source(temporary_root: Path, compress_type: int) -> Path:
+    source_path: Path = _get_source_path(temporary_root)
+
+    with ZipFile(source_path, mode="w", compression=compress_type) as archive:
+        archive.writestr(_get_member_name(), _get_member_data())
+
+    return source_path
+
+
+def _copy_source(source_path: Path, destination_path: Path) -> ZipInfo:
+    with (
+        ZipFile(source_path) as source_file,
+        source_path.open("rb") as source,
+        ZipFile(destination_path, mode="w") as destination_file,
+    ):
+        return copy_member(
+            source,
+            source_file.getinfo(_get_member_name()),
+            destination_file,
+            chunk_byte=7,
+        )
+
+
+def _read_offset(source_path: Path) -> bytes:
+    with ZipFile(source_path) as source_file, source_path.open("rb") as source:
+        information: ZipInfo = source_file.getinfo(_get_member_name())
+        source.seek(get_data_offset(source, information))
+
+        return source.read(information.compress_size)
+
+
+def _compare_member(destination_path: Path, compress_type: int) -> None:
+    with ZipFile(destination_path) as destination_file:
+        _success_error(destination_file.testzip() is not None)
+
+        information: ZipInfo = destination_file.getinfo(_get_member_name())
+        _difference_error(information.compress_type, compress_type)
+        _difference_error(
+            destination_file.read(information),
+            _get_member_data(),
+        )
+
+
+def _copy_test(temporary_root: Path, compress_type: int) -> None:
+    destination_path: Path = _get_destination_path(temporary_root)
+
+    _copy_source(
+        _create_source(temporary_root, compress_type),
+        destination_path,
+    )
+    _compare_member(destination_path, compress_type)
+
+
+def _inside_temporary_directory(function: PathFunc) -> None:
+    with TemporaryDirectory() as temporary_path:
+        function(Path(temporary_path))
+
+
+def test_offset() -> None:
+    """Test to get position of data of member which isn't compressed."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _difference_error(
+            _read_offset(_create_source(temporary_root, ZIP_STORED)),
+            _get_member_data(),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_stored() -> None:
+    """Test to copy member which isn't compressed."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _copy_test(temporary_root, ZIP_STORED)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_lzma() -> None:
+    """Test to copy member which is compressed by LZMA format."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _copy_test(temporary_root, ZIP_LZMA)
+
+    _inside_temporary_directory(individual_test)
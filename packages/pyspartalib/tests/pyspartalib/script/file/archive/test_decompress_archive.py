@@ -175,6 +175,27 @@ def _common_test(temporary_root: Path) -> Paths2:
     return sorted_paths
 
 
+def _get_selected_path(walk_root: Path, suffix: str) -> Paths:
+    return get_relative_array(
+        sorted(walk_iterator(walk_root, directory=False, suffix=suffix)),
+        root_path=walk_root,
+    )
+
+
+def _select_test(temporary_root: Path, suffix: str) -> None:
+    extract_root: Path = _get_extract_root(temporary_root)
+    selected_paths: Paths2 = [
+        _get_selected_path(Path(temporary_root, directory), suffix)
+        for directory in _get_types()
+    ]
+
+    _difference_error(*selected_paths)
+    _length_error(
+        list(walk_iterator(extract_root, directory=False)),
+        len(selected_paths[-1]),
+    )
+
+
 def _type_test(temporary_root: Path, same_type: bool) -> None:
     _common_test(temporary_root)
     _success_error(same_type)
@@ -205,6 +226,26 @@ def _set_file_latest(paths: Paths) -> None:
             set_latest(path, latest)
 
 
+def _set_all_latest(paths: Paths) -> None:
+    latest: datetime = _get_expected_stamp()
+
+    for path in paths:
+        set_latest(path, latest)
+
+
+def _directory_timestamp_test(temporary_root: Path) -> None:
+    _difference_error(
+        {
+            get_latest(path)
+            for path in walk_iterator(
+                _get_extract_root(temporary_root),
+                file=False,
+            )
+        },
+        {_get_expected_stamp()},
+    )
+
+
 def _filter_length(result: Sized, expected: int) -> bool:
     return len(result) == expected
 
@@ -261,6 +302,18 @@ def _decompress_archive(temporary_root: Path) -> DecompressArchive:
     return DecompressArchive(_get_extract_root(temporary_root))
 
 
+def _decompress_archive_parallel(temporary_root: Path) -> DecompressArchive:
+    return DecompressArchive(_get_extract_root(temporary_root), parallel=2)
+
+
+def _decompress_archive_chunk(temporary_root: Path) -> DecompressArchive:
+    return DecompressArchive(_get_extract_root(temporary_root), chunk_byte=7)
+
+
+def _select_text(relative: Path) -> bool:
+    return relative.suffix == ".txt"
+
+
 def _compress_at_once(
     tree_path: Path,
     paths: Paths,
@@ -316,6 +369,26 @@ def _decompress_sequential(
     return sequential
 
 
+def _decompress_pattern(
+    archive_paths: Paths,
+    decompress_archive: DecompressArchive,
+) -> None:
+    decompress_archive.decompress_archive(
+        archive_paths[0],
+        pattern="**/*.json",
+    )
+
+
+def _decompress_select(
+    archive_paths: Paths,
+    decompress_archive: DecompressArchive,
+) -> None:
+    decompress_archive.decompress_archive(
+        archive_paths[0],
+        select=_select_text,
+    )
+
+
 def _to_decompress_single(
     temporary_root: Path,
     archive_paths: Paths,
@@ -500,6 +573,87 @@ def test_sequential() -> None:
     _inside_temporary_directory(individual_test)
 
 
+def test_chunk() -> None:
+    """Test to decompress archive by streaming files in small chunks."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_path: Path = _create_tree(temporary_root)
+
+        _decompress_single(
+            _finalize_compress_single(
+                temporary_root,
+                tree_path,
+                _get_tree_paths(tree_path),
+            ),
+            _decompress_archive_chunk(temporary_root),
+        )
+
+        _common_test(temporary_root)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_parallel() -> None:
+    """Test to decompress sequential archives by multiple threads."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_path: Path = _create_tree_sequential(temporary_root)
+
+        archive_paths: Paths = _finalize_compress_sequential(
+            temporary_root,
+            tree_path,
+            _get_tree_paths(tree_path),
+        )
+        sequential: Paths = _decompress_sequential(
+            archive_paths,
+            _decompress_archive_parallel(temporary_root),
+        )
+
+        _sequential_test(temporary_root, archive_paths, sequential)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_pattern() -> None:
+    """Test to decompress only files selected by glob pattern."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_path: Path = _create_tree(temporary_root)
+
+        _decompress_pattern(
+            _finalize_compress_single(
+                temporary_root,
+                tree_path,
+                _get_tree_paths(tree_path),
+            ),
+            _decompress_archive(temporary_root),
+        )
+
+        _select_test(temporary_root, "json")
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_select() -> None:
+    """Test to decompress only files selected by function."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_path: Path = _create_tree(temporary_root)
+
+        _decompress_select(
+            _finalize_compress_single(
+                temporary_root,
+                tree_path,
+                _get_tree_paths(tree_path),
+            ),
+            _decompress_archive(temporary_root),
+        )
+
+        _select_test(temporary_root, "txt")
+
+    _inside_temporary_directory(individual_test)
+
+
 def test_timestamp() -> None:
     """Test for timestamp consistency of contents in archive."""
 
@@ -545,3 +699,19 @@ def test_archive() -> None:
         _archive_test(temporary_root)
 
     _inside_temporary_directory(individual_test)
+
+
+def test_directory_timestamp() -> None:
+    """Test to restore timestamp of directories after their contents."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_path: Path = _create_tree_directory(temporary_root)
+
+        add_paths: Paths = _get_tree_paths(tree_path)
+        _set_all_latest(add_paths)
+        _compress_to_decompress(temporary_root, tree_path, add_paths)
+
+        _timestamp_test(temporary_root)
+        _directory_timestamp_test(temporary_root)
+
+    _inside_temporary_directory(individual_test)
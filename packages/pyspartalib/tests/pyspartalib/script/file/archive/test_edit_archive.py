@@ -5,9 +5,12 @@
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 import pytest
 from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.default.integer_context import Ints
+from pyspartalib.context.default.string_context import Strs
 from pyspartalib.context.extension.path_context import (
     PathFunc,
     PathPair,
@@ -439,6 +442,122 @@ def _get_edit_compress(archive_path: Path) -> EditArchive:
     return edit_archive
 
 
+def _get_edit_incremental(archive_path: Path) -> EditArchive:
+    edit_archive: EditArchive = _get_edit()
+    edit_archive.open_archive(archive_path=archive_path, incremental=True)
+    return edit_archive
+
+
+def _get_edit_lazy(archive_path: Path) -> EditArchive:
+    edit_archive: EditArchive = _get_edit()
+    edit_archive.open_archive(archive_path=archive_path, lazy=True)
+    return edit_archive
+
+
+def _materialize_edited(edit_archive: EditArchive) -> EditArchive:
+    for path_text in ["file.txt", "file.ini"]:
+        edit_archive.materialize(Path(path_text))
+
+    return edit_archive
+
+
+def _get_manifest_expected(temporary_root: Path) -> Paths:
+    before_root: Path = _get_root_before(temporary_root)
+
+    return sorted(
+        get_relative(path, root_path=before_root)
+        for path in walk_iterator(before_root)
+    )
+
+
+def _manifest_test(temporary_root: Path, edit_archive: EditArchive) -> None:
+    edit_root: Path = edit_archive.get_edit_root()
+
+    _difference_error(
+        sorted(edit_archive.get_manifest()),
+        _get_manifest_expected(temporary_root),
+    )
+    _difference_error(list(walk_iterator(edit_root)), [])
+
+    _compare_path(
+        edit_archive.materialize(Path("file.json")),
+        Path(edit_root, "file.json"),
+    )
+    _difference_error(
+        list(walk_iterator(edit_root)),
+        [Path(edit_root, "file.json")],
+    )
+    _close_archive_fail(edit_archive)
+
+
+def _get_member_names() -> Strs:
+    return ["same.txt", "edit.txt"]
+
+
+def _create_deflated(temporary_root: Path) -> Path:
+    archive_path: Path = Path(
+        create_directory(_get_root_archive(temporary_root)),
+        "deflated.zip",
+    )
+
+    with ZipFile(archive_path, "w", compression=ZIP_DEFLATED) as archive_file:
+        for name in _get_member_names():
+            archive_file.writestr(name, name * 1000)
+
+    return archive_path
+
+
+def _read_members(archive_path: Path) -> dict[str, ZipInfo]:
+    with ZipFile(archive_path) as archive_file:
+        return {
+            information.filename: information
+            for information in archive_file.infolist()
+        }
+
+
+def _get_raw_status(information: ZipInfo) -> Ints:
+    return [
+        information.compress_type,
+        information.CRC,
+        information.compress_size,
+    ]
+
+
+def _raw_copy_test(archive_path: Path, edit_archive: EditArchive) -> None:
+    before: dict[str, ZipInfo] = _read_members(archive_path)
+    same_name, edit_name = _get_member_names()
+
+    Path(edit_archive.get_edit_root(), edit_name).write_text("edited")
+    after: dict[str, ZipInfo] = _read_members(
+        _close_archive(edit_archive)[0],
+    )
+
+    _difference_error(
+        _get_raw_status(after[same_name]),
+        _get_raw_status(before[same_name]),
+    )
+    _difference_error(after[edit_name].compress_type, ZIP_STORED)
+
+
+def _read_contents(archive_path: Path) -> dict[str, bytes]:
+    with ZipFile(archive_path) as archive_file:
+        return {
+            name: archive_file.read(name) for name in archive_file.namelist()
+        }
+
+
+def _overwrite_test(archive_path: Path, edit_archive: EditArchive) -> None:
+    before: dict[str, bytes] = _read_contents(archive_path)
+    same_name, edit_name = _get_member_names()
+
+    Path(edit_archive.get_edit_root(), edit_name).write_text("edited")
+    after: dict[str, bytes] = _read_contents(_close_archive(edit_archive)[0])
+
+    _difference_error(sorted(after), sorted(before))
+    _difference_error(after[same_name], before[same_name])
+    _difference_error(after[edit_name], b"edited")
+
+
 def _get_edit_protect(archive_path: Path) -> EditArchive:
     edit_archive: EditArchive = _get_edit()
     edit_archive.open_archive(archive_path=archive_path, protected=True)
@@ -520,6 +639,91 @@ def test_single() -> None:
     _inside_temporary_directory(individual_test)
 
 
+def test_incremental() -> None:
+    """Test to compare internal of archive edited incrementally."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _common_test(
+            temporary_root,
+            _initialize_archive(temporary_root),
+            _get_edit_incremental(_get_archive_path(temporary_root)),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_raw_copy() -> None:
+    """Test to copy unchanged members without recompression."""
+
+    def individual_test(temporary_root: Path) -> None:
+        archive_path: Path = _create_deflated(temporary_root)
+
+        _raw_copy_test(archive_path, _get_edit_incremental(archive_path))
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_materialize() -> None:
+    """Test to keep edited file when archive isn't opened lazily."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _create_source(temporary_root)
+        edit_archive: EditArchive = _get_edit_path(
+            _get_archive_path(temporary_root),
+        )
+        edit_path: Path = Path(edit_archive.get_edit_root(), "file.txt")
+        edit_path.write_text("edited")
+
+        _difference_error(
+            edit_archive.materialize(Path("file.txt")),
+            edit_path,
+        )
+        _difference_error(edit_path.read_text(), "edited")
+        _close_archive(edit_archive)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_lazy() -> None:
+    """Test to compare internal of archive materialized partially."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _common_test(
+            temporary_root,
+            _initialize_archive(temporary_root),
+            _materialize_edited(
+                _get_edit_lazy(_get_archive_path(temporary_root)),
+            ),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_overwrite() -> None:
+    """Test to replace member which isn't materialized by new file."""
+
+    def individual_test(temporary_root: Path) -> None:
+        archive_path: Path = _create_deflated(temporary_root)
+
+        _overwrite_test(archive_path, _get_edit_lazy(archive_path))
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_manifest() -> None:
+    """Test to get contents of archive without decompression."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _create_source(temporary_root)
+
+        _manifest_test(
+            temporary_root,
+            _get_edit_lazy(_get_archive_path(temporary_root)),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
 def test_open() -> None:
     """Test to open archive with archive path successfully."""
 
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+
+"""Test module to find file or directory inside archives by index."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
+
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.extension.path_context import PathFunc, Paths
+from pyspartalib.script.file.archive.compress_archive import CompressArchive
+from pyspartalib.script.file.archive.context.archive_context import (
+    ArchiveIndex,
+)
+from pyspartalib.script.file.archive.index_archive import (
+    IndexArchive,
+    create_index,
+    get_index_path,
+)
+from pyspartalib.script.path.iterate_directory import walk_iterator
+from pyspartalib.script.path.modify.current.get_relative import get_relative
+from pyspartalib.script.path.status.get_statistic import get_file_size
+from pyspartalib.script.path.temporary.create_temporary_tree import (
+    create_temporary_tree,
+)
+from pyspartalib.script.time.path.get_timestamp import get_latest
+
+
+def _difference_error(result: Type, expected: Type) -> None:
+    if result != expected:
+        raise ValueError
+
+
+def _none_error(result: Type | None) -> Type:
+    if result is None:
+        raise ValueError
+
+    return result
+
+
+def _not_none_error(result: object) -> None:
+    if result is not None:
+        raise ValueError
+
+
+def _fail_error(status: bool) -> None:
+    if not status:
+        raise ValueError
+
+
+def _get_tree_root(temporary_root: Path) -> Path:
+    return Path(temporary_root, "tree")
+
+
+def _get_extract_root(temporary_root: Path) -> Path:
+    return Path(temporary_root, "extract")
+
+
+def _get_archive_root(temporary_root: Path) -> Path:
+    return Path(temporary_root, "archive")
+
+
+def _get_walk_paths(tree_root: Path) -> Paths:
+    return list(walk_iterator(tree_root, directory=False))
+
+
+def _create_tree(temporary_root: Path) -> Path:
+    return create_temporary_tree(_get_tree_root(temporary_root), tree_deep=3)
+
+
+def _compress_archive(temporary_root: Path, tree_root: Path) -> Paths:
+    compress_archive = CompressArchive(
+        _get_archive_root(temporary_root),
+        limit_byte=200,
+        index=True,
+    )
+
+    compress_archive.compress_at_once(
+        list(walk_iterator(tree_root, depth=1)),
+        archive_root=tree_root,
+    )
+    return compress_archive.close_archived()
+
+
+def _compare_index(
+    archive_index: ArchiveIndex,
+    archive_paths: Paths,
+    path: Path,
+) -> None:
+    _fail_error(archive_index["archive"] in archive_paths)
+    _difference_error(archive_index["file_size"], get_file_size(path))
+    _difference_error(archive_index["latest"], get_latest(path))
+
+
+def _find_test(tree_root: Path, archive_paths: Paths) -> None:
+    index_archive = IndexArchive(archive_paths[0])
+
+    for path in _get_walk_paths(tree_root):
+        _compare_index(
+            _none_error(
+                index_archive.find(get_relative(path, root_path=tree_root)),
+            ),
+            archive_paths,
+            path,
+        )
+
+
+def _decompress_test(
+    temporary_root: Path,
+    tree_root: Path,
+    archive_paths: Paths,
+) -> None:
+    extract_root: Path = _get_extract_root(temporary_root)
+    relative_path: Path = get_relative(
+        _get_walk_paths(tree_root)[-1],
+        root_path=tree_root,
+    )
+
+    decompressed: Path = _none_error(
+        IndexArchive(archive_paths[0]).decompress(relative_path, extract_root),
+    )
+
+    _difference_error(
+        _get_walk_paths(extract_root),
+        [Path(extract_root, relative_path)],
+    )
+    _difference_error(
+        get_file_size(decompressed),
+        get_file_size(Path(tree_root, relative_path)),
+    )
+    _difference_error(
+        get_latest(decompressed),
+        get_latest(Path(tree_root, relative_path)),
+    )
+
+
+def _get_multiple() -> str:
+    return "\u3042.txt"
+
+
+def _create_multiple(temporary_root: Path) -> Path:
+    archive_path: Path = Path(temporary_root, "multiple.zip")
+
+    # Name encoded by "cp932" is read as "cp437" like old archivers.
+    with ZipFile(archive_path, "w") as archive_file:
+        archive_file.writestr(
+            _get_multiple().encode("cp932").decode("cp437"),
+            _get_multiple(),
+        )
+
+    create_index([archive_path])
+
+    return archive_path
+
+
+def _multiple_test(temporary_root: Path, archive_path: Path) -> None:
+    decompressed: Path = _none_error(
+        IndexArchive(archive_path).decompress(
+            Path(_get_multiple()),
+            _get_extract_root(temporary_root),
+        ),
+    )
+
+    _difference_error(decompressed.read_text(), _get_multiple())
+
+
+def _inside_temporary_directory(function: PathFunc) -> None:
+    with TemporaryDirectory() as temporary_path:
+        function(Path(temporary_path))
+
+
+def test_path() -> None:
+    """Test to create index alongside sequential archives."""
+
+    def individual_test(temporary_root: Path) -> None:
+        archive_paths: Paths = _compress_archive(
+            temporary_root,
+            _create_tree(temporary_root),
+        )
+
+        _fail_error(len(archive_paths) > 1)
+        _fail_error(get_index_path(archive_paths[0]).exists())
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_find() -> None:
+    """Test to find all files inside sequential archives by index."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+        _find_test(tree_root, _compress_archive(temporary_root, tree_root))
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_none() -> None:
+    """Test to find file which doesn't exist inside archives."""
+
+    def individual_test(temporary_root: Path) -> None:
+        archive_paths: Paths = _compress_archive(
+            temporary_root,
+            _create_tree(temporary_root),
+        )
+
+        _not_none_error(IndexArchive(archive_paths[0]).find(Path("none")))
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_decompress() -> None:
+    """Test to decompress single file inside archives by index."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+
+        _decompress_test(
+            temporary_root,
+            tree_root,
+            _compress_archive(temporary_root, tree_root),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_multiple() -> None:
+    """Test to find file whose name is converted to "cp932" by index."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _multiple_test(temporary_root, _create_multiple(temporary_root))
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_missing() -> None:
+    """Test to decompress file which doesn't exist inside archives."""
+
+    def individual_test(temporary_root: Path) -> None:
+        archive_paths: Paths = _compress_archive(
+            temporary_root,
+            _create_tree(temporary_root),
+        )
+        extract_root: Path = _get_extract_root(temporary_root)
+
+        _not_none_error(
+            IndexArchive(archive_paths[0]).decompress(
+                Path("none"),
+                extract_root,
+            ),
+        )
+        _fail_error(not extract_root.exists())
+
+    _inside_temporary_directory(individual_test)
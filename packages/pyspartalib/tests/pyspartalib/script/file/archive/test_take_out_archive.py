@@ -426,6 +426,13 @@ def _take_out_close(take_out_archive: TakeOutArchive) -> Paths:
     return _close_archive(take_out_archive.take_out(), take_out_archive)
 
 
+def _take_out_close_parallel(take_out_archive: TakeOutArchive) -> Paths:
+    return _close_archive(
+        take_out_archive.take_out(parallel=2),
+        take_out_archive,
+    )
+
+
 def _take_out_close_specific(
     working: PathPair,
     take_out_archive: TakeOutArchive,
@@ -443,6 +450,13 @@ def _default_test(archive_status: ArchiveStatus) -> None:
     )
 
 
+def _parallel_test(archive_status: ArchiveStatus) -> None:
+    _took_out_and_keep(
+        _take_out_close_parallel(_get_take_out(archive_status)),
+        archive_status,
+    )
+
+
 def _take_test(working: PathPair, archive_status: ArchiveStatus) -> None:
     take_out_archive: TakeOutArchive = _get_take_out(archive_status)
     _take_out_close_specific(working, take_out_archive)
@@ -621,6 +635,22 @@ def test_override() -> None:
     _inside_temporary_directory(individual_test)
 
 
+def test_parallel() -> None:
+    """Test to take out directory from inside of archive.
+
+    Archives of took out directories are created by multiple threads.
+    """
+
+    def individual_test(temporary_root: Path) -> None:
+        _parallel_test(
+            _create_archive_override(
+                _create_directory_default(temporary_root),
+            ),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
 def test_path() -> None:
     """Test to get path of directory used for take out archives."""
 
@@ -32,6 +32,7 @@ from pyspartalib.script.file.json.convert_from_json import (
     integer_array_from_json,
     integer_pair2_from_json,
     integer_pair_from_json,
+    partition_pair2_from_json,
     path_array2_from_json,
     path_array_from_json,
     path_pair2_from_json,
@@ -209,6 +210,10 @@ def _get_expected_safe() -> Json:
     }
 
 
+def _get_partition_source() -> Json:
+    return {"section": dict(_get_mixed()), "single": _get_string()}
+
+
 def _get_config_expected() -> Json:
     return {"section": _get_expected_safe()}
 
@@ -304,3 +309,18 @@ def test_safe() -> None:
             _get_config_expected(),
         ),
     )
+
+
+def test_partition() -> None:
+    """Test to convert json format data to dictionaries of each type."""
+    source: Json = _get_partition_source()
+
+    _difference_error(
+        partition_pair2_from_json(source),
+        {
+            "boolean": bool_pair2_from_json(source),
+            "integer": integer_pair2_from_json(source),
+            "string": string_pair2_from_json(source),
+            "path": path_pair2_from_json(source),
+        },
+    )
@@ -8,7 +8,10 @@ from tempfile import TemporaryDirectory
 from pyspartalib.context.custom.type_context import Type
 from pyspartalib.context.extension.path_context import PathFunc
 from pyspartalib.script.file.json.export_json import json_export
-from pyspartalib.script.path.modify.avoid_duplication import get_avoid_path
+from pyspartalib.script.path.modify.avoid_duplication import (
+    AvoidPath,
+    get_avoid_path,
+)
 
 
 def _difference_error(result: Type, expected: Type) -> None:
@@ -16,6 +19,20 @@ def _difference_error(result: Type, expected: Type) -> None:
         raise ValueError
 
 
+def _get_expected(source_path: Path, count: int) -> Path:
+    return source_path.with_stem(source_path.stem + ("_" * count))
+
+
+def _convert_array(source_path: Path, count: int) -> None:
+    avoid_path = AvoidPath()
+
+    for i in range(count):
+        _difference_error(
+            avoid_path.get_avoid_path(source_path),
+            _get_expected(source_path, i),
+        )
+
+
 def _inside_temporary_directory(function: PathFunc) -> None:
     with TemporaryDirectory() as temporary_path:
         function(Path(temporary_path, "temporary.json"))
@@ -42,3 +59,39 @@ def test_empty() -> None:
         _difference_error(get_avoid_path(source_path), source_path)
 
     _inside_temporary_directory(individual_test)
+
+
+def test_array() -> None:
+    """Test to convert many paths at once, but no path competition."""
+
+    def individual_test(source_path: Path) -> None:
+        _convert_array(source_path, 10)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_compatible() -> None:
+    """Test to convert many paths at once as same as single conversion."""
+
+    def individual_test(source_path: Path) -> None:
+        json_export(source_path, "test")
+        json_export(_get_expected(source_path, 2), "test")
+
+        avoid_path = AvoidPath()
+
+        for count in [1, 3, 4]:
+            _difference_error(
+                avoid_path.get_avoid_path(source_path),
+                _get_expected(source_path, count),
+            )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_parent() -> None:
+    """Test to convert path whose parent directory doesn't exist."""
+
+    def individual_test(source_path: Path) -> None:
+        _convert_array(Path(source_path.parent, "parent", source_path.name), 3)
+
+    _inside_temporary_directory(individual_test)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+
+"""Test module to copy file or directory by fastest way of file system."""
+
+from os import mkfifo
+from pathlib import Path
+from shutil import SpecialFileError
+from tempfile import TemporaryDirectory
+
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.extension.path_context import PathFunc, PathPair
+from pyspartalib.script.path.iterate_directory import walk_iterator
+from pyspartalib.script.path.modify.copy_path import copy_file, copy_tree
+from pyspartalib.script.path.temporary.create_temporary_file import (
+    create_temporary_file,
+)
+from pyspartalib.script.path.temporary.create_temporary_tree import (
+    create_temporary_tree,
+)
+from pyspartalib.script.platform.platform_status import is_platform_linux
+
+
+def _difference_error(result: Type, expected: Type) -> None:
+    if result != expected:
+        raise ValueError
+
+
+def _fail_error(status: bool) -> None:
+    if not status:
+        raise ValueError
+
+
+def _get_source(temporary_root: Path) -> Path:
+    return Path(temporary_root, "source")
+
+
+def _get_destination(temporary_root: Path) -> Path:
+    return Path(temporary_root, "destination")
+
+
+def _compare_file(source_path: Path, destination_path: Path) -> None:
+    _difference_error(destination_path.read_bytes(), source_path.read_bytes())
+    _difference_error(
+        destination_path.stat().st_mtime_ns,
+        source_path.stat().st_mtime_ns,
+    )
+
+
+def _get_relative_array(root: Path) -> list[str]:
+    return sorted(str(path.relative_to(root)) for path in walk_iterator(root))
+
+
+def _compare_tree(source_root: Path, destination_root: Path) -> None:
+    _difference_error(
+        _get_relative_array(destination_root),
+        _get_relative_array(source_root),
+    )
+
+
+def _compare_files(source_root: Path, files: PathPair) -> None:
+    _difference_error(
+        sorted(files),
+        sorted(
+            str(path) for path in walk_iterator(source_root, directory=False)
+        ),
+    )
+
+    for source_text, destination_path in files.items():
+        _compare_file(Path(source_text), destination_path)
+
+
+def _copy_test(temporary_root: Path, parallel: int) -> None:
+    source_root: Path = create_temporary_tree(
+        _get_source(temporary_root),
+        tree_deep=3,
+    )
+    destination_root: Path = _get_destination(temporary_root)
+
+    files: PathPair = copy_tree(source_root, destination_root, parallel)
+
+    _compare_tree(source_root, destination_root)
+    _compare_files(source_root, files)
+
+
+def _inside_temporary_directory(function: PathFunc) -> None:
+    with TemporaryDirectory() as temporary_path:
+        function(Path(temporary_path))
+
+
+def test_file() -> None:
+    """Test to copy file and its status."""
+
+    def individual_test(temporary_root: Path) -> None:
+        source_path: Path = create_temporary_file(temporary_root)
+        destination_path: Path = source_path.with_stem("destination")
+
+        _difference_error(
+            copy_file(source_path, destination_path),
+            destination_path,
+        )
+        _compare_file(source_path, destination_path)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_into() -> None:
+    """Test to copy file into existing directory."""
+
+    def individual_test(temporary_root: Path) -> None:
+        source_path: Path = create_temporary_file(temporary_root)
+        destination_root: Path = _get_destination(temporary_root)
+        destination_root.mkdir()
+
+        _compare_file(source_path, copy_file(source_path, destination_root))
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_tree() -> None:
+    """Test to copy directory tree by current thread."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _copy_test(temporary_root, 0)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_parallel() -> None:
+    """Test to copy directory tree by multiple threads."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _copy_test(temporary_root, 4)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_link() -> None:
+    """Test to copy contents of symbolic link instead of the link."""
+
+    def individual_test(temporary_root: Path) -> None:
+        source_root: Path = _get_source(temporary_root)
+        source_root.mkdir()
+
+        target_root: Path = create_temporary_tree(
+            Path(temporary_root, "target"),
+        )
+        Path(source_root, "file").symlink_to(
+            create_temporary_file(temporary_root),
+        )
+        Path(source_root, "directory").symlink_to(target_root)
+
+        destination_root: Path = _get_destination(temporary_root)
+        files: PathPair = copy_tree(source_root, destination_root)
+
+        _fail_error(
+            not any(
+                path.is_symlink() for path in walk_iterator(destination_root)
+            ),
+        )
+        _compare_tree(target_root, Path(destination_root, "directory"))
+        _difference_error(
+            len(files),
+            len(list(walk_iterator(target_root, directory=False))) + 1,
+        )
+
+        for source_text, destination_path in files.items():
+            _compare_file(Path(source_text), destination_path)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_exists() -> None:
+    """Test to raise error when destination already exists."""
+
+    def individual_test(temporary_root: Path) -> None:
+        source_root: Path = _get_source(temporary_root)
+        source_root.mkdir()
+
+        try:
+            copy_tree(source_root, source_root)
+        except FileExistsError:
+            return
+
+        _fail_error(False)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_special() -> None:
+    """Test to raise error when source is named pipe."""
+
+    def individual_test(temporary_root: Path) -> None:
+        source_path: Path = _get_source(temporary_root)
+        mkfifo(source_path)
+
+        try:
+            copy_file(source_path, _get_destination(temporary_root))
+        except SpecialFileError:
+            return
+
+        _fail_error(False)
+
+    if is_platform_linux():
+        _inside_temporary_directory(individual_test)
+
+
+def test_pseudo() -> None:
+    """Test to copy file of pseudo file system whose size is 0."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _fail_error(
+            len(
+                copy_file(
+                    Path("/proc/version"),
+                    _get_destination(temporary_root),
+                ).read_bytes(),
+            )
+            > 0,
+        )
+
+    if is_platform_linux():
+        _inside_temporary_directory(individual_test)
@@ -10,6 +10,7 @@ from pyspartalib.context.custom.type_context import Type
 from pyspartalib.context.extension.path_context import PathPair2
 from pyspartalib.script.bool.same_value import bool_same_pair
 from pyspartalib.script.directory.create_directory import create_directory
+from pyspartalib.script.path.iterate_directory import walk_iterator
 from pyspartalib.script.path.safe.safe_copy import SafeCopy
 from pyspartalib.script.path.status.check_exists import check_exists_pair
 from pyspartalib.script.path.temporary.create_temporary_file import (
@@ -124,3 +125,27 @@ def test_tree() -> None:
         _common_test(_copy(safe_copy, _create_tree_deep(temporary_path)))
 
     _inside_temporary_directory(individual_test)
+
+
+def test_parallel() -> None:
+    """Test to copy directory by multiple threads, and log each file."""
+
+    def individual_test(safe_copy: SafeCopy, temporary_path: Path) -> None:
+        source_path: Path = _create_tree_deep(temporary_path)
+        safe_copy.copy_tree(
+            source_path,
+            source_path.with_stem("destination"),
+            parallel=4,
+        )
+
+        history: PathPair2 = _none_error(safe_copy.close_history())
+
+        _length_error(
+            history,
+            len(list(walk_iterator(source_path, directory=False))),
+        )
+
+        for path_pair in history.values():
+            _fail_error(bool_same_pair(check_exists_pair(path_pair)))
+
+    _inside_temporary_directory(individual_test)
@@ -18,6 +18,7 @@ from pyspartalib.context.extension.path_context import (
 from pyspartalib.script.frame.current_frame import CurrentFrame
 from pyspartalib.script.path.modify.current.get_relative import is_relative
 from pyspartalib.script.path.safe.safe_file_history import FileHistory
+from pyspartalib.script.path.safe.safe_history_log import read_history
 from pyspartalib.script.time.directory.get_time_path import (
     get_initial_time_path,
 )
@@ -174,6 +175,26 @@ def _add_history_array(file_history: FileHistory) -> PathPair2:
     return expected
 
 
+def _read_history(file_history: FileHistory) -> PathPair2:
+    return {
+        record["key"]: record["history"]
+        for record in read_history(
+            _none_error(file_history.get_history_path()),
+        )
+    }
+
+
+def _compare_stream(temporary_root: Path, file_history: FileHistory) -> None:
+    expected: PathPair2 = _add_history_array(file_history)
+
+    _not_none_error(file_history.get_history())
+    _relative_test(
+        _none_error(file_history.get_history_path()),
+        temporary_root,
+    )
+    _common_test(expected, _read_history(file_history))
+
+
 def _inside_temporary_directory(function: PathFunc) -> None:
     with TemporaryDirectory() as temporary_path:
         function(Path(temporary_path))
@@ -260,3 +281,15 @@ def test_path() -> None:
         _compare_path(temporary_root, file_history)
 
     _inside_temporary_directory(individual_test)
+
+
+def test_stream() -> None:
+    """Test to record paths to file one by one as JSON Lines format."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _compare_stream(
+            temporary_root,
+            FileHistory(working_root=temporary_root, stream=True),
+        )
+
+    _inside_temporary_directory(individual_test)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+
+"""Test module to record history of file operation as JSON Lines format."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.extension.path_context import PathFunc, PathPair
+from pyspartalib.script.path.safe.context.history_context import (
+    HistoryRecord,
+)
+from pyspartalib.script.path.safe.safe_history_log import (
+    HistoryLog,
+    count_history,
+    read_history,
+    read_history_reverse,
+)
+
+
+def _difference_error(result: Type, expected: Type) -> None:
+    if result != expected:
+        raise ValueError
+
+
+def _get_log_path(temporary_root: Path) -> Path:
+    return Path(temporary_root, "history", "history.jsonl")
+
+
+def _get_history(index: int) -> PathPair:
+    return {
+        "source.path": Path("source", str(index)),
+        "destination.path": Path("destination", str(index)),
+    }
+
+
+def _get_key(index: int) -> str:
+    return "key_" + str(index).zfill(4)
+
+
+def _get_expected(start: int, stop: int) -> list[HistoryRecord]:
+    return [
+        {"sequence": i, "key": _get_key(i), "history": _get_history(i)}
+        for i in range(start, stop)
+    ]
+
+
+def _add_history(history_log: HistoryLog, start: int, stop: int) -> None:
+    for i in range(start, stop):
+        _difference_error(
+            history_log.add_history(_get_key(i), _get_history(i)),
+            i,
+        )
+
+
+def _add_history_at_once(history_log: HistoryLog, stop: int) -> None:
+    _difference_error(
+        history_log.add_history_at_once(
+            {_get_key(i): _get_history(i) for i in range(stop)},
+        ),
+        list(range(stop)),
+    )
+
+
+def _compare_history(log_path: Path, stop: int) -> None:
+    _difference_error(list(read_history(log_path)), _get_expected(0, stop))
+
+
+def _add_partial(log_path: Path) -> None:
+    with log_path.open(mode="a", encoding="utf-8") as file:
+        file.write('{"sequence": 200, "key": "' + "_" * 2**13)
+
+
+def _read_test(log_path: Path, stop: int) -> None:
+    _compare_history(log_path, stop)
+    _difference_error(
+        list(read_history_reverse(log_path)),
+        list(reversed(_get_expected(0, stop))),
+    )
+    _difference_error(count_history(log_path), stop)
+
+
+def _inside_temporary_directory(function: PathFunc) -> None:
+    with TemporaryDirectory() as temporary_path:
+        function(Path(temporary_path))
+
+
+def test_read() -> None:
+    """Test to read history which is written as JSON Lines format."""
+
+    def individual_test(temporary_root: Path) -> None:
+        history_log = HistoryLog(_get_log_path(temporary_root))
+        _add_history(history_log, 0, 10)
+
+        _compare_history(history_log.close_history(), 10)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_append() -> None:
+    """Test to continue sequence number when file already exists."""
+
+    def individual_test(temporary_root: Path) -> None:
+        log_path: Path = _get_log_path(temporary_root)
+
+        for start, stop in [(0, 3), (3, 5)]:
+            with HistoryLog(log_path) as history_log:
+                _add_history(history_log, start, stop)
+
+        _compare_history(log_path, 5)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_buffer() -> None:
+    """Test to write all history even if buffer is small."""
+
+    def individual_test(temporary_root: Path) -> None:
+        history_log = HistoryLog(_get_log_path(temporary_root), buffer_byte=7)
+        _add_history(history_log, 0, 10)
+
+        _compare_history(history_log.close_history(), 10)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_at_once() -> None:
+    """Test to write multiple histories by single writing."""
+
+    def individual_test(temporary_root: Path) -> None:
+        history_log = HistoryLog(_get_log_path(temporary_root))
+        _add_history_at_once(history_log, 10)
+
+        _compare_history(history_log.close_history(), 10)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_closed() -> None:
+    """Test to raise error when history is added after closing."""
+
+    def individual_test(temporary_root: Path) -> None:
+        history_log = HistoryLog(_get_log_path(temporary_root))
+        history_log.close_history()
+
+        try:
+            history_log.add_history(_get_key(0), _get_history(0))
+        except ValueError:
+            return
+
+        raise ValueError
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_long() -> None:
+    """Test to continue sequence number from history longer than chunk."""
+
+    def individual_test(temporary_root: Path) -> None:
+        log_path: Path = _get_log_path(temporary_root)
+
+        for start, stop in [(0, 200), (200, 201)]:
+            with HistoryLog(log_path) as history_log:
+                _add_history(history_log, start, stop)
+
+        _compare_history(log_path, 201)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_reverse() -> None:
+    """Test to read history from the last line to the first."""
+
+    def individual_test(temporary_root: Path) -> None:
+        history_log = HistoryLog(_get_log_path(temporary_root))
+        _add_history(history_log, 0, 200)
+        log_path: Path = history_log.close_history()
+
+        _difference_error(
+            list(read_history_reverse(log_path)),
+            list(reversed(_get_expected(0, 200))),
+        )
+        _difference_error(count_history(log_path), 200)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_partial() -> None:
+    """Test to skip the last line written partially."""
+
+    def individual_test(temporary_root: Path) -> None:
+        log_path: Path = _get_log_path(temporary_root)
+
+        with HistoryLog(log_path) as history_log:
+            _add_history(history_log, 0, 200)
+
+        _add_partial(log_path)
+        _read_test(log_path, 200)
+
+        with HistoryLog(log_path) as history_log:
+            _add_history(history_log, 200, 201)
+
+        _read_test(log_path, 201)
+
+    _inside_temporary_directory(individual_test)
@@ -0,0 +1,345 @@
+#!/usr/bin/env python
+
+"""Test module to restore file or directory by replaying history."""
+
+from os import utime
+from pathlib import Path
+from stat import S_IWUSR
+from tempfile import TemporaryDirectory
+
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.default.integer_context import Ints2
+from pyspartalib.context.extension.path_context import PathFunc, Paths
+from pyspartalib.script.file.json.export_json import json_export
+from pyspartalib.script.path.iterate_directory import walk_iterator
+from pyspartalib.script.path.safe.safe_history_log import HistoryLog
+from pyspartalib.script.path.safe.safe_rename import SafeRename
+from pyspartalib.script.path.safe.safe_restore import SafeRestore
+from pyspartalib.script.path.safe.safe_trash import SafeTrash
+from pyspartalib.script.path.temporary.create_temporary_file import (
+    create_temporary_file,
+)
+from pyspartalib.script.path.temporary.create_temporary_tree import (
+    create_temporary_tree,
+)
+
+
+def _difference_error(result: Type, expected: Type) -> None:
+    if result != expected:
+        raise ValueError
+
+
+def _none_error(result: Type | None) -> Type:
+    if result is None:
+        raise ValueError
+
+    return result
+
+
+def _get_work_root(temporary_root: Path) -> Path:
+    return Path(temporary_root, "work")
+
+
+def _get_tree_root(temporary_root: Path) -> Path:
+    return Path(temporary_root, "tree")
+
+
+def _create_tree(temporary_root: Path) -> Paths:
+    tree_root: Path = create_temporary_tree(
+        _get_tree_root(temporary_root),
+        tree_deep=3,
+    )
+
+    return sorted(walk_iterator(tree_root))
+
+
+def _get_safe_trash(temporary_root: Path, stream: bool) -> SafeTrash:
+    return SafeTrash(
+        working_root=_get_work_root(temporary_root),
+        stream=stream,
+    )
+
+
+def _get_safe_restore(temporary_root: Path) -> SafeRestore:
+    return SafeRestore(working_root=_get_work_root(temporary_root))
+
+
+def _trash_tree(temporary_root: Path, stream: bool) -> Path:
+    safe_trash: SafeTrash = _get_safe_trash(temporary_root, stream)
+    tree_root: Path = _get_tree_root(temporary_root)
+
+    safe_trash.trash_at_once(
+        list(walk_iterator(tree_root, depth=1)),
+        relative_root=tree_root,
+    )
+    safe_trash.get_history()
+
+    return _none_error(safe_trash.get_history_path())
+
+
+def _create_same(temporary_root: Path) -> Paths:
+    return [
+        json_export(Path(temporary_root, name + ".json"), "test")
+        for name in ["first", "second"]
+    ]
+
+
+def _create_linked(temporary_root: Path) -> Paths:
+    source_path: Path = json_export(Path(temporary_root, "source.json"), "")
+    linked_path: Path = Path(temporary_root, "linked.json")
+    linked_path.hardlink_to(source_path)
+
+    return [source_path, linked_path]
+
+
+def _set_status(paths: Paths) -> Ints2:
+    for index, path in enumerate(paths):
+        path.chmod(0o640 + index * 0o4)
+        utime(path, ns=(index, index * 10**9))
+
+    return _get_status(paths)
+
+
+def _get_status(paths: Paths) -> Ints2:
+    return [[path.stat().st_mode, path.stat().st_mtime_ns] for path in paths]
+
+
+def _is_independent(path: Path) -> bool:
+    return path.stat().st_nlink == 1 and bool(path.stat().st_mode & S_IWUSR)
+
+
+def _get_log_path(temporary_root: Path) -> Path:
+    return Path(temporary_root, "history.jsonl")
+
+
+def _rename_logged(
+    source_path: Path,
+    destination_path: Path,
+    log: Path,
+) -> Path:
+    with HistoryLog(log) as history_log:
+        history_log.add_history(
+            "_0000",
+            {"source.path": source_path, "destination.path": destination_path},
+        )
+
+    return source_path.rename(destination_path)
+
+
+def _create_progress() -> Ints2:
+    return []
+
+
+def _compare_tree(temporary_root: Path, expected: Paths) -> None:
+    _difference_error(
+        sorted(walk_iterator(_get_tree_root(temporary_root))),
+        expected,
+    )
+
+
+def _inside_temporary_directory(function: PathFunc) -> None:
+    with TemporaryDirectory() as temporary_path:
+        function(Path(temporary_path))
+
+
+def test_restore() -> None:
+    """Test to restore files and directories removed by trash box."""
+
+    def individual_test(temporary_root: Path) -> None:
+        expected: Paths = _create_tree(temporary_root)
+        history_path: Path = _trash_tree(temporary_root, False)
+
+        _get_safe_restore(temporary_root).restore(history_path)
+        _compare_tree(temporary_root, expected)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_stream() -> None:
+    """Test to restore by history of JSON Lines format and threads."""
+
+    def individual_test(temporary_root: Path) -> None:
+        expected: Paths = _create_tree(temporary_root)
+        history_path: Path = _trash_tree(temporary_root, True)
+        progress = _create_progress()
+
+        def record_progress(done: int, total: int) -> None:
+            progress.append([done, total])
+
+        restored: Paths = _get_safe_restore(temporary_root).restore(
+            history_path,
+            parallel=2,
+            progress=record_progress,
+        )
+
+        _compare_tree(temporary_root, expected)
+        _difference_error(progress[-1], [len(restored)] * 2)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_skip() -> None:
+    """Test to skip entries which are already restored."""
+
+    def individual_test(temporary_root: Path) -> None:
+        expected: Paths = _create_tree(temporary_root)
+        history_path: Path = _trash_tree(temporary_root, False)
+        safe_restore: SafeRestore = _get_safe_restore(temporary_root)
+
+        safe_restore.restore(history_path)
+
+        _difference_error(safe_restore.restore(history_path), [])
+        _compare_tree(temporary_root, expected)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_nested() -> None:
+    """Test to restore directory and file inside it removed separately."""
+
+    def individual_test(temporary_root: Path) -> None:
+        expected: Paths = _create_tree(temporary_root)
+        tree_root: Path = _get_tree_root(temporary_root)
+        safe_trash: SafeTrash = _get_safe_trash(temporary_root, False)
+
+        safe_trash.trash(Path(tree_root, "dir001", "file.txt"))
+        safe_trash.trash(Path(tree_root, "dir001"))
+        safe_trash.get_history()
+
+        _get_safe_restore(temporary_root).restore(
+            _none_error(safe_trash.get_history_path()),
+            parallel=2,
+        )
+        _compare_tree(temporary_root, expected)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_serial() -> None:
+    """Test to restore file renamed several times in reverse order."""
+
+    def individual_test(temporary_root: Path) -> None:
+        source_path: Path = create_temporary_file(temporary_root)
+        safe_rename = SafeRename(working_root=_get_work_root(temporary_root))
+
+        safe_rename.rename(
+            safe_rename.rename(source_path, source_path.with_stem("middle")),
+            source_path.with_stem("last"),
+        )
+        safe_rename.get_history()
+
+        _difference_error(
+            _get_safe_restore(temporary_root).restore(
+                _none_error(safe_rename.get_history_path()),
+            ),
+            [source_path.with_stem("middle"), source_path],
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_deduplicate() -> None:
+    """Test to restore files which don't share contents with trash box."""
+
+    def individual_test(temporary_root: Path) -> None:
+        source_paths: Paths = _create_same(temporary_root)
+        expected: Ints2 = _set_status(source_paths)
+        safe_trash = SafeTrash(
+            working_root=_get_work_root(temporary_root),
+            deduplicate=True,
+        )
+
+        safe_trash.trash_at_once(source_paths)
+        safe_trash.get_history()
+
+        _get_safe_restore(temporary_root).restore(
+            _none_error(safe_trash.get_history_path()),
+            object_root=safe_trash.get_object_root(),
+        )
+        _difference_error(
+            [_is_independent(path) for path in source_paths],
+            [True] * len(source_paths),
+        )
+        _difference_error(_get_status(source_paths), expected)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_hard_link() -> None:
+    """Test to keep hard link which isn't related to deduplication."""
+
+    def individual_test(temporary_root: Path) -> None:
+        source_paths: Paths = _create_linked(temporary_root)
+        safe_trash: SafeTrash = _get_safe_trash(temporary_root, False)
+
+        safe_trash.trash_at_once(source_paths)
+        safe_trash.get_history()
+
+        _get_safe_restore(temporary_root).restore(
+            _none_error(safe_trash.get_history_path()),
+            object_root=safe_trash.get_object_root(),
+        )
+        _difference_error(
+            [path.stat().st_nlink for path in source_paths],
+            [2] * len(source_paths),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_append() -> None:
+    """Test to restore history appended with same key several times."""
+
+    def individual_test(temporary_root: Path) -> None:
+        log_path: Path = _get_log_path(temporary_root)
+        source_paths: Paths = [
+            create_temporary_file(temporary_root, file_name=name)
+            for name in ["first", "second"]
+        ]
+
+        for source_path in source_paths:
+            _rename_logged(
+                source_path,
+                source_path.with_stem(source_path.stem + "_moved"),
+                log_path,
+            )
+
+        _difference_error(
+            _get_safe_restore(temporary_root).restore(log_path, parallel=2),
+            list(reversed(source_paths)),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_progress() -> None:
+    """Test to count skipped entries as done for progress."""
+
+    def individual_test(temporary_root: Path) -> None:
+        log_path: Path = _get_log_path(temporary_root)
+        source_path: Path = create_temporary_file(temporary_root)
+        progress = _create_progress()
+
+        def record_progress(done: int, total: int) -> None:
+            progress.append([done, total])
+
+        _rename_logged(
+            _rename_logged(
+                source_path,
+                source_path.with_stem("middle"),
+                log_path,
+            ),
+            source_path.with_stem("last"),
+            log_path,
+        ).unlink()
+
+        _difference_error(
+            _get_safe_restore(temporary_root).restore(
+                log_path,
+                progress=record_progress,
+            ),
+            [],
+        )
+        _difference_error(progress[-1], [2, 2])
+
+    _inside_temporary_directory(individual_test)
@@ -3,12 +3,18 @@
 """Test module to remove file or directory and log history."""
 
 from collections.abc import Sized
+from contextlib import closing
+from os import utime
 from pathlib import Path
+from sqlite3 import connect
+from stat import S_IWUSR
 from tempfile import TemporaryDirectory
 
 from pyspartalib.context.custom.type_context import Type
 from pyspartalib.context.default.bool_context import BoolPair, Bools
+from pyspartalib.context.default.integer_context import Ints2
 from pyspartalib.context.default.string_context import Strs
+from pyspartalib.context.extension.entry_context import Entries
 from pyspartalib.context.extension.path_context import (
     PathFunc,
     PathPair,
@@ -17,11 +23,16 @@ from pyspartalib.context.extension.path_context import (
 )
 from pyspartalib.script.bool.same_value import bool_same_array
 from pyspartalib.script.directory.create_directory import create_directory
-from pyspartalib.script.path.iterate_directory import walk_iterator
+from pyspartalib.script.file.json.export_json import json_export
+from pyspartalib.script.path.iterate_directory import (
+    walk_entries,
+    walk_iterator,
+)
 from pyspartalib.script.path.modify.current.get_relative import (
     get_relative,
     is_relative,
 )
+from pyspartalib.script.path.safe.safe_object_status import get_status_path
 from pyspartalib.script.path.safe.safe_trash import SafeTrash
 from pyspartalib.script.path.status.check_exists import check_exists_pair
 from pyspartalib.script.path.temporary.create_temporary_file import (
@@ -331,3 +342,162 @@ def test_select() -> None:
         )
 
     _inside_temporary_directory(individual_test)
+
+
+def test_nested() -> None:
+    """Test to remove directory and file inside it at once."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root).parent
+        safe_trash: SafeTrash = _get_remove()
+
+        _single_test(
+            _finalize_array(
+                [tree_root, *_get_removal_array(tree_root)],
+                safe_trash,
+            ),
+            _convert_path_pair(temporary_root, safe_trash),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_parallel() -> None:
+    """Test to remove files and directories at once by multiple threads."""
+
+    def individual_test(temporary_root: Path) -> None:
+        create_temporary_tree(temporary_root, tree_deep=3)
+        remove_paths: Paths = _get_removal_array(temporary_root)
+        safe_trash: SafeTrash = _get_remove()
+
+        safe_trash.trash_at_once(
+            remove_paths,
+            relative_root=temporary_root,
+            parallel=2,
+        )
+
+        _multiple_test(
+            remove_paths,
+            _get_history(safe_trash),
+            _convert_path_pair(temporary_root, safe_trash),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def _get_remove_deduplicate(trash_root: Path) -> SafeTrash:
+    return SafeTrash(trash_root=trash_root, deduplicate=True)
+
+
+def _list_objects(safe_trash: SafeTrash) -> Entries:
+    return list(walk_entries(safe_trash.get_object_root(), depth=2))
+
+
+def _is_writable(path: Path) -> bool:
+    return bool(path.stat().st_mode & S_IWUSR)
+
+
+def _create_same(temporary_root: Path) -> Paths:
+    return [
+        json_export(Path(temporary_root, name + ".json"), "test")
+        for name in ["first", "second"]
+    ]
+
+
+def _set_status(paths: Paths) -> Ints2:
+    for index, path in enumerate(paths):
+        path.chmod(0o640 + index * 0o4)
+        utime(path, ns=(index, index * 10**9))
+
+    return [[path.stat().st_mode, path.stat().st_mtime_ns] for path in paths]
+
+
+def _get_status_query() -> str:
+    return "SELECT mode, update_time FROM links ORDER BY path"
+
+
+def _read_status(safe_trash: SafeTrash) -> Ints2:
+    with closing(
+        connect(get_status_path(safe_trash.get_object_root())),
+    ) as connection:
+        rows: list[tuple[int, int]] = connection.execute(
+            _get_status_query(),
+        ).fetchall()
+
+    return [list(row) for row in rows]
+
+
+def _get_relative_array(root: Path) -> Strs:
+    return sorted(
+        str(get_relative(path, root_path=root)) for path in walk_iterator(root)
+    )
+
+
+def test_deduplicate() -> None:
+    """Test to store same contents of files just once."""
+
+    def individual_test(temporary_root: Path) -> None:
+        remove_paths: Paths = _create_same(temporary_root)
+        safe_trash: SafeTrash = _get_remove_deduplicate(
+            _get_trash_root(temporary_root),
+        )
+
+        history: PathPair2 = _compare_size(
+            2,
+            _finalize_array(remove_paths, safe_trash),
+        )
+
+        objects: Entries = _list_objects(safe_trash)
+
+        _length_error(objects, 1)
+        _success_error(_is_writable(Path(objects[0].path)))
+        _length_error(
+            {
+                path_pair["destination.path"].stat().st_ino
+                for path_pair in history.values()
+            },
+            1,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_deduplicate_tree() -> None:
+    """Test to remove directory tree with storing contents just once."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = create_temporary_tree(
+            Path(temporary_root, "tree"),
+            tree_deep=3,
+        )
+        expected: Strs = _get_relative_array(tree_root)
+        safe_trash: SafeTrash = _get_remove_deduplicate(
+            _get_trash_root(temporary_root),
+        )
+
+        safe_trash.trash(tree_root)
+
+        _success_error(tree_root.exists())
+        _difference_error(
+            _get_relative_array(Path(safe_trash.get_trash_root(), "tree")),
+            expected,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_deduplicate_status() -> None:
+    """Test to record status of each file sharing same contents."""
+
+    def individual_test(temporary_root: Path) -> None:
+        remove_paths: Paths = _create_same(temporary_root)
+        expected: Ints2 = _set_status(remove_paths)
+        safe_trash: SafeTrash = _get_remove_deduplicate(
+            _get_trash_root(temporary_root),
+        )
+
+        safe_trash.trash_at_once(remove_paths)
+
+        _difference_error(_read_status(safe_trash), expected)
+
+    _inside_temporary_directory(individual_test)
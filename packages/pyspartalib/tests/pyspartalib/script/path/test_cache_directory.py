@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+
+"""Test module to get list of contents in the directory by persistent cache."""
+
+from contextlib import closing
+from os import utime
+from pathlib import Path
+from shutil import rmtree
+from sqlite3 import Connection, connect
+from tempfile import TemporaryDirectory
+
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.default.integer_context import Ints
+from pyspartalib.context.default.string_context import Strs
+from pyspartalib.context.extension.path_context import PathFunc, Paths
+from pyspartalib.context.extension.time_context import TimePair
+from pyspartalib.script.path.cache_directory import CacheDirectory
+from pyspartalib.script.path.iterate_directory import walk_iterator
+from pyspartalib.script.path.temporary.create_temporary_tree import (
+    create_temporary_tree,
+)
+from pyspartalib.script.time.path.get_timestamp import get_directory_latest
+
+
+def _difference_error(result: Type, expected: Type) -> None:
+    if result != expected:
+        raise ValueError
+
+
+def _get_tree_root(temporary_root: Path) -> Path:
+    return Path(temporary_root, "tree")
+
+
+def _get_cache_path(temporary_root: Path) -> Path:
+    return Path(temporary_root, "cache.sqlite")
+
+
+def _create_tree(temporary_root: Path) -> Path:
+    return create_temporary_tree(_get_tree_root(temporary_root), tree_deep=3)
+
+
+def _get_cache(temporary_root: Path) -> CacheDirectory:
+    return CacheDirectory(_get_cache_path(temporary_root))
+
+
+def _sorted_match(result: Paths, expected: Paths) -> None:
+    _difference_error(sorted(result), sorted(expected))
+
+
+def _walk_test(cache_directory: CacheDirectory, tree_root: Path) -> None:
+    _sorted_match(
+        list(cache_directory.walk(tree_root)),
+        list(walk_iterator(tree_root)),
+    )
+
+
+def _get_expected(tree_root: Path) -> TimePair:
+    return get_directory_latest(walk_iterator(tree_root))
+
+
+def _get_deepest(tree_root: Path) -> Path:
+    return max(walk_iterator(tree_root, file=False), key=_get_length)
+
+
+def _get_length(path: Path) -> int:
+    return len(path.parts)
+
+
+def _get_count_queries() -> Strs:
+    return [
+        "SELECT COUNT(*) FROM directories",
+        "SELECT COUNT(*) FROM entries",
+    ]
+
+
+def _count_table(connection: Connection, query: str) -> int:
+    row: tuple[int] = connection.execute(query).fetchone()
+    return row[0]
+
+
+def _count_rows(temporary_root: Path) -> Ints:
+    with closing(connect(_get_cache_path(temporary_root))) as connection:
+        return [
+            _count_table(connection, query) for query in _get_count_queries()
+        ]
+
+
+def _inside_temporary_directory(function: PathFunc) -> None:
+    with TemporaryDirectory() as temporary_path:
+        function(Path(temporary_path))
+
+
+def test_walk() -> None:
+    """Test to get contents of directory with empty and filled cache."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+        cache_directory: CacheDirectory = _get_cache(temporary_root)
+
+        for _ in range(2):
+            _walk_test(cache_directory, tree_root)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_filter() -> None:
+    """Test to get contents of directory by filter with cache."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+        cache_directory: CacheDirectory = _get_cache(temporary_root)
+
+        list(cache_directory.walk(tree_root))
+
+        _sorted_match(
+            list(
+                cache_directory.walk(
+                    tree_root,
+                    depth=2,
+                    directory=False,
+                    suffix="json",
+                ),
+            ),
+            list(
+                walk_iterator(
+                    tree_root,
+                    depth=2,
+                    directory=False,
+                    suffix="json",
+                ),
+            ),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_change() -> None:
+    """Test to search again only directory whose contents are changed."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+        cache_directory: CacheDirectory = _get_cache(temporary_root)
+        _walk_test(cache_directory, tree_root)
+
+        Path(_get_deepest(tree_root), "added.txt").touch()
+        _walk_test(cache_directory, tree_root)
+
+        Path(tree_root, "file.txt").unlink()
+        _walk_test(cache_directory, tree_root)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_latest() -> None:
+    """Test to get latest date time of contents by cache."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+        expected: TimePair = _get_expected(tree_root)
+
+        for _ in range(2):
+            _difference_error(
+                _get_cache(temporary_root).get_directory_latest(tree_root),
+                expected,
+            )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_cached() -> None:
+    """Test to reuse status of file while directory isn't changed."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+        cache_directory: CacheDirectory = _get_cache(temporary_root)
+        expected: TimePair = cache_directory.get_directory_latest(tree_root)
+
+        utime(Path(tree_root, "file.txt"), ns=(0, 0))
+
+        _difference_error(
+            cache_directory.get_directory_latest(tree_root),
+            expected,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_status() -> None:
+    """Test to get same date time as the function without cache."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+
+        utime(Path(tree_root, "file.txt"), ns=(0, 0))
+        Path(tree_root, "link.txt").symlink_to(Path(tree_root, "file.json"))
+
+        _difference_error(
+            _get_cache(temporary_root).get_directory_latest(tree_root),
+            _get_expected(tree_root),
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_removed() -> None:
+    """Test to delete cache of directory which is removed."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+        cache_directory: CacheDirectory = _get_cache(temporary_root)
+        list(cache_directory.walk(tree_root))
+
+        for child_root in walk_iterator(tree_root, depth=1, file=False):
+            rmtree(child_root)
+
+        list(cache_directory.walk(tree_root))
+
+        _difference_error(
+            _count_rows(temporary_root),
+            [1, len(list(walk_iterator(tree_root)))],
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_child() -> None:
+    """Test to get latest date time of directory whose child is changed."""
+
+    def individual_test(temporary_root: Path) -> None:
+        tree_root: Path = _create_tree(temporary_root)
+        cache_directory: CacheDirectory = _get_cache(temporary_root)
+        deepest_root: Path = _get_deepest(tree_root)
+
+        utime(deepest_root, ns=(0, 0))
+        cache_directory.get_directory_latest(tree_root)
+
+        Path(deepest_root, "added.txt").touch()
+
+        _difference_error(
+            cache_directory.get_directory_latest(tree_root),
+            _get_expected(tree_root),
+        )
+
+    _inside_temporary_directory(individual_test)
@@ -7,12 +7,17 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from pyspartalib.context.default.string_context import Strs, Strs2
+from pyspartalib.context.extension.entry_context import EntryGene
 from pyspartalib.context.extension.path_context import (
     PathFunc,
     PathGene,
     Paths,
 )
-from pyspartalib.script.path.iterate_directory import walk_iterator
+from pyspartalib.script.path.iterate_directory import (
+    walk_entries,
+    walk_iterator,
+    walk_parallel,
+)
 from pyspartalib.script.path.modify.current.get_relative import (
     get_relative_array,
 )
@@ -117,6 +122,26 @@ def _common_test(
     )
 
 
+def _to_path_generator(entry_generator: EntryGene) -> PathGene:
+    for entry in entry_generator:
+        if entry.is_dir() != Path(entry.path).is_dir():
+            raise ValueError
+
+        yield Path(entry.path)
+
+
+def _order_test(root_path: Path) -> None:
+    paths: Paths = list(walk_parallel(root_path, parallel=2))
+
+    for i, path in enumerate(paths[1:], start=1):
+        previous: Path = paths[i - 1]
+
+        if (path.parent == previous.parent) and (path.name < previous.name):
+            raise ValueError
+
+    _sorted_match(paths, list(walk_parallel(root_path, parallel=2)))
+
+
 def _inside_temporary_directory(function: PathFunc) -> None:
     with TemporaryDirectory() as temporary_path:
         function(create_temporary_tree(Path(temporary_path), tree_deep=3))
@@ -219,3 +244,270 @@ def test_filter() -> None:
         )
 
     _inside_temporary_directory(individual_test)
+
+
+def test_entry() -> None:
+    """Test to get contents of specific directory as DirEntry."""
+    expected: Strs2 = [
+        _get_first_empty(),
+        *_get_first_files(),
+        _get_second_root(),
+        _get_second_empty(),
+        *_get_second_files(),
+        _get_third_root(),
+        _get_third_empty(),
+        *_get_third_files(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            _to_path_generator(walk_entries(root_path)),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_entry_depth() -> None:
+    """Test to get contents of specific directory layer as DirEntry."""
+    expected: Strs2 = [
+        _get_second_empty(),
+        *_get_second_files(),
+        _get_third_root(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            _to_path_generator(walk_entries(root_path, depth=2)),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_entry_directory() -> None:
+    """Test to get directories of selected directory as DirEntry."""
+    expected: Strs2 = [
+        _get_first_empty(),
+        _get_second_root(),
+        _get_second_empty(),
+        _get_third_root(),
+        _get_third_empty(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            _to_path_generator(walk_entries(root_path, file=False)),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_entry_suffix() -> None:
+    """Test to get files of specific file format as DirEntry."""
+    expected: Strs2 = [
+        _get_first_json(),
+        _get_second_json(),
+        _get_third_json(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            _to_path_generator(
+                walk_entries(root_path, directory=False, suffix="json"),
+            ),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_parallel() -> None:
+    """Test to get contents of specific directory by multiple threads."""
+    expected: Strs2 = [
+        _get_first_empty(),
+        *_get_first_files(),
+        _get_second_root(),
+        _get_second_empty(),
+        *_get_second_files(),
+        _get_third_root(),
+        _get_third_empty(),
+        *_get_third_files(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            walk_parallel(root_path, parallel=2),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_parallel_depth() -> None:
+    """Test to get contents of specific layer by multiple threads."""
+    expected: Strs2 = [
+        _get_second_empty(),
+        *_get_second_files(),
+        _get_third_root(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            walk_parallel(root_path, depth=2, parallel=2, ordered=False),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_parallel_suffix() -> None:
+    """Test to get files of specific format by multiple threads."""
+    expected: Strs2 = [
+        _get_first_json(),
+        _get_second_json(),
+        _get_third_json(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            walk_parallel(
+                root_path,
+                directory=False,
+                suffix="json",
+                ordered=False,
+            ),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_order() -> None:
+    """Test to get contents in same order by multiple threads."""
+    _inside_temporary_directory(_order_test)
+
+
+def test_exclude() -> None:
+    """Test to get contents except contents matched with patterns."""
+    expected: Strs2 = [
+        _get_first_empty(),
+        _get_first_ini(),
+        _get_first_text(),
+        _get_second_root(),
+        _get_second_empty(),
+        _get_second_ini(),
+        _get_second_text(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            walk_iterator(root_path, exclude=["*.json", "dir001/dir002"]),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_exclude_directory() -> None:
+    """Test to get contents except directories matched with patterns."""
+    expected: Strs2 = _get_first_files()
+
+    def individual_test(root_path: Path) -> None:
+        _common_test(
+            expected,
+            walk_iterator(root_path, exclude=["*/"]),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_prune() -> None:
+    """Test to get contents without searching inside pruned directory."""
+    expected: Strs2 = [
+        _get_first_empty(),
+        *_get_first_files(),
+    ]
+
+    def individual_test(root_path: Path) -> None:
+        def prune(path: Path) -> bool:
+            return path.name.startswith("dir")
+
+        _common_test(
+            expected,
+            walk_iterator(root_path, prune=prune),
+            root_path,
+        )
+
+    _inside_temporary_directory(individual_test)
+
+
+def _get_link_root(root_path: Path) -> Path:
+    return Path(root_path, "link")
+
+
+def _create_link(root_path: Path, target: Path) -> Path:
+    link_root: Path = _get_link_root(root_path)
+    link_root.symlink_to(target, target_is_directory=True)
+
+    return link_root
+
+
+def _list_inside(root_path: Path, follow_symlinks: bool) -> Paths:
+    link_root: Path = _get_link_root(root_path)
+
+    return [
+        Path(entry.path).relative_to(link_root)
+        for entry in walk_entries(root_path, follow_symlinks=follow_symlinks)
+        if link_root in Path(entry.path).parents
+    ]
+
+
+def test_entry_missing() -> None:
+    """Test to ignore directory which doesn't exist."""
+
+    def individual_test(root_path: Path) -> None:
+        _length_error(list(walk_entries(Path(root_path, "missing"))), 0)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_entry_link() -> None:
+    """Test to search inside symbolic link to directory if it's selected."""
+
+    def individual_test(root_path: Path) -> None:
+        target_root: Path = Path(root_path, *_get_second_root())
+        _create_link(root_path, target_root)
+
+        _sorted_match(
+            _list_inside(root_path, True),
+            get_relative_array(
+                list(walk_iterator(target_root)),
+                root_path=target_root,
+            ),
+        )
+        _length_error(_list_inside(root_path, False), 0)
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_entry_loop() -> None:
+    """Test to search symbolic link to parent directory just once."""
+
+    def individual_test(root_path: Path) -> None:
+        count: int = len(list(walk_entries(root_path)))
+        _create_link(root_path, root_path)
+
+        _length_error(list(walk_entries(root_path)), (count + 1) * 2)
+
+    _inside_temporary_directory(individual_test)
@@ -5,6 +5,8 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from pyspartalib.context.custom.type_context import Type
+from pyspartalib.context.default.string_context import Strs
 from pyspartalib.context.extension.path_context import PathFunc
 from pyspartalib.script.directory.create_directory import create_directory
 from pyspartalib.script.path.modify.get_resource import get_resource
@@ -22,6 +24,13 @@ def _fail_error(status: bool) -> None:
         raise ValueError
 
 
+def _none_error(result: Type | None) -> Type:
+    if result is None:
+        raise ValueError
+
+    return result
+
+
 def _get_config_file() -> Path:
     return get_resource(local_path=Path("forward.json"))
 
@@ -38,6 +47,41 @@ def _upload_path_local(
     _fail_error(server.upload(source_path, destination=destination_path))
 
 
+def _difference_error(result: Type, expected: Type) -> None:
+    if result != expected:
+        raise ValueError
+
+
+def _create_link_tree(server: UploadServer) -> Path:
+    tree_root: Path = create_directory(
+        Path(server.get_date_time_root(), "link"),
+    )
+    target_root: Path = create_temporary_tree(Path(tree_root, "target"))
+    Path(tree_root, "linked").symlink_to(target_root, target_is_directory=True)
+
+    return tree_root
+
+
+def _list_server(server: UploadServer, source_path: Path) -> Strs:
+    sftp = _none_error(server.get_sftp())
+    remote_root: str = _none_error(sftp.getcwd())
+
+    return sorted(
+        sftp.listdir(
+            Path(remote_root, server.to_relative_path(source_path)).as_posix(),
+        ),
+    )
+
+
+def _link_test(server: UploadServer, tree_root: Path) -> None:
+    _upload_path(server, tree_root)
+
+    _difference_error(
+        _list_server(server, Path(tree_root, "linked")),
+        _list_server(server, Path(tree_root, "target")),
+    )
+
+
 def _is_connect(server: UploadServer) -> None:
     _fail_error(server.connect())
 
@@ -108,3 +152,11 @@ def test_place() -> None:
         )
 
     _inside_temporary_directory(individual_test)
+
+
+def test_link() -> None:
+    """Test to upload contents of symbolic link to directory."""
+    server: UploadServer = _get_server()
+    _is_connect(server)
+
+    _link_test(server, _create_link_tree(server))
@@ -7,7 +7,11 @@ from decimal import Decimal
 
 from pyspartalib.context.custom.type_context import Type
 from pyspartalib.context.default.integer_context import IntPair2
-from pyspartalib.script.time.epoch.from_timestamp import time_from_timestamp
+from pyspartalib.script.time.epoch.from_timestamp import (
+    get_time_zone,
+    time_from_nanosecond,
+    time_from_timestamp,
+)
 from pyspartalib.script.time.format.create_iso_date import (
     get_iso_epoch,
     get_iso_time,
@@ -19,6 +23,11 @@ def _difference_error(result: Type, expected: Type) -> None:
         raise ValueError
 
 
+def _not_identical_error(result: object, expected: object) -> None:
+    if result is not expected:
+        raise ValueError
+
+
 def _get_source() -> IntPair2:
     return {
         "year": {"year": 2023, "month": 4, "day": 15},
@@ -47,6 +56,10 @@ def _get_iso_epoch() -> Decimal:
     return get_iso_epoch(_get_source())
 
 
+def _get_iso_nanosecond() -> int:
+    return int(_get_iso_epoch() * 10**9) + 999  # Truncated.
+
+
 def test_utc() -> None:
     """Test to convert time data from epoch format to datetime object."""
     _difference_error(time_from_timestamp(_get_iso_epoch()), _get_iso_time())
@@ -58,3 +71,26 @@ def test_jst() -> None:
         time_from_timestamp(_get_iso_epoch(), jst=True),
         _get_iso_time_jst(),
     )
+
+
+def test_zone() -> None:
+    """Test to reuse time zone object created at first."""
+    for jst in [False, True]:
+        _not_identical_error(get_time_zone(jst=jst), get_time_zone(jst=jst))
+
+    _difference_error(
+        get_time_zone(jst=True) is get_time_zone(jst=False),
+        False,
+    )
+
+
+def test_nanosecond() -> None:
+    """Test to convert time data from nanosecond epoch to datetime object."""
+    for jst, expected in [
+        (False, _get_iso_time()),
+        (True, _get_iso_time_jst()),
+    ]:
+        _difference_error(
+            time_from_nanosecond(_get_iso_nanosecond(), jst=jst),
+            expected,
+        )
@@ -5,7 +5,12 @@
 from decimal import Decimal
 
 from pyspartalib.context.custom.type_context import Type
-from pyspartalib.script.time.epoch.get_time_stamp import get_initial_epoch
+from pyspartalib.context.default.integer_context import IntPair2
+from pyspartalib.script.time.epoch.get_time_stamp import (
+    get_initial_epoch,
+    get_valid_epoch,
+)
+from pyspartalib.script.time.format.create_iso_date import get_iso_epoch
 
 
 def _difference_error(result: Type, expected: Type) -> None:
@@ -13,6 +18,19 @@ def _difference_error(result: Type, expected: Type) -> None:
         raise ValueError
 
 
+def _get_source() -> IntPair2:
+    return {
+        "year": {"year": 1980, "month": 1, "day": 1},
+        "hour": {"hour": 0, "minute": 0, "second": 0, "micro": 0},
+        "zone": {"hour": 0, "minute": 0},
+    }
+
+
 def test_epoch() -> None:
     """Test to get UNIX epoch represent April 1, 2023."""
     _difference_error(get_initial_epoch(), Decimal("1680307200"))
+
+
+def test_valid() -> None:
+    """Test to get UNIX epoch represent January 1, 1980."""
+    _difference_error(get_valid_epoch(), get_iso_epoch(_get_source()))
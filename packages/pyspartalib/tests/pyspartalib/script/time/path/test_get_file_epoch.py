@@ -13,7 +13,10 @@ from pyspartalib.script.directory.create_directory import create_directory
 from pyspartalib.script.path.temporary.create_temporary_file import (
     create_temporary_file,
 )
-from pyspartalib.script.time.path.get_file_epoch import get_file_epoch
+from pyspartalib.script.time.path.get_file_epoch import (
+    get_file_epoch,
+    get_file_nanosecond,
+)
 from pyspartalib.script.time.path.set_timestamp import set_invalid
 
 
@@ -49,6 +52,17 @@ def _common_test(path: Path) -> None:
 def _invalid_test(path: Path) -> None:
     _length_error(_get_file_epoch_pair(path), 0)
 
+    for access in [False, True]:
+        _difference_error(get_file_nanosecond(path, access=access), None)
+
+
+def _nanosecond_test(path: Path) -> None:
+    _difference_error(get_file_nanosecond(path), path.stat().st_mtime_ns)
+    _difference_error(
+        get_file_nanosecond(path, access=True),
+        path.stat().st_atime_ns,
+    )
+
 
 def _set_invalid_date(path: Path) -> Path:
     return set_invalid(create_temporary_file(path))
@@ -84,3 +98,12 @@ def test_empty() -> None:
         _invalid_test(_set_invalid_date(temporary_root))
 
     _inside_temporary_directory(individual_test)
+
+
+def test_nanosecond() -> None:
+    """Test to get the date time about file as nanosecond epoch."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _nanosecond_test(create_temporary_file(temporary_root))
+
+    _inside_temporary_directory(individual_test)
@@ -8,8 +8,8 @@ from tempfile import TemporaryDirectory
 
 from pyspartalib.context.custom.type_context import Type
 from pyspartalib.context.default.integer_context import IntPair2
-from pyspartalib.context.extension.path_context import PathFunc
-from pyspartalib.context.extension.time_context import TimePair
+from pyspartalib.context.extension.path_context import PathFunc, Paths
+from pyspartalib.context.extension.time_context import LatestArray, TimePair
 from pyspartalib.script.directory.create_directory import create_directory
 from pyspartalib.script.path.iterate_directory import walk_iterator
 from pyspartalib.script.path.temporary.create_temporary_file import (
@@ -23,6 +23,7 @@ from pyspartalib.script.time.path.get_timestamp import (
     get_directory_latest,
     get_invalid_time,
     get_latest,
+    get_latest_array,
 )
 from pyspartalib.script.time.path.set_timestamp import set_invalid
 
@@ -69,6 +70,26 @@ def _get_directory_latest(path: Path) -> TimePair:
     return get_directory_latest(walk_iterator(path))
 
 
+def _get_each_latest(path: Path, jst: bool) -> TimePair:
+    return {
+        str(child): time
+        for child in walk_iterator(path)
+        if (time := get_latest(child, jst=jst)) is not None
+    }
+
+
+def _get_latest_array(path: Path) -> LatestArray:
+    return get_latest_array(walk_iterator(path))
+
+
+def _compare_array(latest_array: LatestArray, expected: Paths) -> None:
+    _difference_error(latest_array["paths"], expected)
+    _difference_error(
+        list(latest_array["times"]),
+        [path.stat().st_mtime_ns for path in expected],
+    )
+
+
 def _get_latest_pair(path: Path, jst: bool) -> TimePair:
     return {
         group: time
@@ -150,3 +171,35 @@ def test_tree() -> None:
         _length_error(_get_directory_latest(directory_path), 0)
 
     _inside_temporary_directory(individual_test)
+
+
+def test_each() -> None:
+    """Test to get same date time as getting it for each path."""
+
+    def individual_test(temporary_root: Path) -> None:
+        directory_path: Path = _get_temporary_tree(temporary_root)
+
+        for jst in [False, True]:
+            _difference_error(
+                get_directory_latest(walk_iterator(directory_path), jst=jst),
+                _get_each_latest(directory_path, jst),
+            )
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_array() -> None:
+    """Test to get latest date time of contents as nanosecond array."""
+
+    def individual_test(temporary_root: Path) -> None:
+        directory_path: Path = _get_temporary_tree(temporary_root)
+
+        _compare_array(
+            _get_latest_array(directory_path),
+            list(walk_iterator(directory_path)),
+        )
+
+        _set_invalid_directory(directory_path)
+        _compare_array(_get_latest_array(directory_path), [])
+
+    _inside_temporary_directory(individual_test)
@@ -12,15 +12,21 @@ from pyspartalib.context.default.integer_context import (
     IntPair2,
     IntPair3,
 )
-from pyspartalib.context.extension.path_context import PathFunc
-from pyspartalib.context.extension.time_context import TimePair
+from pyspartalib.context.extension.path_context import PathFunc, Paths
+from pyspartalib.context.extension.time_context import StampPair, TimePair
 from pyspartalib.script.directory.create_directory import create_directory
 from pyspartalib.script.path.temporary.create_temporary_file import (
     create_temporary_file,
 )
 from pyspartalib.script.time.format.create_iso_date import get_iso_time
+from pyspartalib.script.time.path.get_file_epoch import get_file_nanosecond
 from pyspartalib.script.time.path.get_timestamp import get_latest
-from pyspartalib.script.time.path.set_timestamp import set_invalid, set_latest
+from pyspartalib.script.time.path.set_timestamp import (
+    set_invalid,
+    set_latest,
+    set_latest_at_once,
+    set_nanosecond,
+)
 
 
 def _difference_error(result: Type, expected: Type) -> None:
@@ -117,6 +123,57 @@ def _compare_datetime(path: Path, times: IntPair3) -> None:
         _difference_error(_get_latest_pair(path)[group], expected)
 
 
+def _get_nanosecond() -> int:
+    return 1680307200123456789
+
+
+def _compare_nanosecond(path: Path) -> None:
+    for access in [False, True]:
+        set_nanosecond(path, _get_nanosecond() + access, access=access)
+
+    for access in [False, True]:
+        _difference_error(
+            get_file_nanosecond(path, access=access),
+            _get_nanosecond() + access,
+        )
+
+
+def _create_stamp_tree(temporary_root: Path) -> Paths:
+    directory_path: Path = create_directory(Path(temporary_root, "parent"))
+    return [directory_path, create_temporary_file(directory_path)]
+
+
+def _get_stamp_pair(paths: Paths, access: bool) -> StampPair:
+    return {
+        str(path): (
+            (_get_nanosecond() + index) if access else None,
+            _get_nanosecond() - index,
+        )
+        for index, path in enumerate(paths)
+    }
+
+
+def _compare_at_once(paths: Paths, access: bool, parallel: int) -> None:
+    accesses: list[int | None] = [
+        get_file_nanosecond(path, access=True) for path in paths
+    ]
+
+    _difference_error(
+        set_latest_at_once(_get_stamp_pair(paths, access), parallel=parallel),
+        paths,
+    )
+
+    for index, path in enumerate(paths):
+        _difference_error(
+            get_file_nanosecond(path),
+            _get_nanosecond() - index,
+        )
+        _difference_error(
+            get_file_nanosecond(path, access=True),
+            (_get_nanosecond() + index) if access else accesses[index],
+        )
+
+
 def _inside_temporary_directory(function: PathFunc) -> None:
     with TemporaryDirectory() as temporary_path:
         function(Path(temporary_path))
@@ -168,3 +225,25 @@ def test_invalid() -> None:
         )
 
     _inside_temporary_directory(individual_test)
+
+
+def test_nanosecond() -> None:
+    """Test to set latest date time of file by nanosecond epoch."""
+
+    def individual_test(temporary_root: Path) -> None:
+        _compare_nanosecond(create_temporary_file(temporary_root))
+
+    _inside_temporary_directory(individual_test)
+
+
+def test_at_once() -> None:
+    """Test to set latest date time of many paths at once."""
+
+    def individual_test(temporary_root: Path) -> None:
+        paths: Paths = _create_stamp_tree(temporary_root)
+
+        for access in [False, True]:
+            for parallel in [0, 2]:
+                _compare_at_once(paths, access, parallel)
+
+    _inside_temporary_directory(individual_test)
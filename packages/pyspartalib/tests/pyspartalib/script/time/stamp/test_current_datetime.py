@@ -47,3 +47,9 @@ def test_utc() -> None:
 def test_jst() -> None:
     """Test to compare current date time in JST time zone."""
     _compare_time(get_current_time(override=True, jst=True), _get_source_jst())
+
+
+def test_repeat() -> None:
+    """Test to compare current date time got repeatedly."""
+    for _ in range(2):
+        _compare_time(get_current_time(override=True), _get_source())